@@ -0,0 +1,63 @@
+"""Memory and build time of 50k chunks: pydantic DataChunk (+ model_dump) vs ChunkRecord."""
+from __future__ import annotations
+
+import gc
+import random
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from tik.core.chunks import ChunkTable
+from tik.core.models import DataChunk
+
+N_CHUNKS = 50_000
+FIELDS = ["name", "dob", "address", "occupation", "phone", "email", "employer", "alias"]
+
+
+def make_rows(seed: int = 0) -> List[dict]:
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(N_CHUNKS):
+        f = rnd.choice(FIELDS)
+        rows.append({
+            "id": f"c-{i:06d}", "document_id": f"doc_{i % 400:04d}", "source_id": f"s-{i % 12:03d}",
+            "field": f, "value": f"value {rnd.randrange(10**6)}", "offset_start": i * 10, "offset_end": i * 10 + 8,
+            "exclusive_group": f if rnd.random() < 0.5 else None, "confidence": rnd.random(),
+            "tags": ["auto"] if rnd.random() < 0.3 else [],
+        })
+    return rows
+
+
+def pydantic_path(rows: List[dict]) -> Tuple[list, list]:
+    chunks = [DataChunk.model_validate(r) for r in rows]
+    return chunks, [c.model_dump() for c in chunks]  # what FakeDocumentService used to keep
+
+
+def record_path(rows: List[dict]) -> ChunkTable:
+    return ChunkTable.from_dicts(rows)
+
+
+def measure(fn: Callable[[List[dict]], object], rows: List[dict]) -> Tuple[float, int]:
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = fn(rows)
+    elapsed = time.perf_counter() - t0
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, size
+
+
+def main() -> None:
+    rows = make_rows()
+    t_pyd, m_pyd = measure(pydantic_path, rows)
+    t_rec, m_rec = measure(record_path, rows)
+    print(f"{N_CHUNKS} chunks")
+    print(f"DataChunk + model_dump : {t_pyd * 1000:8.1f} ms  {m_pyd / 2**20:7.1f} MiB")
+    print(f"ChunkRecord table      : {t_rec * 1000:8.1f} ms  {m_rec / 2**20:7.1f} MiB")
+    print(f"ratio                  : {t_pyd / t_rec:8.1f}x time, {m_pyd / m_rec:.1f}x memory")
+
+
+if __name__ == "__main__":
+    main()
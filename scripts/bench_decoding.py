@@ -0,0 +1,56 @@
+"""Per-document chunk decoding: TypeAdapter per call + json.loads vs the decoding layer."""
+from __future__ import annotations
+
+import json
+import random
+import time
+from typing import Callable, List
+
+from pydantic import TypeAdapter
+
+from tik.core import decoding
+from tik.core.models import DataChunk
+
+N_CHUNKS = 2_000  # chunks per document
+ROUNDS = 20
+
+
+def make_payload(seed: int = 0) -> bytes:
+    rnd = random.Random(seed)
+    rows = [{
+        "id": f"c-{i:05d}", "document_id": "doc_0001", "source_id": f"s-{i % 5:03d}", "field": f"f{i % 30}",
+        "value": f"value {rnd.randrange(10**6)}", "offset_start": i * 12, "offset_end": i * 12 + 10,
+        "exclusive_group": None, "confidence": rnd.random(), "tags": [],
+    } for i in range(N_CHUNKS)]
+    return json.dumps(rows).encode("utf-8")
+
+
+def legacy(raw: bytes) -> List[DataChunk]:
+    return TypeAdapter(List[DataChunk]).validate_python(json.loads(raw.decode("utf-8")))
+
+
+def per_doc_ms(fn: Callable[[bytes], object], raw: bytes) -> float:
+    fn(raw)
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn(raw)
+    return (time.perf_counter() - t0) / ROUNDS * 1000
+
+
+def main() -> None:
+    raw = make_payload()
+    rows = [
+        ("legacy: TypeAdapter() + json.loads + validate_python", legacy),
+        ("decode_chunks (validate_json)", decoding.decode_chunks),
+        ("decode_chunk_table", decoding.decode_chunk_table),
+        ("decode_chunk_table (trusted)", lambda b: decoding.decode_chunk_table(b, trusted=True)),
+    ]
+    print(f"{N_CHUNKS} chunks per document, orjson={'yes' if decoding.HAS_ORJSON else 'no'}")
+    base = per_doc_ms(legacy, raw)
+    for label, fn in rows:
+        ms = per_doc_ms(fn, raw)
+        print(f"{label:54s} {ms:7.2f} ms/doc  {base / ms:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
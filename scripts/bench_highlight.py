@@ -0,0 +1,100 @@
+"""
+Headless timing harness for highlight.js: time to swap a document into the reader
+shell and wire up its chunks, per chunk count, for the delegated listeners vs the
+old per-span setup (three listeners on every span.chunk).
+
+    QT_QPA_PLATFORM=offscreen python scripts/bench_highlight.py [--counts 1000,10000,50000]
+
+Times are taken inside the page (performance.now) and include innerHTML parsing,
+then a forced layout; they don't include the IPC for the runJavaScript call.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from importlib import resources
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("QTWEBENGINE_CHROMIUM_FLAGS", "--disable-gpu")
+
+from PyQt6.QtCore import QEventLoop, QTimer, QUrl
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWebEngineCore import QWebEnginePage
+
+from tik.core.document_renderer import wrap_chunks_into_html
+from tik.core.models import DataChunk
+
+LEGACY_SETUP = """
+window.legacySetup = function () {
+  const spans = document.querySelectorAll("span.chunk");
+  console.log("[TIK] highlight.js attached — chunks:", spans.length);
+  spans.forEach(function (sp) {
+    if (!sp.hasAttribute("draggable")) sp.setAttribute("draggable", "true");
+    sp.addEventListener("dragstart", function (ev) { console.log("[TIK] dragstart payload:", sp.dataset.chunkId); });
+    sp.addEventListener("mouseenter", function () { sp.classList.add("hover"); });
+    sp.addEventListener("mouseleave", function () { sp.classList.remove("hover"); });
+  });
+};
+"""
+
+MEASURE = """
+(function (html, legacy) {
+  const t0 = performance.now();
+  if (legacy) { document.getElementById("container").innerHTML = html; window.legacySetup(); }
+  else window.tikSetDocument(html);
+  document.body.offsetHeight;  // force layout
+  return performance.now() - t0;
+})(%s, %s)
+"""
+
+
+def make_document(n_chunks: int) -> str:
+    words = [f"Subject{k} lives at {k} Evergreen Terrace." for k in range(n_chunks)]
+    html = "<p>" + " ".join(words) + "</p>"
+    chunks = [
+        DataChunk(id=f"c{k}", document_id="d", source_id="s", field="name", value=f"Subject{k}",
+                  offset_start=0, offset_end=0)
+        for k in range(n_chunks)
+    ]
+    return wrap_chunks_into_html(html, chunks)
+
+
+def run_js(page: QWebEnginePage, script: str):
+    loop = QEventLoop()
+    out = []
+    page.runJavaScript(script, 0, lambda r: (out.append(r), loop.quit()))
+    QTimer.singleShot(120_000, loop.quit)
+    loop.exec()
+    return out[0] if out else None
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--counts", default="1000,5000,20000,50000")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    app = QApplication(sys.argv)
+    page = QWebEnginePage()
+    loop = QEventLoop()
+    page.loadFinished.connect(lambda _ok: loop.quit())
+    page.load(QUrl.fromLocalFile(str(resources.files("tik.ui.web").joinpath("base.html"))))
+    loop.exec()
+    run_js(page, LEGACY_SETUP)
+
+    print(f"{'chunks':>8} {'delegated ms':>13} {'per-span ms':>12}")
+    for n in (int(c) for c in args.counts.split(",")):
+        html = json.dumps(make_document(n))
+        best = {}
+        for legacy in (False, True):
+            times = [run_js(page, MEASURE % (html, "true" if legacy else "false")) for _ in range(args.repeat)]
+            best[legacy] = min(t for t in times if t is not None)
+        print(f"{n:>8} {best[False]:>13.1f} {best[True]:>12.1f}")
+    app.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
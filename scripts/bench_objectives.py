@@ -0,0 +1,76 @@
+"""Recursive objective evaluation on every accept vs the compiled, field-indexed evaluator."""
+from __future__ import annotations
+
+import random
+import time
+from typing import List
+
+from tik.core.models import AcceptedChunk, ObjectiveExpr, ObjectivePredicate, Objective, Person
+from tik.core.objectives import ObjectiveIndex
+
+N_FIELDS = 40
+N_OBJECTIVES = 500
+N_ACCEPTS = 2000
+
+
+def legacy_eval_expr(expr: ObjectiveExpr, person: Person) -> bool:
+    if expr.kind == "LEAF" and expr.predicate:
+        pred = expr.predicate
+        if pred.op == "exists":
+            _, field = pred.path.split(".", 1) if "." in pred.path else ("record", pred.path)
+            return field in person.accepted and bool(person.accepted[field].value)
+        return False
+    if expr.kind == "AND":
+        return all(legacy_eval_expr(c, person) for c in (expr.children or []))
+    if expr.kind == "OR":
+        return any(legacy_eval_expr(c, person) for c in (expr.children or []))
+    return False
+
+
+def random_expr(rnd: random.Random, depth: int = 0) -> ObjectiveExpr:
+    if depth >= 2 or rnd.random() < 0.3:
+        field = f"f{rnd.randrange(N_FIELDS)}"
+        return ObjectiveExpr(kind="LEAF", predicate=ObjectivePredicate(op="exists", path=f"record.{field}"))
+    kids = [random_expr(rnd, depth + 1) for _ in range(rnd.randint(2, 4))]
+    return ObjectiveExpr(kind=rnd.choice(["AND", "OR"]), children=kids)
+
+
+def make_objectives(seed: int) -> List[Objective]:
+    rnd = random.Random(seed)
+    return [Objective(id=f"o{i}", title=f"o{i}", expr=random_expr(rnd)) for i in range(N_OBJECTIVES)]
+
+
+def accepts(seed: int):
+    rnd = random.Random(seed)
+    for i in range(N_ACCEPTS):
+        field = f"f{rnd.randrange(N_FIELDS)}"
+        yield field, AcceptedChunk(chunk_id=str(i), field=field, value="v" if i % 3 else "", source_id="s", document_id="d")
+
+
+def main() -> None:
+    legacy_objs, new_objs = make_objectives(1), make_objectives(1)
+
+    person = Person(id="p")
+    t0 = time.perf_counter()
+    for field, ac in accepts(2):
+        person.accepted[field] = ac
+        for obj in legacy_objs:
+            obj.satisfied = legacy_eval_expr(obj.expr, person)
+    legacy = time.perf_counter() - t0
+
+    person = Person(id="p")
+    t0 = time.perf_counter()
+    index = ObjectiveIndex(new_objs)
+    for field, ac in accepts(2):
+        person.accepted[field] = ac
+        index.evaluate(person, {field})
+    incremental = time.perf_counter() - t0
+
+    assert [o.satisfied for o in legacy_objs] == [o.satisfied for o in new_objs]
+    print(f"{N_OBJECTIVES} objectives, {N_FIELDS} fields, {N_ACCEPTS} accepts")
+    print(f"legacy full re-eval : {legacy * 1000:8.1f} ms")
+    print(f"compiled + index    : {incremental * 1000:8.1f} ms  ({legacy / incremental:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Compare the old renderer internals with the current ones:
+- char-by-char sanitizer vs tokenizer-based `_safe_html` on a ~5 MB document
+- O(n²) `_ranges` vs the interval-indexed resolver on 20k chunks, a quarter of them stale
+"""
+from __future__ import annotations
+
+import io
+import time
+from html import escape
+
+from tik.core.document_renderer import _ranges, _safe_html, iter_safe_html
+from tik.core.models import DataChunk
+
+
+def legacy_safe_html(html: str) -> str:
+    allowed = {"b", "i", "em", "strong", "u", "p", "br", "ul", "ol", "li", "span"}
+    out: list[str] = []
+    i = 0
+    while i < len(html):
+        ch = html[i]
+        if ch == "<":
+            j = html.find(">", i + 1)
+            if j == -1:
+                out.append(escape(html[i:]))
+                break
+            tag = html[i + 1 : j].strip().strip("/")
+            tag_name = tag.split()[0].lower() if tag else ""
+            out.append(html[i:j+1] if tag_name in allowed else escape(html[i:j+1]))
+            i = j + 1
+        else:
+            out.append(escape(ch)); i += 1
+    return "".join(out)
+
+
+def legacy_ranges(safe, chunks):
+    res = []
+    def overlap(a,b,c,d): return max(a,c) < min(b,d)
+    for c in chunks:
+        st, en = c.offset_start, c.offset_end
+        ok = 0 <= st < en <= len(safe) and c.value in safe[st:en]
+        if not ok:
+            idx = safe.find(c.value)
+            if idx != -1:
+                st, en = idx, idx + len(c.value)
+            else:
+                continue
+        if any(overlap(st,en,x,y) for x,y,_ in res): continue
+        res.append((st,en,c))
+    return sorted(res, key=lambda t:t[0])
+
+
+def make_chunks(safe: str, n: int = 20_000) -> list[DataChunk]:
+    chunks = []
+    step = len(safe) // n
+    for k in range(n):
+        st = k * step
+        value = safe[st : st + 8]
+        if k % 4 == 0:
+            st = 0  # stale offsets -> relocation
+            value = f"Subject-{k}"
+        chunks.append(DataChunk(
+            id=f"c{k}", document_id="d", source_id="s", field="name",
+            value=value, offset_start=st, offset_end=st + 8,
+        ))
+    return chunks
+
+
+def make_document(size: int = 5 * 1024 * 1024) -> str:
+    para = (
+        "<p>Citizen registry: Subject identified as <b>Jane Doe</b>, born on <i>1990-01-23</i>. "
+        "Residence: <span>42 Evergreen Terrace</span> &amp; notes <script>x()</script>.</p>\n"
+    )
+    return para * (size // len(para) + 1)
+
+
+def timed(fn, *args) -> float:
+    t0 = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    html = make_document()
+    assert _safe_html(html) == legacy_safe_html(html)
+    old = timed(legacy_safe_html, html)
+    new = timed(_safe_html, html)
+    stream = timed(lambda: "".join(iter_safe_html(io.StringIO(html))))
+    print(f"document: {len(html) / 1e6:.1f} MB")
+    print(f"legacy   : {old * 1000:8.1f} ms")
+    print(f"tokenizer: {new * 1000:8.1f} ms  ({old / new:.1f}x)")
+    print(f"streaming: {stream * 1000:8.1f} ms  ({old / stream:.1f}x)")
+
+    safe = _safe_html(html[: 1024 * 1024])
+    chunks = make_chunks(safe)
+    old = timed(legacy_ranges, safe, chunks)
+    new = timed(_ranges, safe, chunks)
+    print(f"ranges ({len(chunks)} chunks): legacy {old * 1000:.1f} ms, indexed {new * 1000:.1f} ms ({old / new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Query latency of the FTS5 search index over a synthetic 100k-document corpus; exits 1 past TARGET_MS."""
+from __future__ import annotations
+
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from tik.core.chunks import ChunkRecord
+from tik.core.search import SearchIndex
+
+N_DOCS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+WORDS = [f"w{i}" for i in range(20_000)]
+NAMES = ["Jane Doe", "John Roe", "Ana Lima", "Minh Tran", "Olga Petrova", "Kwame Mensah"]
+QUERIES = ["jane", "minh tran", "w123", "olga petr", "w19999 w5", "evergreen"]
+TARGET_MS = 50.0  # median per query
+
+
+def main() -> int:
+    slow = []
+    rnd = random.Random(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        ix = SearchIndex(Path(tmp) / "search.db")
+        t0 = time.perf_counter()
+        def docs():
+            for d in range(N_DOCS):
+                name = rnd.choice(NAMES)
+                body = " ".join(rnd.choice(WORDS) for _ in range(60))
+                html = f"<p>{body} subject <b>{name}</b> lives on Evergreen Terrace.</p>"
+                st = html.index(name)
+                yield f"doc{d}", html, [ChunkRecord(f"c{d}", f"doc{d}", "s", "name", name, st, st + len(name))], "1"
+        ix.add_documents(docs())
+        print(f"indexed {N_DOCS} docs in {time.perf_counter() - t0:.1f}s")
+        for q in QUERIES:
+            times = []
+            for _ in range(20):
+                t = time.perf_counter()
+                hits = ix.search(q, limit=20)
+                times.append((time.perf_counter() - t) * 1000)
+            median = statistics.median(times)
+            print(f"{q!r:14} {len(hits):3d} hits  median {median:6.2f} ms  max {max(times):6.2f} ms")
+            if median > TARGET_MS:
+                slow.append(q)
+        ix.close()
+    if slow:
+        print(f"over the {TARGET_MS:.0f} ms target: {', '.join(map(repr, slow))}")
+    return 1 if slow else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+"""Convert tik/data/chunks/*.json into a binary chunk corpus (see tik/core/corpus.py).
+
+    python scripts/convert_chunks.py tik/data/chunks tik/data/chunks.tikc
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from tik.core.corpus import ChunkCorpus, convert_json_dir
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("chunks_dir", type=Path, help="directory with one <document id>.json per document")
+    ap.add_argument("out", type=Path, help="corpus file to write (one per source or case)")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    n = convert_json_dir(args.chunks_dir, args.out)
+    with ChunkCorpus(args.out) as corpus:
+        docs = len(corpus.documents())
+    print(f"wrote {n} chunks from {docs} documents to {args.out} "
+          f"({args.out.stat().st_size / 1024:.1f} KiB, {time.perf_counter() - t0:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "tik" / "data"
+
+
+class StandInApi:
+    """In-process stand-in for the TIK HTTP API, served through httpx.MockTransport."""
+
+    def __init__(self, data_dir: Path = DATA_DIR):
+        self.data_dir = data_dir
+        self.requests: list[httpx.Request] = []
+        self.events: list[dict] = []
+
+    def _etagged(self, request: httpx.Request, body: bytes, content_type: str) -> httpx.Response:
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        headers = {"ETag": etag, "Content-Type": content_type}
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        return httpx.Response(200, content=body, headers=headers)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        parts = request.url.path.strip("/").split("/")
+        if parts == ["case"]:
+            return self._etagged(request, (self.data_dir / "seed_case.json").read_bytes(), "application/json")
+        if len(parts) == 3 and parts[0] == "documents":
+            doc_id, what = parts[1], parts[2]
+            if what == "html":
+                return self._etagged(request, (self.data_dir / "docs" / f"{doc_id}.html").read_bytes(), "text/html")
+            if what == "chunks":
+                return self._etagged(request, (self.data_dir / "chunks" / f"{doc_id}.json").read_bytes(), "application/json")
+        if parts == ["objectives", "evaluate"]:
+            payload = json.loads(request.content)
+            seed = json.loads((self.data_dir / "seed_case.json").read_text(encoding="utf-8"))
+            accepted = payload["accepted"]
+            out = []
+            for obj in seed["objectives"]:
+                fields = [c["predicate"]["path"].split(".", 1)[-1] for c in obj["expr"]["children"]]
+                out.append({"id": obj["id"], "satisfied": all(accepted.get(f, {}).get("value") for f in fields)})
+            return httpx.Response(200, json={"objectives": out})
+        if parts == ["events", "stream"]:
+            body = "".join(f"event: advisor\ndata: {json.dumps(e)}\n\n" for e in self.events)
+            self.events = []
+            return httpx.Response(200, content=body.encode("utf-8"), headers={"Content-Type": "text/event-stream"})
+        if parts == ["events", "next"]:
+            if not self.events:
+                return httpx.Response(204)
+            return httpx.Response(200, json=self.events.pop(0))
+        return httpx.Response(404)
+
+    async def ahandle(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        return self.handle(request)
+
+
+@pytest.fixture
+def standin() -> StandInApi:
+    return StandInApi()
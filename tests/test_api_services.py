@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+
+import httpx
+
+from tik.core.models import AcceptedChunk
+from tik.core.services.api import (
+    ApiCaseService, ApiChunkService, ApiDocumentService, ApiEventService, ApiEventStream, ApiObjectiveService, ApiSession,
+)
+
+
+def _session(standin) -> ApiSession:
+    return ApiSession("http://tik.test", transport=httpx.MockTransport(standin.handle))
+
+
+def test_services_share_one_client(standin):
+    session = _session(standin)
+    services = [cls("http://tik.test", session) for cls in
+                (ApiCaseService, ApiDocumentService, ApiChunkService, ApiObjectiveService, ApiEventService)]
+    assert len({id(s.session.client) for s in services}) == 1
+    assert ApiSession.shared("http://a.test/") is ApiSession.shared("http://a.test")
+
+
+def test_documents_revalidate_with_etag(standin):
+    session = _session(standin)
+    docs = ApiDocumentService("http://tik.test", session)
+    html, chunks = docs.load_document_html_and_chunks("doc_0001")
+    assert 'class="chunk"' in html and chunks[0]["id"] == "c-001"
+    assert docs.load_document_html_and_chunks("doc_0001") == (html, chunks)
+    assert session.not_modified == 2
+    assert standin.requests[-1].headers["If-None-Match"]
+    assert "gzip" in standin.requests[0].headers["Accept-Encoding"]
+    assert [c.id for c in ApiChunkService("http://tik.test", session).list_chunks_for_document("doc_0001")][:1] == ["c-001"]
+
+
+def test_response_caches_are_bounded(standin):
+    session = ApiSession("http://tik.test", transport=httpx.MockTransport(standin.handle), max_cached=1)
+    docs = ApiDocumentService("http://tik.test", session, max_rendered=1)
+    docs._rendered["older"] = ("<p/>", [])
+    first = docs.load_document_html_and_chunks("doc_0001")
+    assert len(session._etags) == 1 and list(docs._rendered) == ["doc_0001"]
+    assert docs.load_document_html_and_chunks("doc_0001") == first  # evicted bodies are refetched
+    assert session.not_modified == 0
+
+
+def test_case_objectives_and_events(standin):
+    session = _session(standin)
+    case = ApiCaseService("http://tik.test", session).load_default_case()
+    person = case.people[0]
+    objsvc = ApiObjectiveService("http://tik.test", session)
+    assert objsvc.evaluate(case, person) is False
+    for field, value in (("name", "Jane Doe"), ("dob", "1990-01-23")):
+        person.accepted[field] = AcceptedChunk(chunk_id=field, field=field, value=value, source_id="s", document_id="d")
+    assert objsvc.evaluate(case, person, {"dob"}) is True
+    assert case._objectives[0].satisfied
+
+    events = ApiEventService("http://tik.test", session)
+    assert events.poll() is None
+    standin.events.append({"id": "1", "text": "hello", "level": "warn"})
+    assert events.poll().text == "hello"
+
+
+def test_event_stream_bounded_buffer(standin):
+    standin.events = [{"id": str(i), "text": f"e{i}"} for i in range(5)]
+    stream = ApiEventStream("http://tik.test", _session(standin), max_buffer=3, reconnect_min=0.05)
+    woke = threading.Event()
+    stream.set_listener(woke.set)
+    stream.start()
+    try:
+        assert woke.wait(5)
+        deadline = time.monotonic() + 5
+        while stream.dropped < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [e.text for e in stream.poll_many(10)] == ["e2", "e3", "e4"]
+        assert stream.poll() is None
+    finally:
+        stream.stop(5)
+
+
+def test_event_stream_stays_open_when_idle_and_stops_promptly():
+    srv = socket.socket()
+    srv.bind(("127.0.0.1", 0))
+    srv.listen()
+
+    def serve():
+        conn, _ = srv.accept()
+        conn.recv(4096)
+        body = b'data: {"id": "1", "text": "hi"}\n\n'
+        conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nTransfer-Encoding: chunked\r\n\r\n"
+                     + b"%x\r\n" % len(body) + body + b"\r\n")
+        time.sleep(10)  # then nothing: longer than the session read timeout
+        conn.close()
+
+    threading.Thread(target=serve, daemon=True).start()
+    url = f"http://127.0.0.1:{srv.getsockname()[1]}"
+    stream = ApiEventStream(url, ApiSession(url, timeout=0.2))
+    stream.start()
+    deadline = time.monotonic() + 5
+    while stream.poll_many() == [] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.5)
+    assert stream._thread.is_alive() and stream._response is not None  # still the first connection
+    t0 = time.monotonic()
+    stream.stop(5)
+    assert not stream._thread.is_alive() and time.monotonic() - t0 < 2
+    srv.close()
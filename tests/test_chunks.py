@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tik.core.chunks import ChunkRecord, ChunkTable
+from tik.core.document_renderer import wrap_chunks_into_html
+from tik.core.models import DataChunk
+
+DATA = Path(__file__).resolve().parents[1] / "tik" / "data"
+
+
+def test_records_match_models_and_render_the_same():
+    raw = json.loads((DATA / "chunks" / "doc_0001.json").read_text(encoding="utf-8"))
+    html = (DATA / "docs" / "doc_0001.html").read_text(encoding="utf-8")
+    table = ChunkTable.from_dicts(raw)
+    models = [DataChunk.model_validate(r) for r in raw]
+    assert wrap_chunks_into_html(html, table) == wrap_chunks_into_html(html, models)
+    assert [r.to_model() for r in table] == models
+    rec = table[0]
+    assert rec["field"] == rec.field and rec.get("nope", 1) == 1 and rec == rec.to_dict()
+    assert table.by_field(rec.field)[0] is rec
+
+
+def test_records_intern_shared_strings_and_reject_incomplete_rows():
+    a = ChunkRecord.from_dict({"id": "a", "document_id": "d", "source_id": "s" * 3, "field": "na" + "me",
+                               "value": "x", "offset_start": 0, "offset_end": 1})
+    b = ChunkRecord.from_dict({"id": "b", "document_id": "d", "source_id": "".join(["s"] * 3), "field": "".join("name"),
+                               "value": "y", "offset_start": "2", "offset_end": 3})
+    assert a.field is b.field and a.source_id is b.source_id and b.offset_start == 2
+    assert not hasattr(a, "__dict__")
+    with pytest.raises(ValueError):
+        ChunkRecord.from_dict({"id": "c", "field": "name"})
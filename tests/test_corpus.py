@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from tik.core.chunks import ChunkRecord
+from tik.core.corpus import ChunkCorpus, CorpusError, convert_json_dir, write_corpus
+from tik.core.decoding import read_chunks
+from tik.core.render_cache import RenderCache
+from tik.core.services.corpus import CorpusChunkService
+from tik.core.services.fake import FakeDocumentService
+
+DATA = Path(__file__).resolve().parents[1] / "tik" / "data"
+
+
+def test_converted_corpus_matches_json_layout(tmp_path):
+    out = tmp_path / "case.tikc"
+    assert convert_json_dir(DATA / "chunks", out) == len(read_chunks(DATA / "chunks" / "doc_0001.json"))
+    svc = CorpusChunkService(out)
+    assert svc.list_chunks_for_document("doc_0001") == read_chunks(DATA / "chunks" / "doc_0001.json")
+    assert svc.list_chunks_for_document("missing") == []
+
+    plain = FakeDocumentService(DATA, cache=RenderCache()).load_document_html_and_chunks("doc_0001")
+    mapped = FakeDocumentService(DATA, cache=RenderCache(), corpus=svc.corpus).load_document_html_and_chunks("doc_0001")
+    assert mapped[0] == plain[0]
+    svc.close()
+
+
+def test_range_reads_and_bad_files(tmp_path):
+    rnd = random.Random(3)
+    docs = {
+        f"d{d}": [ChunkRecord(f"d{d}c{i}", f"d{d}", "s", "f", "v", o, o + 3, tags=["a", "b"] if i % 2 else ())
+                  for i, o in enumerate(rnd.sample(range(10_000), 300))]
+        for d in range(5)
+    }
+    path = tmp_path / "c.tikc"
+    write_corpus(path, docs)
+    with ChunkCorpus(path) as corpus:
+        assert corpus.count("d2") == 300
+        window = corpus.chunks_in_range("d2", 2_000, 4_000)
+        want = sorted(c.id for c in docs["d2"] if 2_000 <= c.offset_start < 4_000)
+        assert sorted(c.id for c in window) == want
+        assert all(c.tags in ((), ("a", "b")) for c in window)
+
+    (tmp_path / "bad.tikc").write_bytes(b"nope" * 16)
+    with pytest.raises(CorpusError):
+        ChunkCorpus(tmp_path / "bad.tikc")
+
+
+def test_corpus_keeps_source_order_and_follows_rewrites(tmp_path):
+    html = (DATA / "docs" / "doc_0001.html").read_text(encoding="utf-8")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "doc_0001.html").write_text(html, encoding="utf-8")
+    start = html.index("Jane")
+    # overlapping chunks listed against offset order: the first listed one wins the overlap
+    chunks = [ChunkRecord("late", "doc_0001", "s", "name", "Jane Doe", start + 2, start + 8),
+              ChunkRecord("early", "doc_0001", "s", "name", "Jane", start, start + 4)]
+    path = tmp_path / "case.tikc"
+    write_corpus(path, {"doc_0001": chunks})
+    corpus = ChunkCorpus(path)
+    assert [c.id for c in corpus.chunks("doc_0001")] == ["late", "early"]
+    assert [c.id for c in corpus.chunks_in_range("doc_0001", 0, len(html))] == ["late", "early"]
+
+    svc = FakeDocumentService(tmp_path, cache=RenderCache(), corpus=corpus)
+    first, _ = svc.load_document_html_and_chunks("doc_0001")
+    assert 'data-chunk-id="late"' in first and 'data-chunk-id="early"' not in first
+
+    # rewritten while mapped: the service reopens it instead of serving the old mapping
+    write_corpus(path, {"doc_0001": chunks[1:]})
+    second, records = svc.load_document_html_and_chunks("doc_0001")
+    assert [c.id for c in records] == ["early"] and 'data-chunk-id="late"' not in second
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from tik.core import decoding
+from tik.core.chunks import ChunkTable
+
+DATA = Path(__file__).resolve().parents[1] / "tik" / "data"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_validated_and_trusted_decoding_agree(monkeypatch, use_orjson):
+    if use_orjson and not decoding.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(decoding, "HAS_ORJSON", use_orjson)
+    raw = (DATA / "chunks" / "doc_0001.json").read_bytes()
+    checked = decoding.decode_chunks(raw)
+    assert decoding.decode_chunk_table(raw, trusted=True).to_models() == checked
+    assert isinstance(decoding.decode_chunk_table(raw), ChunkTable)
+    case = decoding.decode_case((DATA / "seed_case.json").read_bytes())
+    assert case.people and isinstance(case._objectives, list)
+
+
+def test_untrusted_input_is_rejected():
+    with pytest.raises(ValidationError):
+        decoding.decode_chunks(b'[{"id": "x"}]')
+    with pytest.raises(ValueError):
+        decoding.decode_chunk_table(b'[{"id": "x"}]')
+    row = {"id": "c", "document_id": "d", "source_id": "s", "field": "f", "value": "v",
+           "offset_start": 0, "offset_end": 2, "extra": "ignored"}
+    for trusted in (False, True):
+        assert decoding.decode_chunk_table(json.dumps([row]), trusted)[0].id == "c"
+    for bad in ({"offset_start": 1.5}, {"value": 7}):
+        with pytest.raises(ValidationError):  # the checks pydantic did before records replaced it
+            decoding.decode_chunk_table(json.dumps([{**row, **bad}]))
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import io
+import random
+import re
+from html import escape
+
+from tik.core.document_renderer import (
+    _MAX_TAG, _first_occurrences, _ranges, _safe_html, _sanitize_block, iter_safe_html, render_windows,
+    wrap_chunks_into_html,
+)
+from tik.core.models import DataChunk
+
+
+def _reference_safe_html(html: str) -> str:
+    """The original char-by-char sanitizer, kept as the oracle for the differential tests."""
+    allowed = {"b", "i", "em", "strong", "u", "p", "br", "ul", "ol", "li", "span"}
+    out: list[str] = []
+    i = 0
+    while i < len(html):
+        ch = html[i]
+        if ch == "<":
+            j = html.find(">", i + 1)
+            if j == -1:
+                out.append(escape(html[i:]))
+                break
+            tag = html[i + 1 : j].strip().strip("/")
+            tag_name = tag.split()[0].lower() if tag else ""
+            out.append(html[i:j+1] if tag_name in allowed else escape(html[i:j+1]))
+            i = j + 1
+        else:
+            out.append(escape(ch)); i += 1
+    return "".join(out)
+
+
+CORPUS = [
+    "",
+    "plain text & more",
+    "<p>Citizen registry: <b>Jane Doe</b>, born on <i>1990-01-23</i>.</p>",
+    '<span class="x">ok</span><script>alert("x")</script>',
+    "<BR/><Br /><  b  >x</ b ></STRONG>",
+    "a < b > c",
+    "unterminated <span class='x' and no close",
+    "<<b>>",
+    "<>",
+    "</>",
+    "<//b//>",
+    "<b/x>",
+    "<img src=x onerror='1'>",
+    "it's \"quoted\" & <em>emph</em>",
+    "<p\n>multi\nline</p\n>",
+    "< b>nbsp</b>",
+    "Ünïcödé <i>ok</i> 漢字",
+]
+
+
+def _fuzz_corpus(n: int = 400) -> list[str]:
+    rnd = random.Random(1234)
+    atoms = ["<", ">", "/", " ", "b", "span", "p", "script", "&", '"', "'", "x", "\n", "li", "STRONG", "<br/>", "</p>"]
+    return ["".join(rnd.choice(atoms) for _ in range(rnd.randint(0, 40))) for _ in range(n)]
+
+
+def _cases():
+    for html in CORPUS + _fuzz_corpus():
+        try:
+            expected = _reference_safe_html(html)
+        except IndexError:
+            # the old engine crashed on tags like "</ />"; no output to compare against
+            continue
+        yield html, expected
+
+
+def test_safe_html_matches_reference():
+    for html, expected in _cases():
+        assert _safe_html(html) == expected, html
+
+
+def test_streaming_matches_reference():
+    for html, expected in _cases():
+        for size in (1, 2, 3, 7, 64):
+            got = "".join(iter_safe_html(io.StringIO(html), chunk_size=size))
+            assert got == expected, (html, size)
+
+
+def test_streaming_caps_unterminated_allowed_tags():
+    html = '<p>a<span title="' + "x" * 5000 + '">b</span></p>'
+    pieces = list(iter_safe_html(io.StringIO(html), chunk_size=64, max_tag=256))
+    assert max(map(len, pieces)) < 1024
+    assert "".join(pieces) == "<p>a" + escape(html[4:html.index(">b<") + 1]) + "b</span></p>"
+
+
+def test_whole_string_keeps_tags_past_the_stream_cap():
+    html = "<p>a</p>" * 4000 + '<span title="' + "x" * 2 * _MAX_TAG + '">b</span>'
+    assert _safe_html(html) == _sanitize_block(html)
+
+
+def _reference_ranges(safe, chunks):
+    res = []
+    def overlap(a,b,c,d): return max(a,c) < min(b,d)
+    for c in chunks:
+        st, en = c.offset_start, c.offset_end
+        ok = 0 <= st < en <= len(safe) and c.value in safe[st:en]
+        if not ok:
+            idx = safe.find(c.value)
+            if idx != -1:
+                st, en = idx, idx + len(c.value)
+            else:
+                continue
+        if any(overlap(st,en,x,y) for x,y,_ in res): continue
+        res.append((st,en,c))
+    return sorted(res, key=lambda t:t[0])
+
+
+def test_first_occurrences_matches_find():
+    rnd = random.Random(99)
+    for _ in range(200):
+        text = "".join(rnd.choice("abcab ") for _ in range(rnd.randint(0, 80)))
+        pats = {"".join(rnd.choice("abc") for _ in range(rnd.randint(0, 4))) for _ in range(12)}
+        expected = {p: text.find(p) for p in pats if text.find(p) != -1}
+        assert _first_occurrences(text, pats) == expected
+
+
+def test_ranges_matches_reference():
+    rnd = random.Random(5)
+    for _ in range(300):
+        safe = "".join(rnd.choice("ab cd") for _ in range(rnd.randint(0, 60)))
+        chunks = []
+        for k in range(rnd.randint(0, 30)):
+            st = rnd.randint(-2, 62)
+            chunks.append(DataChunk(
+                id=f"c{k}", document_id="d", source_id="s", field="f",
+                value="".join(rnd.choice("abcd ") for _ in range(rnd.randint(0, 3))),
+                offset_start=st, offset_end=st + rnd.randint(-1, 5),
+            ))
+        got = [(st, en, c.id) for st, en, c in _ranges(safe, chunks)]
+        assert got == [(st, en, c.id) for st, en, c in _reference_ranges(safe, chunks)]
+
+
+def test_windows_concatenate_to_full_render():
+    rnd = random.Random(7)
+    atoms = ["<p>", "</p>", "<br>", "&amp;", "<b>x</b>", "Jane Doe", " lives at ", "\n", "<script>y</script>", "42 Elm"]
+    html = "".join(rnd.choice(atoms) for _ in range(20_000))
+    safe = _safe_html(html)
+    hits = sorted((m.start(), m.end(), m.group()) for m in re.finditer("Jane Doe|42 Elm|lives", safe))
+    chunks = [
+        DataChunk(id=f"c{k}", document_id="d", source_id="s", field="f", value=v, offset_start=st, offset_end=en)
+        for k, (st, en, v) in enumerate(rnd.sample(hits, 400))
+    ]
+    chunks.append(DataChunk(id="stale", document_id="d", source_id="s", field="f", value="x</b>",
+                            offset_start=0, offset_end=0))
+    full = wrap_chunks_into_html(html, chunks)
+    for size in (97, 1024, 1 << 20):
+        doc = render_windows("d", html, chunks, window_chars=size)
+        parts = []
+        for i in range(len(doc)):
+            head, tail = doc.frame(i)
+            part = doc.render(i)
+            assert part.startswith(head) and part.endswith(tail)
+            parts.append(part[len(head):len(part) - len(tail)])
+        assert "".join(parts) == full
+        assert sum(len(doc.chunks(i)) for i in range(len(doc))) == full.count('class="chunk"')
+        # no window ends inside a tag or an entity
+        assert all(p.rfind("<") < p.rfind(">") or "<" not in p for p in parts)
+        assert not any(re.search(r"&[#\w]*$", p) for p in parts)
+
+
+def test_windows_reopen_enclosing_elements():
+    items = "".join(f"<li>item {k} <b>bold {k} and more bold text</b></li>" for k in range(40))
+    html = f"<p>intro</p><ul>{items}</ul><p>after</p>"
+    doc = render_windows("d", html, [], window_chars=200)
+    assert len(doc) > 2
+    # window 1 starts inside the list: it gets the <ul> (and whatever item is open) back
+    w1 = doc.render(1)
+    assert w1.startswith("<ul>") and w1.endswith("</ul>")
+    for i in range(len(doc)):
+        stack = []
+        for m in re.finditer(r"<(/?)(ul|li|b|p)>", doc.render(i)):
+            if m.group(1):
+                assert stack and stack.pop() == m.group(2)
+            else:
+                stack.append(m.group(2))
+        assert not stack
+
+    # a cut inside a bold run keeps the bold formatting in the next window
+    html = "<p><b>" + "word " * 100 + "</b></p>"
+    doc = render_windows("d", html, [], window_chars=120)
+    assert all(doc.render(i).startswith("<p><b>") for i in range(1, len(doc)))
+    assert all(doc.render(i).endswith("</b></p>") for i in range(len(doc)))
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from tik.core.chunks import ChunkRecord
+from tik.core.evidence import EvidenceIndex, normalize_value
+from tik.core.models import AcceptedChunk
+from tik.core.store import Store
+from tik.core.services.fake import FakeCaseService, FakeDocumentService, FakeChunkService, FakeObjectiveService, FakeEventService
+
+
+def _chunk(cid, doc, field, value, group=None):
+    return ChunkRecord.from_dict({
+        "id": cid, "document_id": doc, "source_id": "s", "field": field, "value": value,
+        "offset_start": 0, "offset_end": 0, "exclusive_group": group,
+    })
+
+
+def test_index_groups_by_normalized_value_and_exclusive_group():
+    idx = EvidenceIndex()
+    idx.add_document("d1", [_chunk("a", "d1", "name", "Jane  DOE", "identity"), _chunk("b", "d1", "dob", "1990")])
+    idx.add_document("d2", [_chunk("c", "d2", "name", "jane doe.", "identity"), _chunk("d", "d2", "name", "John Roe", "identity")])
+    idx.add_document("d3", [_chunk("e", "d3", "name", "Jane Doe", "identity")])
+    assert normalize_value(" Jane Doe, ") == "jane doe"
+
+    ev = idx.evidence("name", "Jane Doe", "identity", exclude=[("d1", "a")])
+    assert {c.id for c in ev.corroborating} == {"c", "e"} and ev.corroborating_documents == 2
+    assert [c.id for c in ev.conflicting] == ["d"] and ev.conflicting_documents == 1
+    assert ev.conflicting_values == [("John Roe", 1)]
+
+    # reloading a chunk file replaces that document's chunks
+    idx.add_document("d2", [_chunk("c", "d2", "name", "Jane Doe", "identity")])
+    ev = idx.evidence("name", "jane doe", "identity")
+    assert {c.id for c in ev.corroborating} == {"a", "c", "e"} and not ev.conflicting
+    idx.remove_document("d3")
+    assert {c.id for c in idx.same_value("name", "JANE DOE")} == {"a", "c"}
+
+
+def test_chunk_ids_are_per_document():
+    # every chunk file numbers its chunks c-001, c-002, …
+    idx = EvidenceIndex()
+    idx.add_document("d1", [_chunk("c-001", "d1", "name", "Jane Doe")])
+    idx.add_document("d2", [_chunk("c-001", "d2", "name", "Jane Doe")])
+    assert idx.evidence("name", "Jane Doe").corroborating_documents == 2
+    ev = idx.evidence("name", "Jane Doe", exclude=[("d1", "c-001")])
+    assert [c.document_id for c in ev.corroborating] == ["d2"] and ev.corroborating_documents == 1
+
+    idx.add_document("d1", [_chunk("c-001", "d1", "name", "Jane Doe")])
+    assert idx.evidence("name", "Jane Doe").corroborating_documents == 2
+    idx.remove_document("d1")
+    ev = idx.evidence("name", "Jane Doe")
+    assert [c.document_id for c in ev.corroborating] == ["d2"] and ev.corroborating_documents == 1
+
+
+def test_values_are_counted_per_group():
+    idx = EvidenceIndex()
+    idx.add_document("d1", [_chunk("c1", "d1", "name", "Ann", "identity")])
+    idx.add_document("d2", [_chunk("c1", "d2", "name", "Zed", "identity")])
+    idx.add_document("d3", [_chunk("c1", "d3", "name", "Zed")])  # same value, no group
+    ev = idx.evidence("name", "Ann", "identity")
+    assert ev.conflicting_values == [("Zed", 1)] and ev.conflicting_documents == 1
+    assert [c.document_id for c in ev.conflicting] == ["d2"]
+    idx.remove_document("d2")  # "Zed" is still in d3, but no longer in the group
+    ev = idx.evidence("name", "Ann", "identity")
+    assert ev.conflicting_values == [] and ev.conflicting_documents == 0
+
+
+def test_store_indexes_case_in_background(qtbot):
+    data_dir = Path(__file__).resolve().parents[1] / "tik" / "data"
+    s = Store(
+        case_service=FakeCaseService(data_dir),
+        document_service=FakeDocumentService(data_dir),
+        chunk_service=FakeChunkService(data_dir),
+        objective_service=FakeObjectiveService(),
+        event_service=FakeEventService(),
+    )
+    with qtbot.waitSignal(s.evidenceChanged, timeout=5000):
+        s.load_default_case()
+    assert len(s.evidence) == len(s.sel.case.documents)
+    c = s.chunk_svc.chunk_table(s.sel.case.documents[0].id)[0]
+    acc = AcceptedChunk(chunk_id=c.id, field=c.field, value=c.value, source_id=c.source_id,
+                        document_id=c.document_id, exclusive_group=c.exclusive_group)
+    ev = s.evidence_for(acc)
+    assert all((x.document_id, x.id) != (c.document_id, c.id) for x in ev.corroborating + ev.conflicting)
+    assert ev.corroborating == [x for x in s.evidence.same_value(c.field, c.value)
+                                if (x.document_id, x.id) != (c.document_id, c.id)]
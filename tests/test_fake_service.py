@@ -1,9 +1,13 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 from pathlib import Path
+from tik.core.render_cache import RenderCache
 from tik.core.services.fake import FakeCaseService, FakeDocumentService, FakeChunkService, FakeObjectiveService
-from tik.core.models import ObjectiveExpr, ObjectivePredicate, AcceptedChunk
+from tik.core.models import ObjectiveExpr, ObjectivePredicate, AcceptedChunk, Objective, Person
+from tik.core.objectives import compile_objective
 
 
 def test_objective_eval_changes():
@@ -20,3 +24,93 @@ def test_objective_eval_changes():
     )
     changed = objsvc.evaluate(case, person)
     assert isinstance(changed, bool)
+
+
+def test_document_render_cache(tmp_path):
+    src = Path(__file__).resolve().parents[1] / "tik" / "data"
+    data_dir = tmp_path / "data"
+    shutil.copytree(src, data_dir)
+    cache = RenderCache(disk_dir=tmp_path / "cache")
+    svc = FakeDocumentService(data_dir, cache=cache)
+    first = svc.load_document_html_and_chunks("doc_0001")
+    assert svc.load_document_html_and_chunks("doc_0001") == first
+    assert (cache.hits, cache.misses) == (1, 1)
+    # rewriting the HTML invalidates the entry
+    html_path = data_dir / "docs" / "doc_0001.html"
+    html_path.write_text(html_path.read_text(encoding="utf-8") + "<p>addendum</p>", encoding="utf-8")
+    os.utime(html_path, ns=(0, 10**18))
+    assert "addendum" in svc.load_document_html_and_chunks("doc_0001")[0]
+    assert cache.misses == 2
+    # a fresh process picks the rendered document up from disk
+    cold = RenderCache(disk_dir=tmp_path / "cache")
+    FakeDocumentService(data_dir, cache=cold).load_document_html_and_chunks("doc_0001")
+    assert cold.disk_hits == 1 and cold.misses == 0
+
+
+def test_render_cache_byte_budget():
+    cache = RenderCache(max_bytes=150)
+    cache.put("a", "1", ("x" * 100, []))
+    cache.put("b", "1", ("y" * 100, []))
+    assert cache.get("a", "1") is None and cache.get("b", "1") is not None
+    assert cache.size_bytes == 100
+
+
+def test_render_cache_disk_version_and_budget(tmp_path):
+    disk = tmp_path / "cache"
+    cache = RenderCache(disk_dir=disk, max_disk_bytes=600)
+    for i, doc in enumerate(("a", "b", "c")):
+        cache.put(doc, "1", ("x" * 200, []))
+        os.utime(cache._disk_path(doc), ns=(i, i))  # a is the least recently used
+    cold = RenderCache(disk_dir=disk, max_disk_bytes=600)
+    assert cold.get("a", "1") is None and cold.get("c", "1") is not None  # oldest file went first
+    assert sum(p.stat().st_size for p in disk.glob("*.json")) <= 600
+    # another renderer version never serves these files
+    assert RenderCache(disk_dir=disk, version=cache.version + 1).get("c", "1") is None
+
+
+def test_incremental_objective_eval_matches_full():
+    data_dir = Path(__file__).resolve().parents[1] / "tik" / "data"
+    case = FakeCaseService(data_dir).load_default_case()
+    person = case.people[0]
+    objsvc = FakeObjectiveService()
+    index = objsvc.index_for(case)
+    assert [co.objective.id for co in index.by_field["dob"]] == ["obj-001"]
+    assert index.by_field.get("occupation") is None
+    for field in ("name", "occupation", "dob"):
+        person.accepted[field] = AcceptedChunk(
+            chunk_id=field, field=field, value="v", source_id="s", document_id="d"
+        )
+        objsvc.evaluate(case, person, {field})
+    incremental = [o.satisfied for o in case._objectives]
+    assert objsvc.evaluate(case, person) is False  # full pass finds nothing left to change
+    assert incremental == [True]
+
+
+def test_rich_predicates_short_circuit():
+    def leaf(**kw):
+        return ObjectiveExpr(kind="LEAF", predicate=ObjectivePredicate(**kw))
+
+    expr = ObjectiveExpr(kind="AND", children=[
+        leaf(op="matches", path="record.dob", value=r"^\d{4}-\d{2}-\d{2}$"),
+        leaf(op="equals", path="record.name", value="Jane Doe"),
+        leaf(op="confidence>=", path="record.name", value=0.8),
+        leaf(op="count", paths=["record.name", "record.dob", "record.address"], value=2),
+    ])
+    co = compile_objective(Objective(id="o", title="o", expr=expr))
+    assert co.fields == {"name", "dob", "address"}
+    person = Person(id="p")
+    person.accepted["name"] = AcceptedChunk(
+        chunk_id="1", field="name", value="Jane Doe", source_id="s", document_id="d", confidence=0.9
+    )
+    assert co.run(person) is False
+    person.accepted["dob"] = AcceptedChunk(chunk_id="2", field="dob", value="1990-01-23", source_id="s", document_id="d")
+    assert co.run(person) is True
+    person.accepted["name"].confidence = 0.5
+    assert co.run(person) is False
+
+    # a number in the objective file matches the same number written as text
+    year = compile_objective(Objective(id="y", title="y", expr=leaf(op="equals", path="record.year", value=1990)))
+    person.accepted["year"] = AcceptedChunk(chunk_id="3", field="year", value="1990", source_id="s", document_id="d")
+    assert year.run(person) is True
+    person.accepted["year"].value = "1990s"
+    assert year.run(person) is False
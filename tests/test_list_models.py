@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from tik.core.models import Case, Document, Source
+from tik.core.store import Store
+from tik.core.services.fake import FakeCaseService, FakeDocumentService, FakeChunkService, FakeObjectiveService, FakeEventService
+from tik.ui.right.widgets.document_list import DocumentListModel
+from tik.ui.right.widgets.source_list import SourceListModel
+
+
+def _store_with(n_docs: int) -> Store:
+    data_dir = Path(__file__).resolve().parents[1] / "tik" / "data"
+    s = Store(
+        case_service=FakeCaseService(data_dir),
+        document_service=FakeDocumentService(data_dir),
+        chunk_service=FakeChunkService(data_dir),
+        objective_service=FakeObjectiveService(),
+        event_service=FakeEventService(),
+    )
+    sources = [Source(id=f"s{i}", title=f"Source {i}") for i in range(3)]
+    docs = [Document(id=f"d{i}", source_id=f"s{i % 3}", title=f"Doc {i}", path="x") for i in range(n_docs)]
+    s.sel.case = Case(id="c", title="C", sources=sources, documents=docs, people=[])
+    return s
+
+
+def test_document_model_pages_and_filters_by_source(qtbot):
+    s = _store_with(100_000)
+    m = DocumentListModel(s)
+    assert m.rowCount() == m.page_size and m.canFetchMore()
+    m.fetchMore()
+    assert m.rowCount() == 2 * m.page_size
+
+    resets = []
+    m.modelReset.connect(lambda: resets.append(1))
+    s.select_source(s.sel.case.sources[1])
+    assert m.rowCount() == m.page_size
+    assert all(m.document(r).source_id == "s1" for r in range(m.rowCount()))
+    s.sel.document = m.document(3)
+    s.selectionChanged.emit()  # document-only change keeps the rows
+    assert m.rowCount() == m.page_size and not resets
+
+    doc = m.document(3)
+    assert [d.id for d in m.neighbours(doc)] == ["d13", "d7"]
+
+    new = [Document(id="x1", source_id="s1", title="X1", path="x"), Document(id="x2", source_id="s2", title="X2", path="x")]
+    s.sel.case.documents.extend(new)
+    inserted = []
+    m.rowsInserted.connect(lambda _p, a, b: inserted.append((a, b)))
+    while m.canFetchMore():
+        m.fetchMore()
+    n = m.rowCount()
+    s.documentsAdded.emit(new)
+    assert m.rowCount() == n + 1 and m.document(n).id == "x1" and not resets
+
+
+def test_source_model_ignores_selection_changes(qtbot):
+    s = _store_with(10)
+    m = SourceListModel(s)
+    removed = []
+    m.rowsRemoved.connect(lambda *_: removed.append(1))
+    s.select_source(m.source(2))
+    assert m.rowCount() == 3 and not removed
@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from tik.core.models import AcceptedChunk
+from tik.core.models import AcceptedChunk, DataChunk
 from tik.core.services.fake import FakeCaseService, FakeDocumentService, FakeChunkService, FakeObjectiveService, FakeEventService
 from tik.core.store import Store
 
@@ -37,3 +37,54 @@ def test_save_load_roundtrip(tmp_path):
     # sanity: JSON structure
     data = json.loads(out.read_text(encoding="utf-8"))
     assert data["case_id"] and data["person_id"] and "accepted" in data
+
+
+def _chunk(cid, field, value, group=None):
+    return DataChunk(id=cid, document_id="doc_0001", source_id="s-001", field=field, value=value,
+                     offset_start=0, offset_end=0, exclusive_group=group)
+
+
+def test_journal_appends_and_replays(tmp_path, qtbot):
+    s = _mk_store()
+    s.load_default_case()
+    s.sel.person.accepted.clear()
+    out = tmp_path / "record.json"
+    assert s.save_to_path(out)
+    snapshot = out.read_bytes()
+
+    s.request_accept(_chunk("c1", "name", "Jane"))
+    s.request_accept(_chunk("c2", "dob", "1990"))
+    s.retract_field("dob")
+    s.undo_stack.undo()  # dob back
+    assert s.save_to_path(out)
+    # saves after the first only touch the journal
+    assert out.read_bytes() == snapshot
+    ops = [json.loads(line)["op"] for line in (tmp_path / "record.json.log").read_text().splitlines()]
+    assert ops == ["accept", "accept", "retract", "undo:retract"]
+
+    # a torn line from a crash is ignored
+    with (tmp_path / "record.json.log").open("a") as fh:
+        fh.write('{"op":"acc')
+    fresh = _mk_store()
+    fresh.load_default_case()
+    assert fresh.load_from_path(out)
+    assert {f: a.value for f, a in fresh.sel.person.accepted.items()} == {"name": "Jane", "dob": "1990"}
+
+    # edits reach the file only on an explicit save
+    fresh.request_accept(_chunk("c3", "sex", "F"))
+    assert fresh.record_dirty
+    again = _mk_store()
+    again.load_default_case()
+    again.load_from_path(out)
+    assert set(again.sel.person.accepted) == {"name", "dob"}
+    assert fresh.save_to_path(out) and not fresh.record_dirty
+    again.load_from_path(out)
+    assert set(again.sel.person.accepted) == {"name", "dob", "sex"}
+
+    # compaction folds the log into the snapshot
+    fresh.journal.compact_every = 1
+    fresh.retract_field("name")
+    fresh.retract_field("sex")
+    assert fresh.save_to_path(out)
+    assert (tmp_path / "record.json.log").read_text() == ""
+    assert list(json.loads(out.read_text())["accepted"]) == ["dob"]
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from PyQt6.QtCore import QEvent, QMimeData, QPoint
+from PyQt6.QtGui import QHelpEvent
+from PyQt6.QtWidgets import QApplication
+
+from tik.core.models import FieldDef
+from tik.core.store import Store
+from tik.core.services.fake import FakeCaseService, FakeDocumentService, FakeChunkService, FakeObjectiveService, FakeEventService
+from tik.ui.left.field_table import COL_DROP
+from tik.ui.left.profiler import ProfilerPanel
+
+
+def _mk_store() -> Store:
+    data_dir = Path(__file__).resolve().parents[1] / "tik" / "data"
+    s = Store(
+        case_service=FakeCaseService(data_dir),
+        document_service=FakeDocumentService(data_dir),
+        chunk_service=FakeChunkService(data_dir),
+        objective_service=FakeObjectiveService(),
+        event_service=FakeEventService(),
+    )
+    s.load_default_case()
+    return s
+
+
+def test_selection_change_reuses_widgets(qtbot):
+    s = _mk_store()
+    panel = ProfilerPanel(s)
+    qtbot.addWidget(panel)
+    before = {fid: tuple(row) for fid, row in panel._rows.items()}
+    s.select_source(s.sel.case.sources[0])
+    s.select_document(s.sel.case.documents[0])
+    assert {fid: tuple(row) for fid, row in panel._rows.items()} == before
+
+    s.sel.case.schema = s.sel.case.schema + [FieldDef(id="email", label="Email")]
+    s.selectionChanged.emit()
+    assert panel._order[-1] == "email"
+    assert all(panel._rows[fid] == row for fid, row in before.items())
+
+
+def test_values_reset_without_a_person(qtbot):
+    s = _mk_store()
+    panel = ProfilerPanel(s)
+    qtbot.addWidget(panel)
+    s.request_accept(s.chunk_svc.chunk_table(s.sel.case.documents[0].id)[0])
+    s.flush()
+    field = next(iter(s.sel.person.accepted))
+    assert panel._rows[field][1].text() != "—"
+    s.sel.person = None
+    s.selectionChanged.emit()
+    assert all(row[1].text() == "—" for row in panel._rows.values())
+
+
+def test_evidence_tooltips_are_computed_on_demand(qtbot, monkeypatch):
+    s = _mk_store()
+    panel = ProfilerPanel(s)
+    qtbot.addWidget(panel)
+    asked = []
+    real = s.evidence_for
+    monkeypatch.setattr(s, "evidence_for", lambda item: asked.append(item.field) or real(item))
+    s.request_accept(s.chunk_svc.chunk_table(s.sel.case.documents[0].id)[0])
+    s.flush()
+    s.evidenceChanged.emit()
+    assert asked == []  # edits and indexing progress no longer query the index
+    field = next(iter(s.sel.person.accepted))
+    QApplication.sendEvent(panel._rows[field][1], QHelpEvent(QEvent.Type.ToolTip, QPoint(1, 1), QPoint(1, 1)))
+    assert asked == [field]
+
+
+def test_large_schema_uses_table_and_accepts_drops(qtbot):
+    s = _mk_store()
+    panel = ProfilerPanel(s)
+    qtbot.addWidget(panel)
+    s.sel.case.schema = [FieldDef(id=f"f{i}", label=f"F{i}") for i in range(500)] + [FieldDef(id="name", label="Name")]
+    s.selectionChanged.emit()
+    assert not panel._rows and panel.table_model.rowCount() == 501
+
+    md = QMimeData()
+    md.setData("application/json", json.dumps({
+        "chunkId": "c1", "documentId": "doc_001", "sourceId": "s-001", "field": "name", "value": "Jane Roe",
+    }).encode())
+    m = panel.table_model
+    assert not m.canDropMimeData(md, None, -1, -1, m.index(3, COL_DROP))
+    assert m.dropMimeData(md, None, -1, -1, m.index(500, COL_DROP))
+    assert s.sel.person.accepted["name"].value == "Jane Roe"
+    assert m.index(500, 1).data() == "Jane Roe"
+
+
+def test_id_only_drop_resolves_registered_chunk(qtbot, monkeypatch):
+    from tik.core.chunks import ChunkRecord
+    from tik.ui.widgets import drop_zone
+
+    s = _mk_store()
+    panel = ProfilerPanel(s)
+    qtbot.addWidget(panel)
+    s.sel.case.schema = [FieldDef(id=f"f{i}", label=f"F{i}") for i in range(60)] + [FieldDef(id="name", label="Name")]
+    s.selectionChanged.emit()
+    rec = ChunkRecord("c-x", "doc_0001", "s-001", "name", "Jane Q. Doe", 0, 8, "identity",
+                      quote="…Jane Q. Doe, 42…", locator="p.3", confidence=0.9)
+    s.chunk_registry.register("doc_0001", [rec])
+    # chunk ids repeat across documents; the drag names its document
+    s.chunk_registry.register("doc_0002", [ChunkRecord("c-x", "doc_0002", "s-002", "name", "Other", 0, 5)])
+
+    parsed = []
+    monkeypatch.setattr(drop_zone, "parse_drop", lambda md: parsed.append(md))
+    md = QMimeData()
+    md.setData(drop_zone.CHUNK_MIME, b"doc_0001\tc-x\tname")
+    m = panel.table_model
+    for _ in range(20):  # drag moves over the target
+        assert m.canDropMimeData(md, None, -1, -1, m.index(60, COL_DROP))
+    assert m.dropMimeData(md, None, -1, -1, m.index(60, COL_DROP))
+    acc = s.sel.person.accepted["name"]
+    assert (acc.chunk_id, acc.quote, acc.locator, acc.confidence) == ("c-x", "…Jane Q. Doe, 42…", "p.3", 0.9)
+    assert not parsed  # no JSON involved
+
+    # a drag that never reached end_drag() cannot answer for different data in the same object
+    md.setData(drop_zone.CHUNK_MIME, b"doc_0001\tc-x\tname")
+    assert drop_zone.drag_ref(md)[0] == ("doc_0001", "c-x")
+    md.setData(drop_zone.CHUNK_MIME, b"doc_0002\tc-x\tname")
+    assert drop_zone.chunk_for_drop(md, s.chunk_by_id).value == "Other"
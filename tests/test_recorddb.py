@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from tik.core.models import AcceptedChunk, DataChunk, Person
+from tik.core.recorddb import RecordDB
+from tik.core.services.fake import FakeCaseService, FakeDocumentService, FakeChunkService, FakeObjectiveService, FakeEventService
+from tik.core.store import Store
+
+
+DATA = Path(__file__).resolve().parents[1] / "tik" / "data"
+
+
+def _mk_store(data_dir: Path = DATA):
+    return Store(
+        case_service=FakeCaseService(data_dir),
+        document_service=FakeDocumentService(data_dir),
+        chunk_service=FakeChunkService(data_dir),
+        objective_service=FakeObjectiveService(),
+        event_service=FakeEventService(),
+    )
+
+
+def _ac(field, value, source="s-001", doc="doc_0001"):
+    return AcceptedChunk(chunk_id=f"{field}-{value}", field=field, value=value, source_id=source,
+                         document_id=doc, confidence=0.5, tags=["t"])
+
+
+def test_queries_by_field_value_and_provenance(tmp_path):
+    db = RecordDB(tmp_path / "records.db")
+    s = _mk_store()
+    s.load_default_case()
+    case = s.sel.case
+    db.put_case(case)
+    people = [
+        Person(id=f"p{i}", name=f"P{i}", accepted={
+            "dob": _ac("dob", f"19{i % 3}0", source="s-001" if i % 2 else "s-002"),
+            "name": _ac("name", f"P{i}"),
+        })
+        for i in range(10)
+    ]
+    assert db.save_people(case.id, people) == 10
+    assert db.people_with("dob", source_id="s-001") == [(case.id, f"p{i}") for i in (1, 3, 5, 7, 9)]
+    assert db.people_with("dob", value="1900") == [(case.id, f"p{i}") for i in (0, 3, 6, 9)]
+    assert [k[1] for k in db.people_with_value("P4")] == ["p4"]
+    assert len(db.fields_from(source_id="s-002")) == 5
+
+    db.close()
+    db = RecordDB(tmp_path / "records.db")
+    lazy = db.load_case(case.id)
+    assert lazy is not None and all(not p.accepted for p in lazy.people)
+    p3 = db.load_person(case.id, "p3")
+    assert p3.accepted["dob"].tags == ["t"] and p3.accepted["dob"].confidence == 0.5
+
+
+def test_store_hydrates_people_lazily_and_writes_through(tmp_path, qtbot):
+    db = RecordDB(tmp_path / "records.db")
+    s = _mk_store()
+    s.use_record_db(db)
+    s.load_default_case()
+    case = s.sel.case
+    db.save_people(case.id, [Person(id="p-extra", name="Extra", accepted={"name": _ac("name", "Extra")})])
+
+    assert s.open_case(case.id)
+    extra = next(p for p in s.sel.case.people if p.id == "p-extra")
+    assert not extra.accepted  # not loaded until selected
+    assert s.select_person("p-extra")
+    assert s.sel.person.accepted["name"].value == "Extra"
+
+    s.request_accept(DataChunk(id="c9", document_id="doc_0002", source_id="s-002", field="dob",
+                               value="2001", offset_start=0, offset_end=0))
+    assert db.people_with("dob", document_id="doc_0002") == [(case.id, "p-extra")]
+    s.undo_stack.undo()
+    assert db.people_with("dob") == []
+
+
+def test_db_follows_seed_edits_and_json_loads(tmp_path, qtbot):
+    data_dir = tmp_path / "data"
+    shutil.copytree(DATA, data_dir)
+    db = RecordDB(tmp_path / "records.db")
+    s = _mk_store(data_dir)
+    s.use_record_db(db)
+    s.load_default_case()
+    case_id, person_id = s.sel.case.id, s.sel.person.id
+    s.request_accept(DataChunk(id="c1", document_id="doc_0001", source_id="s-001", field="name",
+                               value="Jane Doe", offset_start=0, offset_end=0))
+
+    # an edited seed is re-imported; what was accepted here survives it
+    seed_path = data_dir / "seed_case.json"
+    seed = json.loads(seed_path.read_text(encoding="utf-8"))
+    seed["case"]["title"] = "Renamed"
+    seed_path.write_text(json.dumps(seed), encoding="utf-8")
+    s = _mk_store(data_dir)
+    s.use_record_db(db)
+    s.load_default_case()
+    assert s.sel.case.title == "Renamed" and s.sel.person.accepted["name"].value == "Jane Doe"
+
+    # a record loaded from JSON is written through
+    path = tmp_path / "record.json"
+    s.save_to_path(path)
+    shutil.copy(path, tmp_path / "copy.json")
+    s.retract_field("name")
+    assert db.people_with("name") == []
+    s.load_from_path(tmp_path / "copy.json")
+    assert db.people_with("name") == [(case_id, person_id)]
+
+    # switching people edits nothing: only selectionChanged fires
+    s.flush()
+    fired = []
+    s.acceptedChanged.connect(lambda: fired.append("accepted"))
+    s.fieldsChanged.connect(lambda _: fired.append("fields"))
+    db.save_people(case_id, [Person(id="p-2", name="Two", accepted={"dob": _ac("dob", "1990")})])
+    s.open_case(case_id)
+    assert s.select_person("p-2") and s.sel.person.accepted["dob"].value == "1990"
+    s.flush()
+    assert fired == []
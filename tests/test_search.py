@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import statistics
+import time
+from pathlib import Path
+
+from tik.core.chunks import ChunkRecord
+from tik.core import search
+from tik.core.search import SearchIndex
+from tik.core.services.fake import FakeCaseService, FakeChunkService, FakeDocumentService, FakeEventService, FakeObjectiveService
+from tik.core.store import Store
+
+DATA = Path(__file__).resolve().parents[1] / "tik" / "data"
+
+
+def test_hits_map_to_rendered_chunk_offsets(tmp_path):
+    path = tmp_path / "search.db"
+    ix = SearchIndex(path)
+    assert ix.update_from_data_dir(DATA, ["doc_0001", "missing"]) == 1
+    ix.close()
+
+    ix = SearchIndex(path)  # persisted: nothing to redo
+    assert ix.update_from_data_dir(DATA, ["doc_0001"]) == 0
+    html = (DATA / "docs" / "doc_0001.html").read_text(encoding="utf-8")
+    chunk = next(h for h in ix.search("everg") if h.kind == "chunk")
+    assert chunk.field == "address" and "Evergreen" in html and chunk.start < chunk.end
+    text = next(h for h in ix.search("Evergreen") if h.kind == "text")
+    assert chunk.chunk_ids[0] in text.chunk_ids
+    assert ix.search("   ") == [] and ix.search('"unbalanced') == []
+
+
+def test_reindex_replaces_rows():
+    ix = SearchIndex()
+    rec = ChunkRecord("c1", "d1", "s", "name", "Alice Smith", 3, 14)
+    ix.add_document("d1", "<p>Hi Alice Smith</p>", [rec], stamp="1")
+    assert not ix.add_document("d1", "<p>Hi Alice Smith</p>", [rec], stamp="1")
+    ix.add_document("d1", "<p>Hi Bob</p>", [], stamp="2")
+    assert ix.search("alice") == [] and [h.document_id for h in ix.search("bob")] == ["d1"]
+    assert len(ix) == 1
+
+
+def test_common_terms_rank_a_bounded_candidate_set(monkeypatch):
+    monkeypatch.setattr(search, "_CANDIDATES", 500)
+    ix = SearchIndex()
+    ix.add_documents((f"d{i}", f"<p>w{i} lives on Evergreen Terrace</p>",
+                      [ChunkRecord(f"c{i}", f"d{i}", "s", "name", "Jane Doe", 0, 0)], "1") for i in range(5000))
+    times = []
+    for q in ("evergreen", "jane", "w12"):
+        for _ in range(5):
+            t = time.perf_counter()
+            hits = ix.search(q, limit=20)
+            times.append(time.perf_counter() - t)
+        assert len(hits) == 20
+    assert statistics.median(times) < 0.05
+    # chunk hits filled the limit: no text hits; a document filter still finds its own rows
+    assert {h.kind for h in ix.search("jane")} == {"chunk"}
+    assert [h.document_id for h in ix.search("evergreen", document_id="d3")] == ["d3"]
+
+
+def test_store_indexes_case_off_the_gui_thread(tmp_path, qtbot):
+    s = Store(case_service=FakeCaseService(DATA), document_service=FakeDocumentService(DATA),
+              chunk_service=FakeChunkService(DATA), objective_service=FakeObjectiveService(),
+              event_service=FakeEventService())
+    s.use_search_index(SearchIndex(tmp_path / "search.db"), DATA)
+    with qtbot.waitSignal(s.searchIndexed, timeout=5000) as blocker:
+        s.load_default_case()
+    assert blocker.args == [len(s.sel.case.documents)]
+    assert any(h.kind == "chunk" for h in s.search("evergreen"))
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from tik.core.seed_stream import iter_seed_events
+from tik.core.services.fake import FakeCaseService, FakeDocumentService, FakeChunkService, FakeObjectiveService, FakeEventService
+from tik.core.store import Store
+
+DATA = Path(__file__).resolve().parents[1] / "tik" / "data"
+
+
+def _big_seed(path: Path, n_docs: int) -> dict:
+    seed = json.loads((DATA / "seed_case.json").read_text(encoding="utf-8"))
+    seed["extra"] = {"ignored": [1, 2.5e3, None, True]}
+    seed["case"]["sources"].append({"id": "s-ü", "title": 'tricky "quoted" {braces} [x], \\ back\\slash'})
+    seed["case"]["documents"] = [
+        {"id": f"doc_{i:05d}", "source_id": "s-001" if i % 2 else "s-002", "title": f"Doc {i} — ✓", "path": "x"}
+        for i in range(n_docs)
+    ]
+    path.write_text(json.dumps(seed, ensure_ascii=False, indent=1), encoding="utf-8")
+    return seed
+
+
+def test_streamed_events_match_full_parse(tmp_path):
+    seed = _big_seed(tmp_path / "seed_case.json", 300)
+    for chunk_size in (1, 7, 4096):
+        events = list(iter_seed_events(tmp_path / "seed_case.json", chunk_size=chunk_size))
+        assert [p for k, p in events if k == "document"] == seed["case"]["documents"]
+        assert [p for k, p in events if k == "source"] == seed["case"]["sources"]
+        assert dict(p for k, p in events if k == "case")["title"] == seed["case"]["title"]
+        assert [p for k, p in events if k == "objectives"] == [seed["objectives"]]
+
+
+def test_store_streams_case_in_pages(tmp_path, qtbot):
+    data_dir = tmp_path / "data"
+    shutil.copytree(DATA, data_dir)
+    _big_seed(data_dir / "seed_case.json", 1200)
+    s = Store(
+        case_service=FakeCaseService(data_dir),
+        document_service=FakeDocumentService(data_dir),
+        chunk_service=FakeChunkService(data_dir),
+        objective_service=FakeObjectiveService(),
+        event_service=FakeEventService(),
+    )
+    order = []
+    s.sourcesAdded.connect(lambda items: order.append(("sources", len(items))))
+    s.documentsAdded.connect(lambda items: order.append(("documents", len(items))))
+    with qtbot.waitSignal(s.caseLoaded, timeout=10000):
+        s.stream_default_case(page_size=500)
+    assert order[0] == ("sources", 3)
+    assert [n for k, n in order if k == "documents"] == [500, 500, 200]
+    assert len(s.sel.case.documents) == 1200 and s.sel.person is not None
+    assert s.sel.case._objectives
+
+
+def test_reordered_seed_matches_full_load(tmp_path, qtbot):
+    data_dir = tmp_path / "data"
+    shutil.copytree(DATA, data_dir)
+    seed = json.loads((DATA / "seed_case.json").read_text(encoding="utf-8"))
+    case = seed["case"]
+    # lists first, plain keys last, objectives ahead of the case
+    reordered = {"objectives": seed["objectives"], "case": {
+        **{k: case[k] for k in ("people", "sources", "documents")},
+        **{k: v for k, v in case.items() if k not in ("people", "sources", "documents")},
+    }}
+    (data_dir / "seed_case.json").write_text(json.dumps(reordered), encoding="utf-8")
+    full = FakeCaseService(data_dir).load_default_case()
+    pages = list(FakeCaseService(data_dir).iter_default_case(page_size=2))
+    assert pages[0][0] == "case" and pages[0][1].title == full.title and pages[0][1].schema == full.schema
+
+    s = Store(
+        case_service=FakeCaseService(data_dir),
+        document_service=FakeDocumentService(data_dir),
+        chunk_service=FakeChunkService(data_dir),
+        objective_service=FakeObjectiveService(),
+        event_service=FakeEventService(),
+    )
+    with qtbot.waitSignal(s.caseLoaded, timeout=10000):
+        s.stream_default_case(page_size=2)
+    assert s.sel.case.documents == full.documents and s.sel.case.people == full.people
+    assert s.sel.case._objectives == full._objectives
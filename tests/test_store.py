@@ -1,5 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+
+import httpx
+
+from tik.core.aio import AsyncRunner
+from tik.core.commands import to_accepted
+from tik.core.events import AdvisorPump
+from tik.core.models import AcceptedChunk, DataChunk
+from tik.core.services.api import (
+    ApiEventStream, ApiSession, AsyncApiDocumentService, AsyncApiEventService, AsyncApiObjectiveService, AsyncApiSession,
+)
+from tik.core.services.base import AsyncObjectiveService
 from tik.core.store import Store
 from tik.core.services.fake import FakeCaseService, FakeDocumentService, FakeChunkService, FakeObjectiveService, FakeEventService
 from pathlib import Path
@@ -32,3 +44,213 @@ def test_accept_and_undo(qtbot):
     assert "name" in s.sel.person.accepted
     s.undo_stack.undo()
     assert "name" not in s.sel.person.accepted
+
+
+def test_select_document_async(qtbot):
+    s = _mk_store()
+    s.load_default_case()
+    doc = s.sel.case.documents[0]
+    with qtbot.waitSignal(s.documentLoaded, timeout=5000) as blocker:
+        s.select_document_async(doc)
+    html, chunks = blocker.args
+    assert 'class="chunk"' in html and chunks
+    # a newer selection cancels the pending render
+    with qtbot.assertNotEmitted(s.documentLoaded, wait=300):
+        s.select_document_async(doc)
+        s.select_document_async(None)
+    s.loader.wait()
+
+
+def test_failed_document_load_is_reported(qtbot):
+    s = _mk_store()
+    s.load_default_case()
+    doc = s.sel.case.documents[0].model_copy(update={"id": "missing"})
+    with qtbot.waitSignal(s.documentFailed, timeout=5000) as blocker:
+        s.select_document_async(doc)
+    assert blocker.args[0] == "missing" and blocker.args[1]
+    s.loader.wait()
+
+
+def test_large_document_arrives_windowed(qtbot):
+    s = _mk_store()
+    s.load_default_case()
+    s.doc_svc.window_threshold = 0  # every document counts as large
+    doc = s.sel.case.documents[0]
+    with qtbot.waitSignal(s.documentWindowed, timeout=5000) as blocker:
+        s.select_document_async(doc)
+    win = blocker.args[0]
+    html, _ = s.doc_svc.load_document_html_and_chunks(doc.id)
+    assert win.document_id == doc.id and "".join(win.render(i) for i in range(len(win))) == html
+    s.loader.wait()
+
+
+def test_async_services_drive_store(qtbot, standin):
+    s = _mk_store()
+    s.load_default_case()
+    runner = AsyncRunner()
+    session = AsyncApiSession("http://tik.test", transport=httpx.MockTransport(standin.ahandle))
+    s.use_async_services(
+        runner,
+        documents=AsyncApiDocumentService(session),
+        objectives=AsyncApiObjectiveService(session),
+        events=AsyncApiEventService(session),
+    )
+    try:
+        with qtbot.waitSignal(s.documentLoaded, timeout=5000) as blocker:
+            s.select_document_async(s.sel.case.documents[0])
+        assert 'class="chunk"' in blocker.args[0]
+
+        for field in ("name", "dob"):
+            s.sel.person.accepted[field] = AcceptedChunk(
+                chunk_id=field, field=field, value="v", source_id="s", document_id="d"
+            )
+        standin.events.append({"id": "9", "text": "async hello"})
+        with qtbot.waitSignals([s.objectivesChanged, s.advisorEvent], timeout=5000):
+            s.evaluate_objectives({"dob"})
+            s.poll_events()
+        assert s.sel.case._objectives[0].satisfied
+    finally:
+        runner.run(session.aclose())
+        runner.stop()
+
+
+def test_stale_async_objective_results_are_dropped(qtbot):
+    class Slow(AsyncObjectiveService):
+        """First call answers late with True, later ones at once with False."""
+        calls = 0
+
+        async def statuses(self, case, person, changed=None):
+            Slow.calls += 1
+            if Slow.calls == 1:
+                await asyncio.sleep(0.3)
+            return {o.id: Slow.calls == 1 for o in case._objectives}
+
+    s = _mk_store()
+    s.load_default_case()
+    runner = AsyncRunner()
+    s.use_async_services(runner, objectives=Slow())
+    try:
+        obj = s.sel.case._objectives[0]
+        obj.satisfied = True
+        s.evaluate_objectives()
+        with qtbot.waitSignal(s.objectivesChanged, timeout=5000):
+            s.evaluate_objectives()
+        qtbot.wait(500)  # the slower, older answer lands meanwhile and is ignored
+        assert obj.satisfied is False
+    finally:
+        runner.stop()
+
+
+def test_loading_evaluates_every_objective(qtbot):
+    s = _mk_store()
+    s.load_default_case()
+    obj = s.sel.case._objectives[0]
+    assert obj.satisfied is False
+    obj.satisfied = True  # stale, e.g. from the seed or another record
+    assert s.select_person(s.sel.person.id)
+    assert obj.satisfied is False
+
+
+def test_advisor_stream_wakes_pump_with_batches(qtbot, standin):
+    data_dir = Path(__file__).resolve().parents[1] / "tik" / "data"
+    standin.events = [{"id": str(i), "text": f"burst {i}"} for i in range(3)]
+    stream = ApiEventStream(
+        "http://tik.test", ApiSession("http://tik.test", transport=httpx.MockTransport(standin.handle)),
+        reconnect_min=0.05,
+    )
+    s = Store(
+        case_service=FakeCaseService(data_dir),
+        document_service=FakeDocumentService(data_dir),
+        chunk_service=FakeChunkService(data_dir),
+        objective_service=FakeObjectiveService(),
+        event_service=stream,
+    )
+    pump = AdvisorPump(s, min_interval=60_000)  # the timer never fires during the test
+    stream.set_listener(pump.wake)
+    got = []
+    s.advisorEvents.connect(got.extend)
+    stream.start()
+    try:
+        qtbot.waitUntil(lambda: len(got) == 3, timeout=5000)
+        assert [e.text for e in got] == ["burst 0", "burst 1", "burst 2"]
+        assert pump.interval == pump.min_interval
+    finally:
+        stream.stop(5)
+
+
+def test_batch_coalesces_notifications(qtbot):
+    s = _mk_store()
+    s.load_default_case()
+    _, chunks = s.doc_svc.load_document_html_and_chunks("doc_0001")
+    by_id = {c["id"]: DataChunk.model_validate(c) for c in chunks}
+    evaluations = []
+    evaluate = s.obj_svc.evaluate
+    s.obj_svc.evaluate = lambda case, person, changed=None: evaluations.append(set(changed)) or evaluate(case, person, changed)
+    fields, accepted, objectives = [], [], []
+    s.fieldsChanged.connect(fields.append)
+    s.acceptedChanged.connect(lambda: accepted.append(1))
+    s.objectivesChanged.connect(lambda: objectives.append(1))
+
+    with s.batch():
+        for cid in ("c-001", "c-002", "c-003"):
+            s.request_accept(by_id[cid])
+        s.retract_field("address")
+        assert not accepted  # nothing leaks out of the batch
+    assert fields == [frozenset({"name", "dob", "address"})]
+    assert (len(accepted), len(objectives)) == (1, 1)
+    assert evaluations == [{"name", "dob", "address"}]
+
+    # outside a batch, edits made in the same event-loop turn go out together
+    s.retract_field("name")
+    s.retract_field("dob")
+    assert len(accepted) == 1
+    qtbot.waitUntil(lambda: len(accepted) == 2)
+    assert fields[-1] == frozenset({"name", "dob"})
+
+
+def _chunk(i, field, value, group=None, source="s1", conf=None):
+    return DataChunk(
+        id=f"c{i}", document_id="d", source_id=source, field=field, value=value,
+        offset_start=0, offset_end=0, exclusive_group=group, confidence=conf, quote=f"q{i}",
+    )
+
+
+def test_accept_many_policies_and_single_undo(qtbot):
+    s = _mk_store()
+    s.load_default_case()
+    s.sel.person.accepted.clear()
+    chunks = [
+        _chunk(1, "dob", "1990", group="dob", conf=0.4, source="a"),
+        _chunk(2, "dob", "1991", group="dob", conf=0.9, source="b"),
+        _chunk(3, "dob", "1992", group="dob", conf=0.6, source="c"),
+        _chunk(4, "name", "Ann"),
+    ]
+    depth = s.undo_stack.count()
+    assert s.accept_many(chunks) == 2
+    acc = s.sel.person.accepted
+    assert acc["dob"].value == "1991" and acc["dob"].quote == "q2" and acc["name"].value == "Ann"
+    assert s.undo_stack.count() == depth + 1
+    s.undo_stack.undo()
+    assert not s.sel.person.accepted
+
+    s.accept_many(chunks, policy="newest")
+    assert s.sel.person.accepted["dob"].value == "1992"
+    s.accept_many(chunks, policy="source_priority", source_priority=["a", "c"])
+    assert s.sel.person.accepted["dob"].value == "1990"
+    # idempotent when nothing would change
+    assert s.accept_many([_chunk(1, "dob", "1990", group="dob")], policy="newest") == 0
+    assert s.accept_many([_chunk(4, "name", "Ann")]) == 0  # outside a group too
+
+
+def test_same_chunk_id_from_another_document_conflicts(qtbot):
+    s = _mk_store()
+    s.load_default_case()
+    s.sel.person.accepted.clear()
+    asked = []
+    s.set_conflict_resolver(lambda current, incoming: asked.append(incoming.document_id) or to_accepted(incoming))
+    s.request_accept(_chunk(1, "dob", "1990", group="dob"))
+    s.request_accept(_chunk(1, "dob", "1990", group="dob"))  # the same chunk again: idempotent
+    other = _chunk(1, "dob", "1991", group="dob").model_copy(update={"document_id": "e"})
+    s.request_accept(other)
+    assert asked == ["e"] and s.sel.person.accepted["dob"].document_id == "e"
+    assert s.accept_many([_chunk(1, "dob", "1990", group="dob")], policy="newest") == 1
@@ -4,16 +4,22 @@ import sys
 from pathlib import Path
 from loguru import logger
 
-from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtCore import QStandardPaths
 from PyQt6.QtWidgets import QApplication
 
 from .theme.qss import apply_theme
+from .core.events import AdvisorPump
+from .core.recorddb import RecordDB
+from .core.render_cache import RenderCache
+from .core.search import SearchIndex
 from .core.store import Store
 from .core.services.fake import FakeCaseService, FakeDocumentService, FakeChunkService, FakeObjectiveService, FakeEventService
 from .ui.shell import MainWindow
+from .ui.right.scheme import register_reader_scheme
 
 
 def main() -> int:
+    register_reader_scheme()  # tik:// must be known before QApplication exists
     app = QApplication(sys.argv)
     app.setApplicationName("The Investigation Kit")
     app.setOrganizationName("TIK")
@@ -23,7 +29,9 @@ def main() -> int:
     base_dir = Path(__file__).resolve().parent
     data_dir = base_dir / "data"
     case_svc = FakeCaseService(data_dir)
-    doc_svc = FakeDocumentService(data_dir)
+    cache_dir = Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)) / "rendered"
+    # documents over 4 MB are rendered in windows the reader pulls as it scrolls
+    doc_svc = FakeDocumentService(data_dir, cache=RenderCache(disk_dir=cache_dir), window_threshold=4 << 20)
     chunk_svc = FakeChunkService(data_dir)
     obj_svc = FakeObjectiveService()
     evt_svc = FakeEventService()
@@ -31,19 +39,28 @@ def main() -> int:
     store = Store(case_service=case_svc, document_service=doc_svc, chunk_service=chunk_svc,
                   objective_service=obj_svc, event_service=evt_svc)
 
-    # Bootstrap default case
-    store.load_default_case()
+    # Records of every case/person live in a local DB; people load when selected
+    app_dir = Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation))
+    app_dir.mkdir(parents=True, exist_ok=True)
+    store.use_record_db(RecordDB(app_dir / "records.db"))
+
+    # Search index: only new or changed documents are indexed, in the background after each case load
+    store.use_search_index(SearchIndex(app_dir / "search.db"), data_dir)
 
     # UI
     win = MainWindow(store)
     win.resize(1280, 800)
     win.show()
 
-    # Advisor event poller (timer-mock)
-    timer = QTimer(win)
-    timer.setInterval(3000)  # 3s
-    timer.timeout.connect(store.poll_events)
-    timer.start()
+    # Bootstrap default case: sources/documents fill the lists page by page while parsing
+    store.stream_default_case()
+
+    # Advisor events: adaptive polling; push streams (ApiEventStream) wake the pump directly
+    pump = AdvisorPump(store, min_interval=3000, parent=win)
+    if hasattr(evt_svc, "set_listener"):
+        evt_svc.set_listener(pump.wake)
+        evt_svc.start()
+    pump.start()
 
     logger.info("TIK started")
     return app.exec()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncRunner:
+    """
+    Dedicated asyncio event loop on a background thread.
+    Qt keeps its own loop on the GUI thread; coroutines are handed over with
+    `submit` and their results come back as concurrent futures.
+    """
+
+    def __init__(self, name: str = "tik-asyncio"):
+        self.loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+        self.loop.run_forever()
+        # drain cancellations so clients get a chance to close cleanly
+        pending = asyncio.all_tasks(self.loop)
+        for task in pending:
+            task.cancel()
+        self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self.loop.close()
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Blocking helper for scripts and tests; never call it from the loop thread."""
+        return self.submit(coro).result(timeout)
+
+    def stop(self) -> None:
+        if self.running:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .models import DataChunk
+
+
+_FIELDS: Tuple[str, ...] = (
+    "id", "document_id", "source_id", "field", "value", "offset_start", "offset_end",
+    "exclusive_group", "quote", "locator", "confidence", "tags",
+)
+_REQUIRED = ("id", "document_id", "source_id", "field", "value", "offset_start", "offset_end")
+_intern = sys.intern
+
+
+def _opt_intern(s: Optional[str]) -> Optional[str]:
+    return None if s is None else _intern(s)
+
+
+class ChunkRecord:
+    """
+    Lightweight stand-in for DataChunk on hot paths (rendering, indexing, conflicts).
+    Same attributes, no per-instance dict; document ids, fields, sources, groups and tags
+    are interned so 50k chunks share a handful of strings (chunk ids and values are
+    mostly unique, so they are left alone). Also reads like the dict it replaces
+    (`rec["field"]`, `rec.get(...)`), which is what documentLoaded consumers expect.
+    """
+    __slots__ = _FIELDS
+
+    def __init__(
+        self,
+        id: str,
+        document_id: str,
+        source_id: str,
+        field: str,
+        value: str,
+        offset_start: int,
+        offset_end: int,
+        exclusive_group: Optional[str] = None,
+        quote: Optional[str] = None,
+        locator: Optional[str] = None,
+        confidence: Optional[float] = None,
+        tags: Sequence[str] = (),
+    ):
+        self.id = id
+        self.document_id = _intern(document_id)
+        self.source_id = _intern(source_id)
+        self.field = _intern(field)
+        self.value = value
+        self.offset_start = offset_start
+        self.offset_end = offset_end
+        self.exclusive_group = _opt_intern(exclusive_group)
+        self.quote = quote
+        self.locator = locator
+        self.confidence = confidence
+        self.tags = tuple(_intern(t) for t in tags) if tags else ()
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "ChunkRecord":
+        """Build from raw JSON; checks what the renderer relies on instead of a full pydantic pass."""
+        missing = [k for k in _REQUIRED if d.get(k) is None]
+        if missing:
+            raise ValueError(f"chunk {d.get('id')!r} is missing {', '.join(missing)}")
+        conf = d.get("confidence")
+        return cls(
+            str(d["id"]), d["document_id"], d["source_id"], d["field"], str(d["value"]),
+            int(d["offset_start"]), int(d["offset_end"]),
+            d.get("exclusive_group"), d.get("quote"), d.get("locator"),
+            None if conf is None else float(conf), d.get("tags") or (),
+        )
+
+    @classmethod
+    def from_model(cls, c: DataChunk) -> "ChunkRecord":
+        return cls(c.id, c.document_id, c.source_id, c.field, c.value, c.offset_start, c.offset_end,
+                   c.exclusive_group, c.quote, c.locator, c.confidence, c.tags)
+
+    def to_model(self) -> DataChunk:
+        """Validated DataChunk, for the I/O boundary."""
+        return DataChunk.model_validate(self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        d = {k: getattr(self, k) for k in _FIELDS}
+        d["tags"] = list(self.tags)
+        return d
+
+    # ---- mapping-style access ----
+    def __getitem__(self, key: str) -> Any:
+        if key not in _FIELDS:
+            raise KeyError(key)
+        return list(self.tags) if key == "tags" else getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in _FIELDS else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return _FIELDS
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return ((k, self[k]) for k in _FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ChunkRecord):
+            return all(getattr(self, k) == getattr(other, k) for k in _FIELDS)
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ChunkRecord(id={self.id!r}, field={self.field!r}, value={self.value!r})"
+
+
+ChunkLike = Union[DataChunk, ChunkRecord]
+# (document id, chunk id); chunk ids are only unique within their document
+ChunkKey = Tuple[str, str]
+
+
+class ChunkTable(Sequence[ChunkRecord]):
+    """Chunks of one document (or corpus) with lazily built field / group indexes."""
+
+    def __init__(self, records: Iterable[ChunkRecord] = ()):
+        self.records: List[ChunkRecord] = list(records)
+        self._by_field: Optional[Dict[str, List[ChunkRecord]]] = None
+        self._by_group: Optional[Dict[str, List[ChunkRecord]]] = None
+
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Dict[str, Any]]) -> "ChunkTable":
+        return cls(ChunkRecord.from_dict(r) for r in rows)
+
+    @classmethod
+    def from_models(cls, chunks: Iterable[DataChunk]) -> "ChunkTable":
+        return cls(ChunkRecord.from_model(c) for c in chunks)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, i):  # type: ignore[override]
+        return self.records[i]
+
+    def __iter__(self) -> Iterator[ChunkRecord]:
+        return iter(self.records)
+
+    def by_field(self, field: str) -> List[ChunkRecord]:
+        if self._by_field is None:
+            self._by_field = {}
+            for r in self.records:
+                self._by_field.setdefault(r.field, []).append(r)
+        return self._by_field.get(field, [])
+
+    def by_group(self, group: str) -> List[ChunkRecord]:
+        if self._by_group is None:
+            self._by_group = {}
+            for r in self.records:
+                if r.exclusive_group:
+                    self._by_group.setdefault(r.exclusive_group, []).append(r)
+        return self._by_group.get(group, [])
+
+    def to_models(self) -> List[DataChunk]:
+        return [r.to_model() for r in self.records]
+
+
+class ChunkRegistry:
+    """
+    Chunks of the most recently shown documents by (document id, chunk id), so a drag that
+    carries only those ids resolves to the full chunk (provenance included) with one dict lookup.
+    """
+
+    def __init__(self, keep: int = 8):
+        self.keep = keep
+        self._docs: "OrderedDict[str, List[ChunkKey]]" = OrderedDict()
+        self._by_id: Dict[ChunkKey, ChunkLike] = {}
+
+    def register(self, document_id: str, chunks: Iterable[ChunkLike]) -> None:
+        self._drop(document_id)
+        keys = self._docs[document_id] = []
+        for c in chunks:
+            key = (document_id, c.id)
+            self._by_id[key] = c
+            keys.append(key)
+        while len(self._docs) > self.keep:
+            self._drop(next(iter(self._docs)))
+
+    def _drop(self, document_id: str) -> None:
+        for key in self._docs.pop(document_id, ()):
+            self._by_id.pop(key, None)
+
+    def get(self, document_id: str, chunk_id: str) -> Optional[ChunkLike]:
+        return self._by_id.get((document_id, chunk_id))
+
+    def __len__(self) -> int:
+        return len(self._by_id)
@@ -2,60 +2,120 @@ from __future__ import annotations
 
 from PyQt6.QtGui import QUndoCommand
 
+from typing import Callable, Collection, Dict, Optional
+
 from .models import Person, DataChunk, AcceptedChunk
 
 
-class AcceptChunkCommand(QUndoCommand):
-    def __init__(self, person: Person, chunk: DataChunk):
-        super().__init__(f"Accept {chunk.field}")
+# (person, op, fields set, fields removed); Store forwards it to the journal / record DB
+OpLog = Callable[[Person, str, Dict[str, AcceptedChunk], Collection[str]], None]
+
+
+def to_accepted(chunk: DataChunk) -> AcceptedChunk:
+    """AcceptedChunk for an incoming chunk (or chunk-like object), keeping its provenance."""
+    return AcceptedChunk(
+        chunk_id=chunk.id,
+        field=chunk.field,
+        value=chunk.value,
+        source_id=chunk.source_id,
+        document_id=chunk.document_id,
+        exclusive_group=getattr(chunk, "exclusive_group", None),
+        quote=getattr(chunk, "quote", None),
+        locator=getattr(chunk, "locator", None),
+        confidence=getattr(chunk, "confidence", None),
+        tags=list(getattr(chunk, "tags", ())),
+    )
+
+
+class _RecordCommand(QUndoCommand):
+    """Base for commands editing person.accepted; every change is reported to `log` as a set/unset op."""
+    op = ""
+
+    def __init__(self, text: str, person: Person, log: Optional[OpLog] = None):
+        super().__init__(text)
         self.person = person
+        self.log = log
+
+    def _apply(self, put: Dict[str, AcceptedChunk], drop: Collection[str] = (), undo: bool = False) -> None:
+        acc = self.person.accepted
+        for field in drop:
+            acc.pop(field, None)
+        acc.update(put)
+        if self.log is not None:
+            self.log(self.person, ("undo:" if undo else "") + self.op, put, drop)
+
+    def _restore(self, field: str, prev: Optional[AcceptedChunk]) -> None:
+        if prev is None:
+            self._apply({}, (field,), undo=True)
+        else:
+            self._apply({field: prev}, undo=True)
+
+
+class AcceptChunkCommand(_RecordCommand):
+    op = "accept"
+
+    def __init__(self, person: Person, chunk: DataChunk, log: Optional[OpLog] = None):
+        super().__init__(f"Accept {chunk.field}", person, log)
         self.chunk = chunk
         self._prev: AcceptedChunk | None = person.accepted.get(chunk.field)
 
     def redo(self) -> None:
-        self.person.accepted[self.chunk.field] = AcceptedChunk(
-            chunk_id=self.chunk.id,
-            field=self.chunk.field,
-            value=self.chunk.value,
-            source_id=self.chunk.source_id,
-            document_id=self.chunk.document_id,
-            exclusive_group=self.chunk.exclusive_group,
-        )
+        self._apply({self.chunk.field: to_accepted(self.chunk)})
 
     def undo(self) -> None:
-        if self._prev is None:
-            self.person.accepted.pop(self.chunk.field, None)
-        else:
-            self.person.accepted[self._prev.field] = self._prev
+        self._restore(self.chunk.field, self._prev)
 
 
-class ResolveConflictCommand(QUndoCommand):
+class ResolveConflictCommand(_RecordCommand):
     """Winner is either the existing accepted or the incoming chunk turned into an AcceptedChunk."""
-    def __init__(self, person: Person, current: AcceptedChunk, incoming: DataChunk, winner: AcceptedChunk):
-        super().__init__(f"Resolve conflict {incoming.field}")
-        self.person = person
+    op = "resolve"
+
+    def __init__(self, person: Person, current: AcceptedChunk, incoming: DataChunk, winner: AcceptedChunk,
+                 log: Optional[OpLog] = None):
+        super().__init__(f"Resolve conflict {incoming.field}", person, log)
         self.current = current
         self.incoming = incoming
         self.winner = winner
         self._before = current
 
     def redo(self) -> None:
-        self.person.accepted[self.winner.field] = self.winner
+        self._apply({self.winner.field: self.winner})
 
     def undo(self) -> None:
-        self.person.accepted[self._before.field] = self._before
+        self._apply({self._before.field: self._before}, undo=True)
 
 
-class RetractChunkCommand(QUndoCommand):
-    def __init__(self, person: Person, field: str):
-        super().__init__(f"Retract {field}")
-        self.person = person
+class RetractChunkCommand(_RecordCommand):
+    op = "retract"
+
+    def __init__(self, person: Person, field: str, log: Optional[OpLog] = None):
+        super().__init__(f"Retract {field}", person, log)
         self.field = field
         self._prev = person.accepted.get(field)
 
     def redo(self) -> None:
-        self.person.accepted.pop(self.field, None)
+        self._apply({}, (self.field,))
 
     def undo(self) -> None:
         if self._prev:
-            self.person.accepted[self.field] = self._prev
+            self._apply({self.field: self._prev}, undo=True)
+
+
+class AcceptManyCommand(_RecordCommand):
+    """Bulk accept as a single undo step; only the touched fields are remembered."""
+    op = "accept_many"
+
+    def __init__(self, person: Person, winners: Dict[str, AcceptedChunk], log: Optional[OpLog] = None):
+        super().__init__(f"Accept {len(winners)} field(s)", person, log)
+        self.winners = winners
+        self._prev: Dict[str, Optional[AcceptedChunk]] = {f: person.accepted.get(f) for f in winners}
+
+    def redo(self) -> None:
+        self._apply(self.winners)
+
+    def undo(self) -> None:
+        self._apply(
+            {f: prev for f, prev in self._prev.items() if prev is not None},
+            [f for f, prev in self._prev.items() if prev is None],
+            undo=True,
+        )
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import math
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .chunks import ChunkLike, ChunkRecord, ChunkTable
+from .decoding import read_chunk_table
+
+# Layout (little endian):
+#   header   MAGIC, version u16, reserved u16, n_docs u32, n_chunks u32, strings_off u64, strings_len u64
+#   docs     n_docs x (doc id ref, first chunk u32, count u32), sorted by doc id
+#   chunks   n_chunks x _CHUNK, grouped by document and sorted by offset_start; each row
+#            keeps its position in the source list, which is the order chunks are handed out in
+#   strings  utf-8 pool; a ref is (offset u32, length u32), length _NONE means None
+MAGIC = b"TIKC"
+VERSION = 2
+_HEADER = struct.Struct("<4sHHIIQQ")
+_DOC = struct.Struct("<IIII")
+# id, field, value, source, group, quote, locator, tags refs; offset_start, offset_end, source position, confidence
+_CHUNK = struct.Struct("<" + "II" * 8 + "IIId")
+_START_AT = 8 * 8  # byte offset of offset_start inside a chunk row
+_U32 = struct.Struct("<I")
+_NONE = 0xFFFFFFFF
+_TAG_SEP = "\x1f"
+
+PathLike = Union[str, Path]
+
+
+class CorpusError(ValueError):
+    pass
+
+
+class _Pool:
+    """Deduplicating string pool for the writer."""
+
+    def __init__(self) -> None:
+        self.parts: List[bytes] = []
+        self.size = 0
+        self.refs: Dict[str, Tuple[int, int]] = {}
+
+    def ref(self, s: Optional[str]) -> Tuple[int, int]:
+        if s is None:
+            return 0, _NONE
+        r = self.refs.get(s)
+        if r is None:
+            b = s.encode("utf-8")
+            r = self.refs[s] = (self.size, len(b))
+            self.parts.append(b)
+            self.size += len(b)
+        return r
+
+
+def write_corpus(path: PathLike, docs: Mapping[str, Iterable[ChunkLike]]) -> int:
+    """Write document id -> chunks as one corpus file (tmp file + rename). Returns the chunk count."""
+    path = Path(path)
+    pool = _Pool()
+    doc_rows: List[Tuple[str, int, int]] = []
+    chunk_rows: List[bytes] = []
+    for doc_id in sorted(docs):
+        # the renderer resolves overlaps first come, first served: keep each chunk's position
+        chunks = sorted(enumerate(docs[doc_id]), key=lambda ic: (ic[1].offset_start, ic[1].offset_end))
+        doc_rows.append((doc_id, len(chunk_rows), len(chunks)))
+        for pos, c in chunks:
+            refs = [
+                *pool.ref(c.id), *pool.ref(c.field), *pool.ref(c.value), *pool.ref(c.source_id),
+                *pool.ref(c.exclusive_group), *pool.ref(c.quote), *pool.ref(c.locator),
+                *pool.ref(_TAG_SEP.join(c.tags)),
+            ]
+            conf = math.nan if c.confidence is None else c.confidence
+            chunk_rows.append(_CHUNK.pack(*refs, c.offset_start, c.offset_end, pos, conf))
+    doc_bytes = [_DOC.pack(*pool.ref(d), first, n) for d, first, n in doc_rows]
+    strings_off = _HEADER.size + _DOC.size * len(doc_rows) + _CHUNK.size * len(chunk_rows)
+
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as fh:
+        fh.write(_HEADER.pack(MAGIC, VERSION, 0, len(doc_rows), len(chunk_rows), strings_off, pool.size))
+        fh.writelines(doc_bytes)
+        fh.writelines(chunk_rows)
+        fh.writelines(pool.parts)
+    os.replace(tmp, path)
+    return len(chunk_rows)
+
+
+def convert_json_dir(chunks_dir: PathLike, out: PathLike) -> int:
+    """Existing layout (one `<document id>.json` per document) -> corpus file."""
+    docs = {p.stem: read_chunk_table(p) for p in sorted(Path(chunks_dir).glob("*.json"))}
+    return write_corpus(out, docs)
+
+
+class ChunkCorpus:
+    """
+    Read side of the corpus, through mmap. Opening reads only the header and the
+    document index; a document's chunks are decoded on request, in O(chunks in doc),
+    and `chunks_in_range` bisects the position-sorted rows to decode just a window.
+    Both return chunks in their original (source list) order. The mapping keeps
+    the file as it was when opened; `fresh()` reopens it after a rewrite.
+    """
+
+    def __init__(self, path: PathLike):
+        self.path = Path(path)
+        self._fh = self.path.open("rb")
+        st = os.fstat(self._fh.fileno())
+        self._id = (st.st_ino, st.st_mtime_ns, st.st_size)
+        self.stamp = f"{st.st_mtime_ns}:{st.st_size}"  # same form as render_cache.file_stamp
+        try:
+            self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:  # empty file
+            self._fh.close()
+            raise CorpusError(f"{self.path}: not a chunk corpus") from e
+        self._view = memoryview(self._mm)
+        magic, version, _, n_docs, n_chunks, self._strings_off, _ = _HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise CorpusError(f"{self.path}: not a chunk corpus (v{VERSION})")
+        self.n_chunks = n_chunks
+        self._chunks_off = _HEADER.size + _DOC.size * n_docs
+        self._docs: Dict[str, Tuple[int, int]] = {}
+        for off, ln, first, n in _DOC.iter_unpack(self._view[_HEADER.size:self._chunks_off]):
+            self._docs[self._str(off, ln)] = (first, n)  # type: ignore[index]
+        self._starts: Dict[str, List[int]] = {}
+
+    def __enter__(self) -> "ChunkCorpus":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def fresh(self) -> "ChunkCorpus":
+        """This corpus, or a newly opened one if the file was rewritten since it was mapped."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return self
+        if (st.st_ino, st.st_mtime_ns, st.st_size) == self._id:
+            return self
+        # readers may still hold rows of the old mapping; it is released with its last view
+        return ChunkCorpus(self.path)
+
+    def close(self) -> None:
+        if self._fh.closed:
+            return
+        self._view.release()
+        self._mm.close()
+        self._fh.close()
+
+    def __contains__(self, document_id: str) -> bool:
+        return document_id in self._docs
+
+    def documents(self) -> List[str]:
+        return list(self._docs)
+
+    def count(self, document_id: str) -> int:
+        return self._docs.get(document_id, (0, 0))[1]
+
+    def _str(self, off: int, ln: int) -> Optional[str]:
+        if ln == _NONE:
+            return None
+        start = self._strings_off + off
+        return str(self._view[start:start + ln], "utf-8")
+
+    def _rows(self, first: int, n: int) -> memoryview:
+        start = self._chunks_off + first * _CHUNK.size
+        return self._view[start:start + n * _CHUNK.size]  # no copy
+
+    def _decode(self, document_id: str, rows: memoryview) -> List[ChunkRecord]:
+        s = self._str
+        out = []
+        for (i0, i1, f0, f1, v0, v1, s0, s1, g0, g1, q0, q1, l0, l1, t0, t1, st, en, pos, conf) in _CHUNK.iter_unpack(rows):
+            tags = s(t0, t1)
+            out.append((pos, ChunkRecord(
+                s(i0, i1), document_id, s(s0, s1), s(f0, f1), s(v0, v1), st, en,  # type: ignore[arg-type]
+                s(g0, g1), s(q0, q1), s(l0, l1), None if math.isnan(conf) else conf,
+                tags.split(_TAG_SEP) if tags else (),
+            )))
+        out.sort(key=lambda pc: pc[0])
+        return [c for _, c in out]
+
+    def chunks(self, document_id: str) -> ChunkTable:
+        first, n = self._docs.get(document_id, (0, 0))
+        return ChunkTable(self._decode(document_id, self._rows(first, n)))
+
+    def chunks_in_range(self, document_id: str, start: int, end: int) -> ChunkTable:
+        """Chunks whose offset_start falls in [start, end)."""
+        first, n = self._docs.get(document_id, (0, 0))
+        starts = self._starts.get(document_id)
+        if starts is None:
+            # one struct field per row; cheap next to decoding the strings
+            base = self._chunks_off + first * _CHUNK.size + _START_AT
+            starts = self._starts[document_id] = [
+                _U32.unpack_from(self._view, base + i * _CHUNK.size)[0] for i in range(n)
+            ]
+        lo, hi = bisect_left(starts, start), bisect_left(starts, end)
+        return ChunkTable(self._decode(document_id, self._rows(first + lo, hi - lo)))
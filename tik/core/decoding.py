@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, List, Tuple, Union
+
+from pydantic import TypeAdapter
+
+from .chunks import _FIELDS, ChunkRecord, ChunkTable
+from .models import Case, DataChunk, Document, Objective, Person, Source
+
+try:  # optional: noticeably faster on large chunk files
+    import orjson
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+    HAS_ORJSON = False
+
+Raw = Union[bytes, str]
+
+# Building an adapter compiles a validator; do it once per type, not per call
+CHUNKS = TypeAdapter(List[DataChunk])
+OBJECTIVES = TypeAdapter(List[Objective])
+SOURCES = TypeAdapter(List[Source])
+DOCUMENTS = TypeAdapter(List[Document])
+PEOPLE = TypeAdapter(List[Person])
+
+
+def loads(data: Raw) -> Any:
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def decode_chunks(data: Raw) -> List[DataChunk]:
+    # parsed and validated in one pass by pydantic-core; model_construct per row is slower than this
+    return CHUNKS.validate_json(data)
+
+
+def decode_chunk_table(data: Raw, trusted: bool = False) -> ChunkTable:
+    """
+    Chunk file -> records, validated like `decode_chunks` (extra keys ignored);
+    `trusted` skips the per-row checks for pre-verified corpora.
+    """
+    if not trusted:
+        return ChunkTable.from_models(CHUNKS.validate_json(data))
+    return ChunkTable(ChunkRecord(**{k: d[k] for k in _FIELDS if k in d}) for d in loads(data))
+
+
+def case_from_payload(data: dict) -> Case:
+    case = Case.model_validate(data["case"])
+    case._objectives = OBJECTIVES.validate_python(data.get("objectives", []))  # type: ignore[attr-defined]
+    return case
+
+
+def decode_case(data: Raw) -> Case:
+    return case_from_payload(loads(data))
+
+
+def read_chunks(path: Path) -> List[DataChunk]:
+    return decode_chunks(path.read_bytes())
+
+
+def read_chunk_table(path: Path, trusted: bool = False) -> ChunkTable:
+    return decode_chunk_table(path.read_bytes(), trusted)
@@ -1,66 +1,368 @@
 from __future__ import annotations
 
+import io
+import re
+from bisect import bisect_right
+from collections import deque
+from functools import lru_cache
 from html import escape
-from typing import List, Tuple
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, TextIO, Tuple
 
-from .models import DataChunk
+from .chunks import ChunkLike
 
+# bump whenever the rendered markup changes: persisted render caches are keyed on it
+RENDERER_VERSION = 1
 
-def _safe_html(html: str) -> str:
-    allowed = {"b", "i", "em", "strong", "u", "p", "br", "ul", "ol", "li", "span"}
-    out: list[str] = []
-    i = 0
-    while i < len(html):
-        ch = html[i]
-        if ch == "<":
-            j = html.find(">", i + 1)
+_ALLOWED_TAGS = frozenset({"b", "i", "em", "strong", "u", "p", "br", "ul", "ol", "li", "span"})
+# "<" up to the first ">" — identical to the old `html.find(">", i + 1)` scan.
+# split() yields [text, tag, inner, text, tag, inner, ..., text].
+_TAG_RE = re.compile(r"(<([^>]*)>)")
+_MAX_ALLOWED_NAME = max(len(t) for t in _ALLOWED_TAGS)
+# escape() leaves control characters alone, so text runs can be escaped in one call
+_SEP = "\x00"
+_BLOCK = 1 << 14
+# longest tag the streaming sanitizer holds back; longer ones are escaped, allowed or not
+_MAX_TAG = 1 << 20
+# above this many stale chunk values, relocate them with one multi-pattern scan
+_FIND_LIMIT = 8
+
+
+@lru_cache(maxsize=4096)
+def _is_allowed(inner: str) -> bool:
+    parts = inner.strip().strip("/").split(None, 1)
+    return bool(parts) and parts[0].lower() in _ALLOWED_TAGS
+
+
+def _sanitize_block(html: str) -> str:
+    parts = _TAG_RE.split(html)
+    if len(parts) == 1:
+        return escape(html)
+    texts, tags = parts[0::3], parts[1::3]
+    allowed = list(map(_is_allowed, parts[2::3]))
+    if _SEP in html:
+        escaped = [escape(t) for t in texts]
+    else:
+        escaped = escape(_SEP.join(texts)).split(_SEP)
+    if not all(allowed):
+        tags = [t if ok else escape(t) for t, ok in zip(tags, allowed)]
+    out = [""] * (len(escaped) + len(tags))
+    out[0::2] = escaped
+    out[1::2] = tags
+    return "".join(out)
+
+
+def _rejected_early(carry: str) -> bool:
+    """True if the unterminated tag in `carry` can no longer turn into an allowed one."""
+    head = carry[1:].lstrip().lstrip("/")
+    parts = head.split(None, 1)
+    if not parts:
+        return False
+    token = parts[0]
+    if len(parts) == 2 or head[-1].isspace():
+        # name is delimited; only a trailing "/" may still be stripped from it
+        return not ({token.lower(), token.rstrip("/").lower()} & _ALLOWED_TAGS)
+    prefix = token.rstrip("/").lower()
+    return len(prefix) > _MAX_ALLOWED_NAME or not any(t.startswith(prefix) for t in _ALLOWED_TAGS)
+
+
+def iter_safe_html(stream: TextIO, chunk_size: int = _BLOCK, max_tag: int = _MAX_TAG) -> Iterator[str]:
+    """
+    Streaming variant of `_safe_html` over a text file-like object.
+    Concatenating the pieces gives exactly `_safe_html(stream.read())`; memory stays
+    bounded by `chunk_size` plus `max_tag`. A tag longer than `max_tag` (an allowed tag
+    with a huge attribute, say) is escaped as text.
+    """
+    carry = ""
+    skipping = False  # inside a rejected tag that was flushed before its ">"
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        if skipping:
+            j = block.find(">")
             if j == -1:
-                out.append(escape(html[i:]))
+                yield escape(block)
+                continue
+            yield escape(block[: j + 1])
+            block = block[j + 1 :]
+            skipping = False
+        buf = carry + block if carry else block
+        # every "<" before the last ">" is closed; anything from the next "<" on waits
+        tail = buf.find("<", buf.rfind(">") + 1)
+        if tail == -1:
+            tail = len(buf)
+        out = [_sanitize_block(buf[:tail])] if tail else []
+        carry = buf[tail:]
+        if len(carry) > chunk_size and (len(carry) > max_tag or _rejected_early(carry)):
+            out.append(escape(carry))
+            carry, skipping = "", True
+        if out:
+            yield "".join(out)
+    if carry:
+        yield escape(carry)
+
+
+def _safe_html(html: str) -> str:
+    if len(html) <= _BLOCK:
+        return _sanitize_block(html)
+    # block-wise is faster than one huge split() on multi-MB documents; the whole string
+    # is in memory already, so no tag is too long to hold
+    return "".join(iter_safe_html(io.StringIO(html), max_tag=len(html)))
+
+
+def _first_occurrences(text: str, patterns: Iterable[str]) -> Dict[str, int]:
+    """
+    Index of the first occurrence of every pattern found in `text`, in one
+    Aho–Corasick pass that stops as soon as all patterns have been seen.
+    """
+    pats = set(patterns)
+    found: Dict[str, int] = {"": 0} if "" in pats else {}
+    pats.discard("")
+    if not pats:
+        return found
+    goto: List[Dict[str, int]] = [{}]
+    out: List[List[str]] = [[]]
+    for p in pats:
+        state = 0
+        for ch in p:
+            nxt = goto[state].get(ch)
+            if nxt is None:
+                nxt = goto[state][ch] = len(goto)
+                goto.append({})
+                out.append([])
+            state = nxt
+        out[state].append(p)
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for ch, nxt in goto[state].items():
+            queue.append(nxt)
+            f = fail[state]
+            while f and ch not in goto[f]:
+                f = fail[f]
+            fail[nxt] = goto[f].get(ch, 0)
+            out[nxt] = out[nxt] + out[fail[nxt]]
+    # from the root state, jump straight to the next character that starts a pattern
+    first = re.compile("[" + "".join(re.escape(ch) for ch in goto[0]) + "]")
+    total = len(pats) + len(found)
+    state, i, n = 0, 0, len(text)
+    while i < n:
+        if state == 0:
+            m = first.search(text, i)
+            if m is None:
                 break
-            tag = html[i + 1 : j].strip().strip("/")
-            tag_name = tag.split()[0].lower() if tag else ""
-            out.append(html[i:j+1] if tag_name in allowed else escape(html[i:j+1]))
-            i = j + 1
-        else:
-            out.append(escape(ch)); i += 1
-    return "".join(out)
+            i = m.start()
+        ch = text[i]
+        while state and ch not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(ch, 0)
+        for p in out[state]:
+            if p not in found:
+                found[p] = i - len(p) + 1
+                if len(found) == total:
+                    return found
+        i += 1
+    return found
 
 
-def _ranges(safe: str, chunks: List[DataChunk]) -> List[Tuple[int, int, DataChunk]]:
-    res: List[Tuple[int, int, DataChunk]] = []
-    def overlap(a,b,c,d): return max(a,c) < min(b,d)
+def _locate(safe: str, values: Set[str]) -> Dict[str, int]:
+    # a handful of str.find calls beats a Python-level scan; many values do not
+    if len(values) <= _FIND_LIMIT:
+        found = {v: safe.find(v) for v in values}
+        return {v: i for v, i in found.items() if i != -1}
+    return _first_occurrences(safe, values)
+
+
+def _ranges(safe: str, chunks: Sequence[ChunkLike]) -> List[Tuple[int, int, ChunkLike]]:
+    """
+    Resolve chunk offsets against `safe`, first come first served.
+    Stale offsets are relocated to the first occurrence of the chunk value, and
+    chunks overlapping an already accepted range are dropped.
+    """
+    n = len(safe)
+    spans: List[Optional[Tuple[int, int]]] = []
+    stale: Set[str] = set()
     for c in chunks:
         st, en = c.offset_start, c.offset_end
-        ok = 0 <= st < en <= len(safe) and c.value in safe[st:en]
-        if not ok:
-            idx = safe.find(c.value)
-            if idx != -1:
-                st, en = idx, idx + len(c.value)
-            else:
+        if 0 <= st < en <= n and c.value in safe[st:en]:
+            spans.append((st, en))
+        else:
+            spans.append(None)
+            stale.add(c.value)
+    relocated = _locate(safe, stale) if stale else {}
+
+    res: List[Tuple[int, int, ChunkLike]] = []
+    # accepted non-empty ranges are disjoint, so sorting by start also sorts the ends
+    starts: List[int] = []
+    ends: List[int] = []
+    for c, span in zip(chunks, spans):
+        if span is None:
+            idx = relocated.get(c.value)
+            if idx is None:
+                continue
+            span = (idx, idx + len(c.value))
+        st, en = span
+        if st < en:
+            k = bisect_right(starts, st)
+            if (k and ends[k - 1] > st) or (k < len(starts) and starts[k] < en):
                 continue
-        if any(overlap(st,en,x,y) for x,y,_ in res): continue
-        res.append((st,en,c))
-    return sorted(res, key=lambda t:t[0])
+            starts.insert(k, st)
+            ends.insert(k, en)
+        res.append((st, en, c))
+    res.sort(key=itemgetter(0))
+    return res
 
 
-def wrap_chunks_into_html(html: str, chunks: List[DataChunk]) -> str:
-    safe = _safe_html(html)
-    ranges = _ranges(safe, chunks)
+def _span_open(c: ChunkLike) -> str:
+    attrs = (
+        f'data-chunk-id="{c.id}" data-field="{c.field}" data-value="{escape(c.value)}" '
+        f'data-source-id="{c.source_id}" data-document-id="{c.document_id}" '
+        f'data-exclusive-group="{escape(c.exclusive_group or "")}" '
+        f'data-quote="{escape(c.quote or c.value)}" '
+        f'data-locator="{escape(c.locator or "")}" '
+        f'data-confidence="{"" if c.confidence is None else c.confidence}"'
+    )
+    return f'<span class="chunk" draggable="true" {attrs}>'
+
+
+def _wrap(safe: str, ranges: Sequence[Tuple[int, int, ChunkLike]], start: int = 0, end: Optional[int] = None) -> str:
+    """Wrap `ranges` (sorted, disjoint, inside [start, end)) of `safe[start:end]` in chunk spans."""
+    end = len(safe) if end is None else end
     out: list[str] = []
-    cur = 0
+    cur = start
     for st, en, c in ranges:
         if cur < st: out.append(safe[cur:st])
-        attrs = (
-            f'data-chunk-id="{c.id}" data-field="{c.field}" data-value="{escape(c.value)}" '
-            f'data-source-id="{c.source_id}" data-document-id="{c.document_id}" '
-            f'data-exclusive-group="{escape(c.exclusive_group or "")}" '
-            f'data-quote="{escape(c.quote or c.value)}" '
-            f'data-locator="{escape(c.locator or "")}" '
-            f'data-confidence="{"" if c.confidence is None else c.confidence}"'
-        )
-        out.append(f'<span class="chunk" draggable="true" {attrs}>')
+        out.append(_span_open(c))
         out.append(safe[st:en])
         out.append("</span>")
         cur = en
-    if cur < len(safe): out.append(safe[cur:])
+    if cur < end: out.append(safe[cur:end])
     return "".join(out)
+
+
+def wrap_chunks_into_html(html: str, chunks: Sequence[ChunkLike]) -> str:
+    safe = _safe_html(html)
+    return _wrap(safe, _ranges(safe, chunks))
+
+
+# --- windowed rendering for very large documents ---
+WINDOW_CHARS = 64 * 1024
+_BREAKS = ("</p>", "</li>", "<br>", "<br/>", "\n")
+
+
+def _cut_points(safe: str, ranges: Sequence[Tuple[int, int, ChunkLike]], size: int) -> List[int]:
+    """
+    Window boundaries roughly every `size` chars of `safe`: preferably right after a
+    paragraph/line break, never inside a tag, an entity or a chunk range.
+    """
+    n = len(safe)
+    starts = [st for st, _, _ in ranges]
+    cuts = [0]
+    while n - cuts[-1] > size:
+        prev = cuts[-1]
+        target = prev + size
+        lo = target - size // 4
+        found = [i + len(b) for b in _BREAKS if (i := safe.rfind(b, lo, target)) != -1]
+        cut = max(found, default=target)
+        lt = safe.rfind("<", prev, cut)
+        if lt > safe.rfind(">", prev, cut):
+            cut = lt  # inside a tag
+        amp = safe.rfind("&", max(prev, cut - 10), cut)
+        if amp != -1 and safe.find(";", amp, cut) == -1:
+            cut = amp  # inside an entity
+        k = bisect_right(starts, cut) - 1
+        if k >= 0 and ranges[k][0] < cut < ranges[k][1]:
+            cut = ranges[k][0] if ranges[k][0] > prev else ranges[k][1]
+        if cut <= prev:
+            cut = target
+        cuts.append(cut)
+    cuts.append(n)
+    return cuts
+
+
+_ELEMENT_RE = re.compile(r"<(/?)\s*([A-Za-z]+)[^>]*>")
+_CLOSES_P = frozenset({"p", "ul", "ol", "li"})
+
+
+def _open_elements(safe: str, cuts: Sequence[int]) -> List[Tuple[Tuple[str, str], ...]]:
+    """
+    Elements still open at each of `cuts` (sorted), outermost first, as (name, start tag).
+    Follows the parser closely enough for the allowed tags: <p>/<ul>/<ol>/<li> close an
+    open <p>, <li> closes the previous item of its list, unmatched end tags are ignored.
+    """
+    stack: List[Tuple[str, str]] = []
+    out: List[Tuple[Tuple[str, str], ...]] = []
+    k = 0
+    for m in _ELEMENT_RE.finditer(safe):
+        while k < len(cuts) and cuts[k] <= m.start():
+            out.append(tuple(stack))
+            k += 1
+        name = m.group(2).lower()
+        if name not in _ALLOWED_TAGS:
+            continue
+        names = [n for n, _ in stack]
+        if m.group(1):
+            if name in names:
+                del stack[len(names) - 1 - names[::-1].index(name):]
+            continue
+        if name in _CLOSES_P and "p" in names:
+            del stack[len(names) - 1 - names[::-1].index("p"):]
+            names = [n for n, _ in stack]
+        if name == "li" and "li" in names:
+            at = len(names) - 1 - names[::-1].index("li")
+            if not {"ul", "ol"} & set(names[at:]):
+                del stack[at:]
+        if name != "br" and not m.group(0).endswith("/>"):
+            stack.append((name, m.group(0)))
+    out.extend(tuple(stack) for _ in range(k, len(cuts)))
+    return out
+
+
+class WindowedDocument:
+    """
+    A rendered document split into offset-aligned windows of the sanitized HTML,
+    with chunk ranges pre-bucketed per window. `render(i)` costs O(window), so a
+    reader can materialize only the windows near the viewport. Each window parses
+    on its own: elements open across a boundary are re-opened at the start of the
+    next window and closed at the end of the previous one; without those, the
+    windows concatenate to exactly `wrap_chunks_into_html`.
+    """
+
+    def __init__(self, document_id: str, safe: str, ranges: Sequence[Tuple[int, int, ChunkLike]],
+                 window_chars: int = WINDOW_CHARS):
+        self.document_id = document_id
+        self._safe = safe
+        self.bounds = _cut_points(safe, ranges, window_chars)
+        self._open = _open_elements(safe, self.bounds)
+        self._buckets: List[List[Tuple[int, int, ChunkLike]]] = [[] for _ in range(len(self))]
+        starts = self.bounds[1:-1]
+        for r in ranges:
+            self._buckets[bisect_right(starts, r[0])].append(r)
+
+    def __len__(self) -> int:
+        return len(self.bounds) - 1
+
+    def lengths(self) -> List[int]:
+        """Characters per window, e.g. for placeholder heights."""
+        return [b - a for a, b in zip(self.bounds, self.bounds[1:])]
+
+    def chunks(self, i: int) -> List[ChunkLike]:
+        return [c for _, _, c in self._buckets[i]]
+
+    def frame(self, i: int) -> Tuple[str, str]:
+        """Start tags re-opened before window i and end tags closing it."""
+        head = "".join(tag for _, tag in self._open[i])
+        tail = "".join(f"</{name}>" for name, _ in reversed(self._open[i + 1]))
+        return head, tail
+
+    def render(self, i: int) -> str:
+        head, tail = self.frame(i)
+        return head + _wrap(self._safe, self._buckets[i], self.bounds[i], self.bounds[i + 1]) + tail
+
+
+def render_windows(document_id: str, html: str, chunks: Sequence[ChunkLike],
+                   window_chars: int = WINDOW_CHARS) -> WindowedDocument:
+    safe = _safe_html(html)
+    return WindowedDocument(document_id, safe, _ranges(safe, chunks), window_chars)
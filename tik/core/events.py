@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+from .store import Store
+
+
+class AdvisorPump(QObject):
+    """
+    Schedules `Store.poll_events`.
+    Without traffic the poll interval doubles up to `max_interval`; any delivered
+    batch drops it back to `min_interval`. Push streams call `wake()` (from any
+    thread) to drain their buffer right away instead of waiting for the timer.
+    """
+    _wake = pyqtSignal()
+
+    def __init__(self, store: Store, min_interval: int = 250, max_interval: int = 30_000, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.store = store
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self._delivered = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._tick)
+        self._wake.connect(self._tick, Qt.ConnectionType.QueuedConnection)
+        store.advisorEvents.connect(self._on_events)
+
+    def start(self) -> None:
+        self._timer.start(self.interval)
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def wake(self) -> None:
+        self._wake.emit()
+
+    def _on_events(self, _events) -> None:
+        self._delivered = True
+
+    def _tick(self) -> None:
+        self.store.poll_events()
+        # async services deliver after this returns; their batch counts for the next tick
+        if self._delivered:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * 2, self.max_interval)
+        self._delivered = False
+        self._timer.start(self.interval)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import heapq
+import threading
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .chunks import ChunkKey, ChunkLike
+
+_EDGE_PUNCT = " \t\n.,;:!?\"'()[]"
+
+# (field, normalized value)
+ValueKey = Tuple[str, str]
+
+
+def normalize_value(value: str) -> str:
+    """Form used to match values across documents: NFKC, casefolded, whitespace collapsed, edge punctuation dropped."""
+    return " ".join(unicodedata.normalize("NFKC", value).casefold().split()).strip(_EDGE_PUNCT)
+
+
+@dataclass
+class Evidence:
+    """
+    What the rest of the case says about a value: chunks with the same field + value
+    (corroborating) and chunks of the same exclusive group with another value
+    (conflicting). Document counts are exact; chunk lists are capped samples.
+    """
+    corroborating: List[ChunkLike] = field(default_factory=list)
+    conflicting: List[ChunkLike] = field(default_factory=list)
+    corroborating_documents: int = 0
+    conflicting_documents: int = 0
+    conflicting_values: List[Tuple[str, int]] = field(default_factory=list)  # (value, documents), most seen first
+
+    def summary(self) -> str:
+        text = (f"same value in {self.corroborating_documents} document(s), "
+                f"conflicting value in {self.conflicting_documents}")
+        if self.conflicting_values:
+            text += " (" + ", ".join(f"{v}: {n}" for v, n in self.conflicting_values[:3]) + ")"
+        return text
+
+
+class EvidenceIndex:
+    """
+    Chunks of a case keyed by (field, normalized value) and by exclusive_group.
+    Documents are added as their chunk files load; re-adding a document replaces
+    its chunks. Safe to fill from a worker thread while the GUI queries it.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._by_value: Dict[ValueKey, Dict[ChunkKey, ChunkLike]] = {}
+        self._value_docs: Dict[ValueKey, Counter] = {}  # key -> document -> chunks
+        # group -> key -> document -> chunks of that key in that group; a field without a group is its own group
+        self._by_group: Dict[str, Dict[ValueKey, Counter]] = {}
+        self._group_docs: Dict[str, Counter] = {}  # group -> document -> chunks
+        self._docs: Dict[str, List[Tuple[str, ValueKey, str]]] = {}  # document -> (chunk id, key, group)
+
+    @staticmethod
+    def _group(field: str, exclusive_group: Optional[str]) -> str:
+        return exclusive_group or "field:" + field
+
+    def __contains__(self, document_id: str) -> bool:
+        return document_id in self._docs
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add_document(self, document_id: str, chunks: Iterable[ChunkLike]) -> None:
+        with self._lock:
+            self.remove_document(document_id)
+            entries = self._docs[document_id] = []
+            for c in chunks:
+                key = (c.field, normalize_value(c.value))
+                group = self._group(c.field, c.exclusive_group)
+                self._by_value.setdefault(key, {})[(document_id, c.id)] = c
+                self._value_docs.setdefault(key, Counter())[document_id] += 1
+                self._by_group.setdefault(group, {}).setdefault(key, Counter())[document_id] += 1
+                self._group_docs.setdefault(group, Counter())[document_id] += 1
+                entries.append((c.id, key, group))
+
+    def remove_document(self, document_id: str) -> None:
+        with self._lock:
+            for chunk_id, key, group in self._docs.pop(document_id, ()):
+                self._by_value[key].pop((document_id, chunk_id), None)
+                _decrement(self._value_docs[key], document_id)
+                _decrement(self._group_docs[group], document_id)
+                in_group = self._by_group[group]
+                _decrement(in_group[key], document_id)
+                if not in_group[key]:
+                    del in_group[key]
+                if not self._by_value[key]:
+                    del self._by_value[key], self._value_docs[key]
+                if not self._group_docs[group]:
+                    del self._group_docs[group], self._by_group[group]
+
+    def same_value(self, field: str, value: str) -> List[ChunkLike]:
+        with self._lock:
+            return list(self._by_value.get((field, normalize_value(value)), {}).values())
+
+    def evidence(self, field: str, value: str, exclusive_group: Optional[str] = None,
+                 exclude: Iterable[ChunkKey] = (), limit: int = 50) -> Evidence:
+        """Corroborating/conflicting evidence for `value` of `field`; (document, chunk id) pairs in `exclude` are left out."""
+        key = (field, normalize_value(value))
+        group = self._group(field, exclusive_group)
+        skip = set(exclude)
+        with self._lock:
+            same = self._by_value.get(key, {})
+            own = self._value_docs.get(key, Counter())
+            # a left-out chunk only removes its document if it was the document's only one
+            n_agree = len(own) - sum(1 for doc, _ in skip & same.keys() if own[doc] == 1)
+            agree = [c for ck, c in islice(same.items(), limit + len(skip)) if ck not in skip][:limit]
+
+            in_group = self._group_docs.get(group, Counter())
+            keys = self._by_group.get(group, {})
+            own_in_group = keys.get(key, Counter())
+            # documents with at least one chunk of this group that holds another value
+            n_conflict = sum(1 for d, n in in_group.items() if n > own_in_group.get(d, 0))
+            others = [(k, len(d)) for k, d in keys.items() if k != key]
+            top = heapq.nlargest(10, others, key=lambda kv: kv[1])
+            values = [(next(iter(self._by_value[k].values())).value, n) for k, n in top]
+            disagree: List[ChunkLike] = []
+            for k, _ in top:
+                # the value may also occur outside this group; only its chunks in the group conflict
+                disagree.extend(c for ck, c in islice(self._by_value[k].items(), limit + len(skip))
+                                if ck not in skip and self._group(c.field, c.exclusive_group) == group)
+                if len(disagree) >= limit:
+                    break
+        return Evidence(agree, disagree[:limit], n_agree, n_conflict, values)
+
+
+def _decrement(counter: Counter, k: str) -> None:
+    counter[k] -= 1
+    if counter[k] <= 0:
+        del counter[k]
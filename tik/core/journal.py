@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import IO, Collection, Dict, List, Optional
+
+from loguru import logger
+
+from .models import AcceptedChunk, Case, Person
+from .persistence import load_record_json, save_record_json
+
+
+def log_path_for(path: Path) -> Path:
+    return path.with_name(path.name + ".log")
+
+
+def replay(path: Path) -> dict:
+    """
+    Snapshot at `path` with its journal applied, as a record dict (accepted values stay plain dicts).
+    Entries hold absolute values, so replaying ones already folded into the snapshot is harmless;
+    a torn last line from a crash is skipped.
+    """
+    path = Path(path)
+    data = load_record_json(path) if path.exists() else {"version": 1, "accepted": {}}
+    accepted: Dict[str, dict] = data.setdefault("accepted", {})
+    log = log_path_for(path)
+    if not log.exists():
+        return data
+    with log.open("r", encoding="utf-8") as fh:
+        for n, line in enumerate(fh, 1):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                logger.warning("Skipping unreadable journal line {} in {}", n, log)
+                continue
+            for field in entry.get("unset", ()):
+                accepted.pop(field, None)
+            accepted.update(entry.get("set") or {})
+    return data
+
+
+class RecordJournal:
+    """
+    Record persistence as snapshot + append-only log.
+    The snapshot at `path` has the save_record_json format; every accept/retract/resolve
+    (and its undo) becomes one JSON line, held until the next explicit save (`sync`) appends
+    the pending lines to `<path>.log`, so a save costs the edits made since the last one.
+    Once the log holds `compact_every` entries it is folded into a fresh snapshot.
+    """
+
+    def __init__(self, path: Path, case: Case, person: Person, compact_every: int = 1000, fsync: bool = False):
+        self.path = Path(path)
+        self.log_path = log_path_for(self.path)
+        self.case = case
+        self.person = person
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.entries = 0
+        self._pending: List[str] = []  # lines of edits not saved yet
+        self._fh: Optional[IO[str]] = None
+
+    @classmethod
+    def create(cls, path: Path, case: Case, person: Person, **kw) -> "RecordJournal":
+        """Start from a full snapshot of `person`; any old log at `path` is discarded."""
+        j = cls(path, case, person, **kw)
+        j.compact()
+        return j
+
+    @classmethod
+    def resume(cls, path: Path, case: Case, person: Person, **kw) -> "RecordJournal":
+        """Keep appending to an existing journal whose replayed state `person` already holds."""
+        j = cls(path, case, person, **kw)
+        if j.log_path.exists():
+            raw = j.log_path.read_bytes()
+            end = raw.rfind(b"\n") + 1
+            if end < len(raw):
+                # drop a torn tail so the next entry starts on its own line
+                with j.log_path.open("r+b") as fh:
+                    fh.truncate(end)
+            j.entries = raw.count(b"\n")
+        return j
+
+    def append(self, op: str, put: Dict[str, AcceptedChunk], drop: Collection[str] = ()) -> None:
+        entry: dict = {"op": op}
+        if drop:
+            entry["unset"] = list(drop)
+        if put:
+            entry["set"] = {f: ac.model_dump() for f, ac in put.items()}
+        self._pending.append(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    @property
+    def dirty(self) -> bool:
+        """Edits made since the last save."""
+        return bool(self._pending)
+
+    def sync(self) -> None:
+        """Save: append the pending edits to the log, compacting once it is long enough."""
+        if not self._pending:
+            return
+        if self.entries + len(self._pending) >= self.compact_every:
+            self.compact()
+            return
+        fh = self._handle()
+        fh.writelines(self._pending)
+        fh.flush()
+        if self.fsync:
+            os.fsync(fh.fileno())
+        self.entries += len(self._pending)
+        self._pending.clear()
+
+    def compact(self) -> None:
+        """Fold the log and pending edits into a new snapshot (atomic rename), then start an empty log."""
+        save_record_json(self.path, self.case, self.person)
+        self.close()
+        self._fh = self.log_path.open("w", encoding="utf-8")
+        self.entries = 0
+        self._pending.clear()
+        logger.debug("Compacted record journal {}", self.path)
+
+    def close(self) -> None:
+        """Stop journaling; edits not saved yet are dropped."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def _handle(self) -> IO[str]:
+        if self._fh is None:
+            self._fh = self.log_path.open("a", encoding="utf-8")
+        return self._fh
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from loguru import logger
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+
+from .document_renderer import WindowedDocument
+from .services.base import DocumentService
+
+
+class _LoadTask(QRunnable):
+    def __init__(self, loader: "DocumentLoader", generation: int, document_id: str, prefetch: bool):
+        super().__init__()
+        self.loader = loader
+        self.generation = generation
+        self.document_id = document_id
+        self.prefetch = prefetch
+
+    def run(self) -> None:
+        # selection moved on while we were queued
+        if self.generation != self.loader.generation:
+            return
+        try:
+            svc = self.loader.doc_svc
+            result: object = svc.load_document_windows(self.document_id) or svc.load_document_html_and_chunks(self.document_id)
+        except Exception as e:  # reported on the GUI thread
+            result = e
+        if not self.prefetch:
+            self.loader._finished.emit(self.generation, self.document_id, result)
+
+
+class DocumentLoader(QObject):
+    """
+    Renders documents on a worker pool and reports back on the GUI thread.
+    Each `load` starts a new generation: queued work from older generations is
+    dropped and late results are ignored. Prefetches only warm the document
+    service cache.
+    """
+    loaded = pyqtSignal(str, str, list)  # (document id, html, chunks)
+    windowed = pyqtSignal(str, object)  # (document id, WindowedDocument) for very large documents
+    failed = pyqtSignal(str, str)  # (document id, error)
+    _finished = pyqtSignal(int, str, object)  # emitted from worker threads
+
+    def __init__(self, doc_svc: DocumentService, parent: Optional[QObject] = None, max_threads: int = 2):
+        super().__init__(parent)
+        self.doc_svc = doc_svc
+        self.generation = 0
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._finished.connect(self._on_finished, Qt.ConnectionType.QueuedConnection)
+
+    def load(self, document_id: str) -> None:
+        self.cancel()
+        self.pool.start(_LoadTask(self, self.generation, document_id, prefetch=False))
+
+    def prefetch(self, document_ids: Iterable[str]) -> None:
+        for doc_id in document_ids:
+            self.pool.start(_LoadTask(self, self.generation, doc_id, prefetch=True))
+
+    def cancel(self) -> None:
+        self.generation += 1
+        self.pool.clear()  # drops tasks that have not started yet
+
+    def wait(self, msecs: int = -1) -> bool:
+        return self.pool.waitForDone(msecs)
+
+    def _on_finished(self, generation: int, document_id: str, result: object) -> None:
+        if generation != self.generation:
+            logger.debug("Dropping stale render of {}", document_id)
+            return
+        if isinstance(result, Exception):
+            logger.warning("Loading {} failed: {}", document_id, result)
+            self.failed.emit(document_id, str(result))
+            return
+        if isinstance(result, WindowedDocument):
+            self.windowed.emit(document_id, result)
+            return
+        html, chunks = result  # type: ignore[misc]
+        self.loaded.emit(document_id, html, chunks)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Literal
-from pydantic import BaseModel, Field
+import re
+from typing import List, Optional, Dict, Literal, Union
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class FieldDef(BaseModel):
@@ -33,6 +34,8 @@ class Document(BaseModel):
 
 
 class DataChunk(BaseModel):
+    model_config = ConfigDict(from_attributes=True)  # validates ChunkRecord / duck-typed chunks too
+
     id: str
     document_id: str
     source_id: str
@@ -74,11 +77,33 @@ class Case(BaseModel):
 
 class ObjectivePredicate(BaseModel):
     """
-    Minimal predicate: op='exists' với path như 'record.name' hoặc 'person.name'.
+    Predicate over accepted fields, path như 'record.name' hoặc 'person.name'.
     Ta chấp nhận cả 2 prefix để dùng cho nghiên cứu (record) lẫn điều tra (person).
+      exists       — field has a non-empty value
+      equals       — value == `value`
+      matches      — regex `value` found in value
+      confidence>= — confidence >= `value`
+      count        — at least `value` of `paths` (every field if empty) have a value
     """
-    op: Literal["exists"]
-    path: str
+    op: Literal["exists", "equals", "matches", "confidence>=", "count"]
+    path: str = ""
+    value: Optional[Union[str, float]] = None
+    paths: List[str] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def _check_operands(self) -> "ObjectivePredicate":
+        if self.op in ("exists", "equals", "matches", "confidence>=") and not self.path:
+            raise ValueError(f"'{self.op}' needs a path")
+        if self.op != "exists" and self.value is None:
+            raise ValueError(f"'{self.op}' needs a value")
+        if self.op in ("confidence>=", "count") and not isinstance(self.value, (int, float)):
+            raise ValueError(f"'{self.op}' needs a numeric value")
+        if self.op == "matches":
+            try:
+                re.compile(str(self.value))
+            except re.error as e:
+                raise ValueError(f"bad pattern for 'matches': {e}") from e
+        return self
 
 
 class ObjectiveExpr(BaseModel):
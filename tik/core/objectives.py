@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Collection, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from .models import AcceptedChunk, Objective, ObjectiveExpr, ObjectivePredicate, Person
+
+
+Accepted = Dict[str, AcceptedChunk]
+Check = Callable[[Accepted], bool]
+
+ANY_FIELD = "*"  # dependency of predicates that look at every accepted field
+
+# Relative cost used to order AND/OR operands so cheap checks short-circuit first
+_COST = {"exists": 1.0, "equals": 2.0, "confidence>=": 2.0, "count": 3.0, "matches": 8.0}
+
+
+def predicate_field(path: str) -> str:
+    # chấp nhận cả 'person.xxx' lẫn 'record.xxx'
+    return path.split(".", 1)[1] if "." in path else path
+
+
+def _always(result: bool) -> Check:
+    def check(acc: Accepted) -> bool:
+        return result
+    return check
+
+
+def _as_number(text: str) -> Optional[float]:
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _leaf(op: str, path: str, value: object, paths: Tuple[str, ...]) -> Check:
+    """Closure for one predicate; identical predicates across objectives share it."""
+    field = predicate_field(path)
+    if op == "exists":
+        def check(acc: Accepted) -> bool:
+            ac = acc.get(field)
+            return ac is not None and bool(ac.value)
+    elif op == "equals" and isinstance(value, (int, float)):
+        # numbers come in as floats ("1990" -> 1990.0): compare by value, not by text
+        number = float(value)
+        def check(acc: Accepted) -> bool:
+            ac = acc.get(field)
+            return ac is not None and _as_number(ac.value) == number
+    elif op == "equals":
+        target = str(value)
+        def check(acc: Accepted) -> bool:
+            ac = acc.get(field)
+            return ac is not None and ac.value == target
+    elif op == "matches":
+        search = re.compile(str(value)).search
+        def check(acc: Accepted) -> bool:
+            ac = acc.get(field)
+            return ac is not None and search(ac.value) is not None
+    elif op == "confidence>=":
+        threshold = float(value)  # type: ignore[arg-type]
+        def check(acc: Accepted) -> bool:
+            ac = acc.get(field)
+            return ac is not None and ac.confidence is not None and ac.confidence >= threshold
+    elif op == "count":
+        need = float(value)  # type: ignore[arg-type]
+        fields = tuple(predicate_field(p) for p in paths)
+        if fields:
+            def check(acc: Accepted) -> bool:
+                return sum(1 for f in fields if f in acc and acc[f].value) >= need
+        else:
+            def check(acc: Accepted) -> bool:
+                return sum(1 for ac in acc.values() if ac.value) >= need
+    else:
+        return _always(False)
+    return check
+
+
+def _leaf_deps(pred: ObjectivePredicate) -> FrozenSet[str]:
+    if pred.op == "count":
+        return frozenset(predicate_field(p) for p in pred.paths) or frozenset({ANY_FIELD})
+    return frozenset({predicate_field(pred.path)})
+
+
+def _compile(expr: ObjectiveExpr) -> Tuple[Check, float, FrozenSet[str]]:
+    """Return (closure, cost, field dependencies) for an expression tree."""
+    if expr.kind == "LEAF":
+        pred = expr.predicate
+        if pred is None:
+            return _always(False), 0.0, frozenset()
+        cost = _COST.get(pred.op, 1.0) + (len(pred.paths) if pred.op == "count" else 0)
+        return _leaf(pred.op, pred.path, pred.value, tuple(pred.paths)), cost, _leaf_deps(pred)
+
+    parts = sorted((_compile(c) for c in (expr.children or [])), key=lambda t: t[1])
+    checks = tuple(p[0] for p in parts)
+    cost = sum(p[1] for p in parts)
+    deps = frozenset().union(*(p[2] for p in parts))
+    if expr.kind == "AND":
+        if not checks:
+            return _always(True), 0.0, deps
+        if len(checks) == 1:
+            return checks[0], cost, deps
+        def all_of(acc: Accepted) -> bool:
+            for check in checks:
+                if not check(acc):
+                    return False
+            return True
+        return all_of, cost, deps
+    if expr.kind == "OR":
+        if len(checks) == 1:
+            return checks[0], cost, deps
+        def any_of(acc: Accepted) -> bool:
+            for check in checks:
+                if check(acc):
+                    return True
+            return False
+        return any_of, cost, deps
+    return _always(False), 0.0, deps
+
+
+@dataclass(frozen=True)
+class CompiledObjective:
+    objective: Objective
+    check: Check
+    fields: FrozenSet[str]
+    cost: float
+
+    def run(self, person: Person) -> bool:
+        return self.check(person.accepted)
+
+
+def apply_objective_status(objectives: Iterable[Objective], status: Mapping[str, bool]) -> bool:
+    """Set `satisfied` from an objective id -> status map; True if any flag changed."""
+    any_change = False
+    for obj in objectives:
+        if obj.id in status and status[obj.id] != obj.satisfied:
+            obj.satisfied = status[obj.id]
+            any_change = True
+    return any_change
+
+
+def compile_objective(obj: Objective) -> CompiledObjective:
+    check, cost, fields = _compile(obj.expr)
+    return CompiledObjective(obj, check, fields, cost)
+
+
+class ObjectiveIndex:
+    """Objectives compiled once, plus a field -> dependent objectives index."""
+
+    def __init__(self, objectives: List[Objective]):
+        self.compiled = [compile_objective(o) for o in objectives]
+        self.by_field: Dict[str, List[CompiledObjective]] = {}
+        for co in self.compiled:
+            for f in co.fields:
+                self.by_field.setdefault(f, []).append(co)
+
+    def dependents(self, changed: Collection[str]) -> List[CompiledObjective]:
+        wildcard = self.by_field.get(ANY_FIELD, [])
+        if len(changed) == 1 and not wildcard:
+            return self.by_field.get(next(iter(changed)), [])
+        seen: Dict[int, CompiledObjective] = {id(co): co for co in wildcard}
+        for f in changed:
+            for co in self.by_field.get(f, ()):
+                seen.setdefault(id(co), co)
+        return list(seen.values())
+
+    def evaluate(self, person: Person, changed: Optional[Collection[str]] = None) -> bool:
+        """Update `satisfied` flags; only objectives mentioning `changed` fields unless it is None."""
+        targets = self.compiled if changed is None else self.dependents(changed)
+        accepted = person.accepted
+        any_change = False
+        for co in targets:
+            obj = co.objective
+            now = co.check(accepted)
+            if now != obj.satisfied:
+                obj.satisfied = now
+                any_change = True
+        return any_change
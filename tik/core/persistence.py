@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Dict
 
@@ -12,17 +13,22 @@ def _serialize_person(person: Person) -> Dict[str, dict]:
     return {fid: ac.model_dump() for fid, ac in person.accepted.items()}
 
 
-def save_record_json(path: Path, case: Case, person: Person) -> None:
-    """Write current record (accepted fields) to JSON."""
-    data = {
+def record_dict(case: Case, person: Person) -> dict:
+    return {
         "version": 1,
         "case_id": case.id,
         "case_title": case.title,
         "person_id": person.id,
         "accepted": _serialize_person(person),
     }
+
+
+def save_record_json(path: Path, case: Case, person: Person) -> None:
+    """Write current record (accepted fields) to JSON; atomic, the old file survives a crash mid-write."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(record_dict(case, person), ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
 
 
 def load_record_json(path: Path) -> dict:
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Literal, Optional, Sequence, Union
+
+from .chunks import ChunkKey, ChunkLike
+from .models import AcceptedChunk
+
+
+ConflictPolicy = Literal["confidence", "newest", "source_priority"]
+_Held = Union[AcceptedChunk, ChunkLike]
+
+
+def _held_key(x: _Held) -> ChunkKey:
+    return x.document_id, (x.chunk_id if isinstance(x, AcceptedChunk) else x.id)
+
+
+def same_chunk(a: _Held, b: _Held) -> bool:
+    """Both refer to one chunk; chunk ids are only unique within their document."""
+    return _held_key(a) == _held_key(b)
+
+
+def _incoming_wins(current: _Held, incoming: ChunkLike, policy: ConflictPolicy, rank: Dict[str, int]) -> bool:
+    if policy == "newest":
+        return True
+    if policy == "confidence":
+        # unknown confidence loses against any known one; ties keep the current value
+        cur = -1.0 if current.confidence is None else current.confidence
+        new = -1.0 if incoming.confidence is None else incoming.confidence
+        return new > cur
+    if policy == "source_priority":
+        worst = len(rank)
+        return rank.get(incoming.source_id, worst) < rank.get(current.source_id, worst)
+    raise ValueError(f"unknown conflict policy: {policy!r}")
+
+
+def resolve_bulk(
+    accepted: Dict[str, AcceptedChunk],
+    chunks: Iterable[ChunkLike],
+    policy: ConflictPolicy = "confidence",
+    source_priority: Optional[Sequence[str]] = None,
+) -> Dict[str, ChunkLike]:
+    """
+    Replay `chunks` in order against `accepted` with the same rules as Store.request_accept,
+    settling exclusive_group conflicts by `policy` instead of asking the user.
+    Return field -> winning incoming chunk, for fields whose accepted value changes.
+    """
+    rank = {sid: i for i, sid in enumerate(source_priority or [])}
+    held: Dict[str, _Held] = {}
+    for c in chunks:
+        current = held.get(c.field) or accepted.get(c.field)
+        if (
+            current is not None
+            and current.exclusive_group
+            and c.exclusive_group
+            and current.exclusive_group == c.exclusive_group
+        ):
+            if same_chunk(current, c) or not _incoming_wins(current, c, policy, rank):
+                continue
+        held[c.field] = c
+    # outside a group the last chunk wins even when it is the one already accepted
+    return {f: c for f, c in held.items()  # type: ignore[misc]
+            if f not in accepted or not same_chunk(accepted[f], c)}
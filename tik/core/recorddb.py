@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Collection, Dict, Iterable, List, Optional, Tuple, Union
+
+from .decoding import OBJECTIVES as _OBJECTIVES
+from .models import AcceptedChunk, Case, Person
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cases (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    body TEXT NOT NULL              -- case JSON without people
+);
+CREATE TABLE IF NOT EXISTS case_imports (
+    case_id TEXT PRIMARY KEY REFERENCES cases(id) ON DELETE CASCADE,
+    stamp TEXT NOT NULL             -- stamp of the seed the case was imported from
+);
+CREATE TABLE IF NOT EXISTS people (
+    case_id TEXT NOT NULL REFERENCES cases(id) ON DELETE CASCADE,
+    id TEXT NOT NULL,
+    name TEXT,
+    body TEXT NOT NULL,             -- person JSON without accepted
+    PRIMARY KEY (case_id, id)
+);
+CREATE TABLE IF NOT EXISTS accepted (
+    case_id TEXT NOT NULL,
+    person_id TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    chunk_id TEXT NOT NULL,
+    source_id TEXT NOT NULL,
+    document_id TEXT NOT NULL,
+    exclusive_group TEXT,
+    quote TEXT,
+    locator TEXT,
+    confidence REAL,
+    tags TEXT NOT NULL DEFAULT '[]',
+    PRIMARY KEY (case_id, person_id, field),
+    FOREIGN KEY (case_id, person_id) REFERENCES people(case_id, id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS accepted_field_value ON accepted(field, value);
+CREATE INDEX IF NOT EXISTS accepted_value ON accepted(value);
+CREATE INDEX IF NOT EXISTS accepted_source ON accepted(source_id, field);
+CREATE INDEX IF NOT EXISTS accepted_document ON accepted(document_id, field);
+"""
+
+_COLS = ("field", "value", "chunk_id", "source_id", "document_id", "exclusive_group", "quote", "locator", "confidence", "tags")
+_INSERT = (
+    f"INSERT OR REPLACE INTO accepted (case_id, person_id, {', '.join(_COLS)}) "
+    f"VALUES (?, ?, {', '.join('?' * len(_COLS))})"
+)
+_INSERT_KEEP = _INSERT.replace("OR REPLACE", "OR IGNORE", 1)
+
+PersonKey = Tuple[str, str]  # (case id, person id)
+
+
+def _row(case_id: str, person_id: str, ac: AcceptedChunk) -> tuple:
+    return (
+        case_id, person_id, ac.field, ac.value, ac.chunk_id, ac.source_id, ac.document_id,
+        ac.exclusive_group, ac.quote, ac.locator, ac.confidence, json.dumps(ac.tags),
+    )
+
+
+def _accepted(row: sqlite3.Row) -> AcceptedChunk:
+    data = {c: row[c] for c in _COLS}
+    data["tags"] = json.loads(row["tags"])
+    return AcceptedChunk.model_validate(data)
+
+
+class RecordDB:
+    """
+    Embedded SQLite store for many cases and people.
+    Cases and people are listed without their accepted fields; `load_person`
+    fetches one record on demand. Accepted chunks keep full provenance and are
+    indexed by field, value, source and document for cross-record queries.
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        self.path = path
+        self.conn = sqlite3.connect(str(path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        if str(path) != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # ---- writes ----
+    def put_case(self, case: Case, stamp: Optional[str] = None, keep_accepted: bool = False) -> None:
+        """
+        Insert or replace a case together with its people and their accepted fields.
+        `stamp` records which seed it came from; with `keep_accepted`, fields already
+        accepted here win over those of `case` (re-importing an edited seed).
+        """
+        body = case.model_dump(exclude={"people"})
+        body["objectives"] = _OBJECTIVES.dump_python(getattr(case, "_objectives", []))
+        with self.conn:
+            # UPDATE, not INSERT OR REPLACE: replacing the row would cascade to its people
+            cur = self.conn.execute(
+                "UPDATE cases SET title = ?, body = ? WHERE id = ?",
+                (case.title, json.dumps(body, ensure_ascii=False), case.id),
+            )
+            if not cur.rowcount:
+                self.conn.execute(
+                    "INSERT INTO cases (id, title, body) VALUES (?, ?, ?)",
+                    (case.id, case.title, json.dumps(body, ensure_ascii=False)),
+                )
+            if stamp is not None:
+                self.conn.execute("INSERT OR REPLACE INTO case_imports VALUES (?, ?)", (case.id, stamp))
+            for p in case.people:
+                self._put_person(case.id, p, keep_accepted)
+
+    def save_person(self, case_id: str, person: Person) -> None:
+        with self.conn:
+            self._put_person(case_id, person)
+
+    def save_people(self, case_id: str, people: Iterable[Person]) -> int:
+        """Bulk import in one transaction; returns how many were written."""
+        n = 0
+        with self.conn:
+            for p in people:
+                self._put_person(case_id, p)
+                n += 1
+        return n
+
+    def _put_person(self, case_id: str, person: Person, keep_accepted: bool = False) -> None:
+        body = person.model_dump_json(exclude={"accepted"})
+        cur = self.conn.execute(
+            "UPDATE people SET name = ?, body = ? WHERE case_id = ? AND id = ?", (person.name, body, case_id, person.id)
+        )
+        if not cur.rowcount:
+            self.conn.execute(
+                "INSERT INTO people (case_id, id, name, body) VALUES (?, ?, ?, ?)", (case_id, person.id, person.name, body)
+            )
+        if not keep_accepted:
+            self.conn.execute("DELETE FROM accepted WHERE case_id = ? AND person_id = ?", (case_id, person.id))
+        self.conn.executemany(_INSERT_KEEP if keep_accepted else _INSERT,
+                              [_row(case_id, person.id, ac) for ac in person.accepted.values()])
+
+    def update_accepted(
+        self, case_id: str, person_id: str, put: Dict[str, AcceptedChunk], drop: Collection[str] = ()
+    ) -> None:
+        """Apply one edit (the same set/unset shape the undo commands log)."""
+        with self.conn:
+            if drop:
+                self.conn.executemany(
+                    "DELETE FROM accepted WHERE case_id = ? AND person_id = ? AND field = ?",
+                    [(case_id, person_id, f) for f in drop],
+                )
+            if put:
+                self.conn.executemany(_INSERT, [_row(case_id, person_id, ac) for ac in put.values()])
+
+    # ---- lazy reads ----
+    def case_ids(self) -> List[str]:
+        return [r[0] for r in self.conn.execute("SELECT id FROM cases ORDER BY id")]
+
+    def has_case(self, case_id: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM cases WHERE id = ?", (case_id,)).fetchone() is not None
+
+    def case_stamp(self, case_id: str) -> Optional[str]:
+        """Stamp of the seed the case was last imported from, if recorded."""
+        row = self.conn.execute("SELECT stamp FROM case_imports WHERE case_id = ?", (case_id,)).fetchone()
+        return row[0] if row else None
+
+    def load_case(self, case_id: str) -> Optional[Case]:
+        """Case with its people listed but their `accepted` maps left empty."""
+        row = self.conn.execute("SELECT body FROM cases WHERE id = ?", (case_id,)).fetchone()
+        if row is None:
+            return None
+        body = json.loads(row["body"])
+        objectives = _OBJECTIVES.validate_python(body.pop("objectives", []))
+        people = [
+            Person.model_validate_json(r["body"])
+            for r in self.conn.execute("SELECT body FROM people WHERE case_id = ? ORDER BY rowid", (case_id,))
+        ]
+        case = Case.model_validate({**body, "people": []})
+        case.people = people
+        case._objectives = objectives  # type: ignore[attr-defined]
+        return case
+
+    def load_accepted(self, case_id: str, person_id: str) -> Dict[str, AcceptedChunk]:
+        rows = self.conn.execute(
+            "SELECT * FROM accepted WHERE case_id = ? AND person_id = ?", (case_id, person_id)
+        )
+        return {r["field"]: _accepted(r) for r in rows}
+
+    def load_person(self, case_id: str, person_id: str) -> Optional[Person]:
+        row = self.conn.execute(
+            "SELECT body FROM people WHERE case_id = ? AND id = ?", (case_id, person_id)
+        ).fetchone()
+        if row is None:
+            return None
+        person = Person.model_validate_json(row["body"])
+        person.accepted = self.load_accepted(case_id, person_id)
+        return person
+
+    # ---- queries ----
+    def people_with(
+        self,
+        field: str,
+        *,
+        value: Optional[str] = None,
+        source_id: Optional[str] = None,
+        document_id: Optional[str] = None,
+        case_id: Optional[str] = None,
+    ) -> List[PersonKey]:
+        """People with an accepted `field`, optionally narrowed by value and provenance.
+
+        e.g. people_with("dob", source_id="s-001") — everyone whose dob came from s-001.
+        """
+        where, args = ["field = ?"], [field]
+        for col, v in (("value", value), ("source_id", source_id), ("document_id", document_id), ("case_id", case_id)):
+            if v is not None:
+                where.append(f"{col} = ?")
+                args.append(v)
+        sql = f"SELECT case_id, person_id FROM accepted WHERE {' AND '.join(where)} ORDER BY case_id, person_id"
+        return [(r[0], r[1]) for r in self.conn.execute(sql, args)]
+
+    def people_with_value(self, value: str) -> List[Tuple[str, str, str]]:
+        """(case id, person id, field) for every accepted field equal to `value`."""
+        rows = self.conn.execute(
+            "SELECT case_id, person_id, field FROM accepted WHERE value = ? ORDER BY case_id, person_id", (value,)
+        )
+        return [(r[0], r[1], r[2]) for r in rows]
+
+    def fields_from(self, *, source_id: Optional[str] = None, document_id: Optional[str] = None) -> List[AcceptedChunk]:
+        """Accepted chunks that cite a source and/or document."""
+        where, args = [], []
+        if source_id is not None:
+            where.append("source_id = ?")
+            args.append(source_id)
+        if document_id is not None:
+            where.append("document_id = ?")
+            args.append(document_id)
+        if not where:
+            raise ValueError("fields_from needs source_id or document_id")
+        return [_accepted(r) for r in self.conn.execute(f"SELECT * FROM accepted WHERE {' AND '.join(where)}", args)]
+
+    def count_people(self, case_id: Optional[str] = None) -> int:
+        if case_id is None:
+            return self.conn.execute("SELECT COUNT(*) FROM people").fetchone()[0]
+        return self.conn.execute("SELECT COUNT(*) FROM people WHERE case_id = ?", (case_id,)).fetchone()[0]
+
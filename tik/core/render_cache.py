@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from .chunks import ChunkRecord
+from .document_renderer import RENDERER_VERSION
+
+
+Rendered = Tuple[str, list]  # (wrapped html, chunk records)
+
+
+def file_stamp(*paths: Path) -> str:
+    """Cheap content stamp from (mtime_ns, size) of each file; changes whenever a file is rewritten."""
+    parts = []
+    for p in paths:
+        st = os.stat(p)
+        parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+    return "|".join(parts)
+
+
+def _entry_size(html: str, chunks: Sequence[ChunkRecord]) -> int:
+    # rough byte estimate; exact sizing is not worth a second serialization
+    return len(html) + sum(len(k) + len(str(v)) for c in chunks for k, v in c.items())
+
+
+class RenderCache:
+    """
+    Bounded LRU of rendered documents keyed by (document id, file stamp).
+    The in-memory layer is limited by `max_bytes`; if `disk_dir` is given, entries
+    are also written there so they survive restarts, least recently used files going
+    first once they pass `max_disk_bytes`. Disk entries from another renderer version
+    are misses. Safe to share between the GUI thread and document loader workers.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, disk_dir: Optional[Path] = None,
+                 max_disk_bytes: int = 512 * 1024 * 1024, version: int = RENDERER_VERSION):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._bytes = 0
+        self._disk_bytes = 0
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, Tuple[str, Rendered, int]]" = OrderedDict()  # doc id -> (stamp, value, size)
+        if disk_dir is not None:
+            disk_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_files())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, document_id: str, stamp: str) -> Optional[Rendered]:
+        with self._lock:
+            entry = self._entries.get(document_id)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(document_id)
+                self.hits += 1
+                return entry[1]
+        value = self._read_disk(document_id, stamp)
+        with self._lock:
+            if value is not None:
+                self.disk_hits += 1
+                self.hits += 1
+                self._remember(document_id, stamp, value)
+                return value
+            self.misses += 1
+            return None
+
+    def put(self, document_id: str, stamp: str, value: Rendered) -> None:
+        with self._lock:
+            self._remember(document_id, stamp, value)
+        self._write_disk(document_id, stamp, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    # ---- internals ----
+    def _remember(self, document_id: str, stamp: str, value: Rendered) -> None:
+        old = self._entries.pop(document_id, None)
+        if old is not None:
+            self._bytes -= old[2]
+        size = _entry_size(*value)
+        if size > self.max_bytes:
+            return
+        self._entries[document_id] = (stamp, value, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+
+    def _disk_path(self, document_id: str) -> Path:
+        assert self.disk_dir is not None
+        return self.disk_dir / (hashlib.sha1(document_id.encode("utf-8")).hexdigest() + ".json")
+
+    def _read_disk(self, document_id: str, stamp: str) -> Optional[Rendered]:
+        if self.disk_dir is None:
+            return None
+        p = self._disk_path(document_id)
+        try:
+            data = json.loads(p.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("id") != document_id or data.get("stamp") != stamp or data.get("version") != self.version:
+            return None
+        try:
+            os.utime(p)  # recency for the disk LRU
+        except OSError:
+            pass
+        return data["html"], [ChunkRecord.from_dict(c) for c in data["chunks"]]
+
+    def _write_disk(self, document_id: str, stamp: str, value: Rendered) -> None:
+        if self.disk_dir is None:
+            return
+        p = self._disk_path(document_id)
+        tmp = p.with_suffix(f".{threading.get_ident()}.tmp")
+        html, chunks = value
+        try:
+            old = p.stat().st_size if p.exists() else 0
+            tmp.write_text(
+                json.dumps({"id": document_id, "stamp": stamp, "version": self.version, "html": html,
+                            "chunks": [c.to_dict() for c in chunks]},
+                           ensure_ascii=False),
+                encoding="utf-8",
+            )
+            size = tmp.stat().st_size
+            os.replace(tmp, p)
+        except OSError as e:
+            logger.warning("Render cache write failed for {}: {}", document_id, e)
+            return
+        with self._lock:
+            self._disk_bytes += size - old
+            if self._disk_bytes > self.max_disk_bytes:
+                self._trim_disk(keep=p)
+
+    def _disk_files(self) -> List[Tuple[float, int, Path]]:
+        """(mtime, size, path) of the cached files, oldest first."""
+        assert self.disk_dir is not None
+        files = []
+        for p in self.disk_dir.glob("*.json"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, p))
+        return sorted(files)
+
+    def _trim_disk(self, keep: Path) -> None:
+        files = self._disk_files()
+        self._disk_bytes = sum(size for _, size, _ in files)  # resync with what is really there
+        for _, size, p in files:
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            if p == keep:
+                continue
+            try:
+                p.unlink()
+            except OSError:
+                continue
+            self._disk_bytes -= size
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from .chunks import ChunkLike
+from .decoding import read_chunk_table
+from .document_renderer import _ranges, _safe_html
+from .render_cache import file_stamp
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS indexed (document_id TEXT PRIMARY KEY, stamp TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS passages (
+    id INTEGER PRIMARY KEY,
+    document_id TEXT NOT NULL,
+    start INTEGER NOT NULL,          -- offset of the passage in the rendered (safe) document text
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS passages_doc ON passages(document_id);
+CREATE TABLE IF NOT EXISTS chunks (
+    id INTEGER PRIMARY KEY,
+    document_id TEXT NOT NULL,
+    chunk_id TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    offset_start INTEGER NOT NULL,  -- where the renderer places the chunk
+    offset_end INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS chunks_doc ON chunks(document_id, offset_start);
+CREATE VIRTUAL TABLE IF NOT EXISTS passages_fts USING fts5(
+    body, content='passages', content_rowid='id', prefix='2 3',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
+    value, content='chunks', content_rowid='id', prefix='2 3', tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+_TAG = re.compile(r"<[^>]*>")
+_WORD = re.compile(r"\w+", re.UNICODE)
+_PASSAGE = 1024  # characters per indexed passage (cut at whitespace)
+_SNIPPET = 60
+_BATCH = 100  # documents per transaction when updating from a data dir
+# matches scored per query: bm25 costs per match, so past this only the most recently indexed are ranked
+_CANDIDATES = 2000
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    document_id: str
+    kind: str  # "text" | "chunk"
+    score: float  # bm25, lower is better
+    snippet: str
+    start: int  # match offsets in the rendered document text, the same space as DataChunk offsets
+    end: int
+    chunk_ids: Tuple[str, ...] = ()
+    field: Optional[str] = None
+
+
+def _blank_tags(safe: str) -> str:
+    # same length as the input, so offsets stay valid
+    return _TAG.sub(lambda m: " " * len(m.group()), safe)
+
+
+def _passages(text: str) -> Iterable[Tuple[int, str]]:
+    i, n = 0, len(text)
+    while i < n:
+        j = min(n, i + _PASSAGE)
+        if j < n:
+            k = text.rfind(" ", i + _PASSAGE // 2, j)
+            j = k if k != -1 else j
+        body = text[i:j]
+        if body.strip():
+            yield i, body
+        i = j
+
+
+def _fts_query(query: str) -> str:
+    """User text -> FTS5 query: every word must match, the last one as a prefix."""
+    words = _WORD.findall(query)
+    if not words:
+        return ""
+    terms = [f'"{w}"' for w in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+class SearchIndex:
+    """
+    Full-text index over document text and chunk values (SQLite FTS5).
+    Documents are (re)indexed only when their file stamp changes, so a persisted
+    index makes startup cheap. Hits carry offsets in the rendered document text,
+    mapped to the chunks that cover them. One connection, shared under a lock, so an
+    indexing thread and GUI searches can use the same index.
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        self.path = path
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        if str(path) != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")  # a lost tail is re-indexed from its stamp
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    # ---- indexing ----
+    def stamp(self, document_id: str) -> Optional[str]:
+        with self._lock:
+            row = self.conn.execute("SELECT stamp FROM indexed WHERE document_id = ?", (document_id,)).fetchone()
+        return row[0] if row else None
+
+    def add_document(self, document_id: str, html: str, chunks: Sequence[ChunkLike], stamp: str = "") -> bool:
+        """Index one document unless it is already indexed with the same stamp."""
+        with self._lock, self.conn:
+            return self._add(document_id, html, chunks, stamp)
+
+    def add_documents(self, docs: Iterable[Tuple[str, str, Sequence[ChunkLike], str]]) -> int:
+        """Bulk form of add_document, (id, html, chunks, stamp) tuples in one transaction."""
+        with self._lock, self.conn:
+            return sum(self._add(*d) for d in docs)
+
+    def _add(self, document_id: str, html: str, chunks: Sequence[ChunkLike], stamp: str) -> bool:
+        if stamp and self.stamp(document_id) == stamp:
+            return False
+        safe = _safe_html(html)
+        text = _blank_tags(safe)
+        # where the renderer actually puts each chunk (stale offsets are relocated there)
+        placed = {c.id: (st, en) for st, en, c in _ranges(safe, chunks)}
+        spans = [(c, *placed.get(c.id, (c.offset_start, c.offset_end))) for c in chunks]
+        self._remove(document_id)
+        for start, body in _passages(text):
+            cur = self.conn.execute(
+                "INSERT INTO passages (document_id, start, body) VALUES (?, ?, ?)", (document_id, start, body)
+            )
+            self.conn.execute("INSERT INTO passages_fts (rowid, body) VALUES (?, ?)", (cur.lastrowid, body))
+        for c, st, en in spans:
+            cur = self.conn.execute(
+                "INSERT INTO chunks (document_id, chunk_id, field, value, offset_start, offset_end) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (document_id, c.id, c.field, c.value, st, en),
+            )
+            self.conn.execute("INSERT INTO chunks_fts (rowid, value) VALUES (?, ?)", (cur.lastrowid, c.value))
+        self.conn.execute("INSERT OR REPLACE INTO indexed VALUES (?, ?)", (document_id, stamp))
+        return True
+
+    def remove_document(self, document_id: str) -> None:
+        with self._lock, self.conn:
+            self._remove(document_id)
+
+    def _remove(self, document_id: str) -> None:
+        # external-content FTS tables are told about deletions row by row
+        rows = self.conn.execute("SELECT id, body FROM passages WHERE document_id = ?", (document_id,)).fetchall()
+        self.conn.executemany("INSERT INTO passages_fts (passages_fts, rowid, body) VALUES ('delete', ?, ?)", rows)
+        rows = self.conn.execute("SELECT id, value FROM chunks WHERE document_id = ?", (document_id,)).fetchall()
+        self.conn.executemany("INSERT INTO chunks_fts (chunks_fts, rowid, value) VALUES ('delete', ?, ?)", rows)
+        self.conn.execute("DELETE FROM passages WHERE document_id = ?", (document_id,))
+        self.conn.execute("DELETE FROM chunks WHERE document_id = ?", (document_id,))
+        self.conn.execute("DELETE FROM indexed WHERE document_id = ?", (document_id,))
+
+    def update_from_data_dir(self, data_dir: Path, document_ids: Iterable[str], batch: int = _BATCH) -> int:
+        """
+        Index new or changed documents of the JSON data layout; returns how many were (re)indexed.
+        Files are read outside the lock and committed `batch` documents at a time, so searches
+        from other threads are not held up for the whole update.
+        """
+        n = 0
+        pending: List[Tuple[str, str, Sequence[ChunkLike], str]] = []
+        for doc in self._changed_in(data_dir, document_ids):
+            pending.append(doc)
+            if len(pending) >= batch:
+                n += self.add_documents(pending)
+                pending = []
+        return n + self.add_documents(pending)
+
+    def _changed_in(self, data_dir: Path, document_ids: Iterable[str]) -> Iterable[Tuple[str, str, Sequence[ChunkLike], str]]:
+        for doc_id in document_ids:
+            html_path = data_dir / "docs" / f"{doc_id}.html"
+            chunks_path = data_dir / "chunks" / f"{doc_id}.json"
+            paths = [p for p in (html_path, chunks_path) if p.exists()]
+            if html_path not in paths:
+                continue
+            stamp = file_stamp(*paths)
+            if self.stamp(doc_id) == stamp:
+                continue
+            chunks = read_chunk_table(chunks_path) if chunks_path in paths else []
+            yield doc_id, html_path.read_text(encoding="utf-8"), chunks, stamp
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM indexed").fetchone()[0]
+
+    # ---- queries ----
+    def search(self, query: str, limit: int = 20, document_id: Optional[str] = None) -> List[SearchHit]:
+        """
+        Chunk-value hits first (they are what analysts drag), then text hits; each group
+        ranked by bm25 over its `_CANDIDATES` most recently indexed matches.
+        """
+        q = _fts_query(query)
+        if not q:
+            return []
+        with self._lock:
+            return self._search(q, query, limit, document_id)
+
+    def _search(self, q: str, query: str, limit: int, document_id: Optional[str]) -> List[SearchHit]:
+        pattern = re.compile("|".join(re.escape(w) for w in _WORD.findall(query)), re.IGNORECASE)
+        hits: List[SearchHit] = []
+        chunk_rows = self._ranked("chunks", "t.document_id, t.chunk_id, t.field, t.value, t.offset_start, t.offset_end",
+                                  q, limit, document_id)
+        for doc_id, chunk_id, field, value, st, en, score in chunk_rows:
+            hits.append(SearchHit(doc_id, "chunk", score, value, st, en, (chunk_id,), field))
+        if len(hits) >= limit:
+            return hits
+
+        text_rows = self._ranked("passages", "t.document_id, t.start, t.body", q, limit - len(hits), document_id)
+        for doc_id, start, body, score in text_rows:
+            m = pattern.search(body)
+            i, j = (m.start(), m.end()) if m else (0, 0)
+            snippet = " ".join(body[max(0, i - _SNIPPET):j + _SNIPPET].split())
+            hits.append(SearchHit(doc_id, "text", score, snippet, start + i, start + j,
+                                  self._chunks_at(doc_id, start + i, start + j)))
+        return hits
+
+    def _ranked(self, table: str, columns: str, q: str, limit: int, document_id: Optional[str]) -> list:
+        """
+        Best `limit` matches of `table`, scored over a bounded rowid range: a document's rows
+        are contiguous, and the `_CANDIDATES`-th newest match is the floor, so FTS5 never
+        runs bm25 over more than that many rows.
+        """
+        fts = f"{table}_fts"
+        lo, hi = 0, (1 << 63) - 1
+        if document_id:
+            lo, hi = self.conn.execute(f"SELECT MIN(id), MAX(id) FROM {table} WHERE document_id = ?",
+                                       (document_id,)).fetchone()
+            if lo is None:
+                return []
+        floor = self.conn.execute(
+            f"SELECT rowid FROM {fts} WHERE {fts} MATCH ? AND rowid BETWEEN ? AND ? ORDER BY rowid DESC LIMIT 1 OFFSET ?",
+            (q, lo, hi, _CANDIDATES - 1),
+        ).fetchone()
+        if floor is not None:
+            lo = floor[0]
+        # "rank" is bm25() unless configured otherwise
+        return self.conn.execute(
+            f"SELECT {columns}, rank FROM {fts} JOIN {table} t ON t.id = {fts}.rowid "
+            f"WHERE {fts} MATCH ? AND {fts}.rowid BETWEEN ? AND ? ORDER BY rank LIMIT ?",
+            (q, lo, hi, limit),
+        ).fetchall()
+
+    def _chunks_at(self, document_id: str, start: int, end: int) -> Tuple[str, ...]:
+        rows = self.conn.execute(
+            "SELECT chunk_id FROM chunks WHERE document_id = ? AND offset_start < ? AND offset_end > ?",
+            (document_id, max(end, start + 1), start),
+        )
+        return tuple(r[0] for r in rows)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import IO, Any, Iterator, Tuple, Union
+
+# keys of the case object whose arrays are streamed element by element
+STREAMED = ("sources", "documents", "people")
+
+_WS = " \t\r\n"
+_decoder = json.JSONDecoder()
+
+
+class _Scanner:
+    """Pull tokens / whole values out of a text stream with a bounded buffer."""
+
+    def __init__(self, fh: IO[str], chunk_size: int):
+        self.fh = fh
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        data = self.fh.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        # drop what was consumed so the buffer never holds more than a value or two
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WS:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                raise ValueError("unexpected end of seed file")
+
+    def expect(self, ch: str) -> None:
+        got = self.peek()
+        if got != ch:
+            raise ValueError(f"expected {ch!r} at offset ~{self.pos}, got {got!r}")
+        self.pos += 1
+
+    def take(self, ch: str) -> bool:
+        if self.peek() == ch:
+            self.pos += 1
+            return True
+        return False
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # a number running into the end of the buffer might continue in the next read
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+    def key(self) -> str:
+        k = self.value()
+        if not isinstance(k, str):
+            raise ValueError(f"object key expected, got {k!r}")
+        self.expect(":")
+        return k
+
+
+def _members(sc: _Scanner) -> Iterator[str]:
+    """Yield the keys of the object about to be read; the caller consumes each value."""
+    sc.expect("{")
+    if sc.take("}"):
+        return
+    while True:
+        yield sc.key()
+        if sc.take("}"):
+            return
+        sc.expect(",")
+
+
+def _elements(sc: _Scanner) -> Iterator[Any]:
+    sc.expect("[")
+    if sc.take("]"):
+        return
+    while True:
+        yield sc.value()
+        if sc.take("]"):
+            return
+        sc.expect(",")
+
+
+def iter_seed_events(source: Union[Path, IO[str]], chunk_size: int = 1 << 16) -> Iterator[Tuple[str, Any]]:
+    """
+    Stream a seed_case.json without loading it whole.
+    Yields ("case", (key, value)) for plain case attributes, ("source" | "document" | "person", dict)
+    per array element, and ("objectives", list). Unknown top-level keys are skipped.
+    """
+    fh = source.open("r", encoding="utf-8") if isinstance(source, Path) else source
+    try:
+        sc = _Scanner(fh, chunk_size)
+        for top in _members(sc):
+            if top == "case":
+                for key in _members(sc):
+                    if key in STREAMED:
+                        kind = key[:-1] if key != "people" else "person"
+                        for item in _elements(sc):
+                            yield kind, item
+                    else:
+                        yield "case", (key, sc.value())
+            elif top == "objectives":
+                yield "objectives", sc.value()
+            else:
+                sc.value()
+    finally:
+        if isinstance(source, Path):
+            fh.close()
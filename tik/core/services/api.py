@@ -1,52 +1,419 @@
 from __future__ import annotations
 
+import asyncio
+import socket
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Callable, ClassVar, Collection, Deque, Dict, List, Tuple, Optional
+
 import httpx
-from typing import List, Tuple, Optional
+from loguru import logger
 
-from .base import CaseService, DocumentService, ChunkService, ObjectiveService, EventService
+from .base import (
+    CaseService, DocumentService, ChunkService, ObjectiveService, EventService,
+    AsyncCaseService, AsyncDocumentService, AsyncChunkService, AsyncObjectiveService, AsyncEventService,
+)
+from ..decoding import case_from_payload, decode_chunk_table, decode_chunks
 from ..models import Case, Document, DataChunk, AdvisorEvent, Person
+from ..document_renderer import wrap_chunks_into_html
+from ..objectives import apply_objective_status
 
+try:  # HTTP/2 needs the optional `h2` package (pip install httpx[http2])
+    import h2  # noqa: F401
+    _HAS_H2 = True
+except ImportError:
+    _HAS_H2 = False
 
-class ApiCaseService(CaseService):
-    def __init__(self, base_url: str, client: Optional[httpx.Client] = None):
+
+class _Lru(OrderedDict):
+    """Dict capped at `maxsize` entries; the least recently read or written goes first."""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+def _client_kwargs(base_url: str, timeout: float, http2: Optional[bool], max_connections: int) -> Dict[str, Any]:
+    return dict(
+        base_url=base_url,
+        timeout=timeout,
+        http2=_HAS_H2 if http2 is None else http2,
+        limits=httpx.Limits(max_connections=max_connections, keepalive_expiry=30.0),
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+
+def _evaluate_payload(case: Case, person: Person, changed: Optional[Collection[str]]) -> dict:
+    return {
+        "case_id": case.id,
+        "person_id": person.id,
+        "accepted": {fid: ac.model_dump() for fid, ac in person.accepted.items()},
+        "changed": None if changed is None else sorted(changed),
+    }
+
+
+def _objective_status(payload: dict) -> Dict[str, bool]:
+    return {o["id"]: bool(o["satisfied"]) for o in payload.get("objectives", [])}
+
+
+def _render(html: str, raw: bytes) -> Tuple[str, list]:
+    chunks = decode_chunk_table(raw)
+    return wrap_chunks_into_html(html, chunks), list(chunks)
+
+
+def _content(r: httpx.Response) -> bytes:
+    # chunk lists are cached undecoded: the document and chunk services decode them differently
+    return r.content
+
+
+# an idle event stream is normal: connect/write/pool time out, reads never do
+_STREAM_TIMEOUT = httpx.Timeout(10.0, read=None)
+
+
+def _interrupt(r: httpx.Response) -> None:
+    """Wake a thread blocked reading `r`. Only HTTP/1.1 owns its socket; on HTTP/2 the read ends with the next event."""
+    if not r.http_version.startswith("HTTP/1"):
+        return
+    stream = r.extensions.get("network_stream")
+    sock = stream.get_extra_info("socket") if stream is not None else None
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)  # close() alone does not wake a blocked recv
+        except OSError:
+            pass
+
+
+def _event_from_response(r: httpx.Response) -> Optional[AdvisorEvent]:
+    if r.status_code == 204:
+        return None
+    r.raise_for_status()
+    return AdvisorEvent.model_validate(r.json())
+
+
+class ApiSession:
+    """
+    One pooled `httpx.Client` per backend, shared by every Api*Service.
+    Keeps connections alive (HTTP/2 when available), asks for gzip and remembers
+    ETags so unchanged documents and chunk lists are revalidated with If-None-Match.
+    """
+    _shared: ClassVar[Dict[str, "ApiSession"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        transport: Optional[httpx.BaseTransport] = None,
+        timeout: float = 10.0,
+        http2: Optional[bool] = None,
+        max_connections: int = 10,
+        max_cached: int = 256,
+    ):
         self.base_url = base_url.rstrip("/")
-        self.client = client or httpx.Client(timeout=10.0)
+        self.client = httpx.Client(transport=transport, **_client_kwargs(self.base_url, timeout, http2, max_connections))
+        self._etags: Dict[str, Tuple[str, Any]] = _Lru(max_cached)  # path -> (etag, parsed body)
+        self._lock = threading.Lock()
+        self.not_modified = 0
+
+    @classmethod
+    def shared(cls, base_url: str) -> "ApiSession":
+        key = base_url.rstrip("/")
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(key)
+            return cls._shared[key]
+
+    def fetch(self, path: str, parse: Callable[[httpx.Response], Any]) -> Tuple[Any, bool]:
+        """GET with ETag revalidation. Return (body, changed); changed is False on 304."""
+        with self._lock:
+            cached = self._etags.get(path)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        r = self.client.get(path, headers=headers)
+        if r.status_code == 304 and cached:
+            with self._lock:
+                self.not_modified += 1
+            return cached[1], False
+        r.raise_for_status()
+        body = parse(r)
+        etag = r.headers.get("ETag")
+        if etag:
+            with self._lock:
+                self._etags[path] = (etag, body)
+        return body, True
+
+    def get_json(self, path: str) -> Any:
+        r = self.client.get(path)
+        r.raise_for_status()
+        return r.json()
+
+    def post_json(self, path: str, payload: Any) -> httpx.Response:
+        r = self.client.post(path, json=payload)
+        r.raise_for_status()
+        return r
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class ApiCaseService(CaseService):
+    def __init__(self, base_url: str, session: Optional[ApiSession] = None):
+        self.session = session or ApiSession.shared(base_url)
 
     def load_default_case(self) -> Case:
-        raise NotImplementedError("HTTP API not implemented in Phase 1")
+        return case_from_payload(self.session.get_json("/case"))
 
 
 class ApiDocumentService(DocumentService):
-    def __init__(self, base_url: str, client: Optional[httpx.Client] = None):
-        self.base_url = base_url.rstrip("/")
-        self.client = client or httpx.Client(timeout=10.0)
+    def __init__(self, base_url: str, session: Optional[ApiSession] = None, max_rendered: int = 32):
+        self.session = session or ApiSession.shared(base_url)
+        self._rendered: Dict[str, Tuple[str, list]] = _Lru(max_rendered)
+        self._lock = threading.Lock()  # loader workers share the LRU
 
     def load_document_html_and_chunks(self, document_id: str) -> Tuple[str, list]:
-        raise NotImplementedError("HTTP API not implemented in Phase 1")
+        html, html_changed = self.session.fetch(f"/documents/{document_id}/html", lambda r: r.text)
+        raw, chunks_changed = self.session.fetch(f"/documents/{document_id}/chunks", _content)
+        with self._lock:
+            rendered = None if html_changed or chunks_changed else self._rendered.get(document_id)
+        if rendered is None:
+            rendered = _render(html, raw)
+            with self._lock:
+                self._rendered[document_id] = rendered
+        wrapped, dumped = rendered
+        return wrapped, list(dumped)
 
 
 class ApiChunkService(ChunkService):
-    def __init__(self, base_url: str, client: Optional[httpx.Client] = None):
-        self.base_url = base_url.rstrip("/")
-        self.client = client or httpx.Client(timeout=10.0)
+    def __init__(self, base_url: str, session: Optional[ApiSession] = None):
+        self.session = session or ApiSession.shared(base_url)
 
     def list_chunks_for_document(self, document_id: str) -> List[DataChunk]:
-        raise NotImplementedError("HTTP API not implemented in Phase 1")
+        raw, _ = self.session.fetch(f"/documents/{document_id}/chunks", _content)
+        return decode_chunks(raw)
 
 
 class ApiObjectiveService(ObjectiveService):
-    def __init__(self, base_url: str, client: Optional[httpx.Client] = None):
-        self.base_url = base_url.rstrip("/")
-        self.client = client or httpx.Client(timeout=10.0)
+    def __init__(self, base_url: str, session: Optional[ApiSession] = None):
+        self.session = session or ApiSession.shared(base_url)
 
-    def evaluate(self, case: Case, person: Person) -> bool:
-        raise NotImplementedError("HTTP API not implemented in Phase 1")
+    def evaluate(self, case: Case, person: Person, changed: Optional[Collection[str]] = None) -> bool:
+        r = self.session.post_json("/objectives/evaluate", _evaluate_payload(case, person, changed))
+        return apply_objective_status(getattr(case, "_objectives", []), _objective_status(r.json()))
 
 
 class ApiEventService(EventService):
-    def __init__(self, base_url: str, client: Optional[httpx.Client] = None):
-        self.base_url = base_url.rstrip("/")
-        self.client = client or httpx.Client(timeout=10.0)
+    def __init__(self, base_url: str, session: Optional[ApiSession] = None):
+        self.session = session or ApiSession.shared(base_url)
+
+    def poll(self) -> Optional[AdvisorEvent]:
+        return _event_from_response(self.session.client.get("/events/next"))
+
+
+class ApiEventStream(EventService):
+    """
+    Push mode for advisor events: a background thread keeps a server-sent events
+    stream (GET /events/stream) open and fills a bounded buffer; `poll`/`poll_many`
+    only drain it. The optional listener is called from the reader thread when
+    the buffer goes from empty to non-empty. Reconnects back off exponentially;
+    an idle stream never times out, and stop() breaks a read blocked on it.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        session: Optional[ApiSession] = None,
+        *,
+        max_buffer: int = 1000,
+        reconnect_min: float = 0.5,
+        reconnect_max: float = 30.0,
+    ):
+        self.session = session or ApiSession.shared(base_url)
+        self.max_buffer = max_buffer
+        self.reconnect_min = reconnect_min
+        self.reconnect_max = reconnect_max
+        self.dropped = 0
+        self._buf: Deque[AdvisorEvent] = deque()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._listener: Optional[Callable[[], None]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._response: Optional[httpx.Response] = None  # open stream, for stop()
+
+    def set_listener(self, fn: Optional[Callable[[], None]]) -> None:
+        self._listener = fn
+
+    def start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="tik-advisor-sse", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        r = self._response
+        if r is not None:
+            _interrupt(r)
+        if self._thread is not None:
+            self._thread.join(timeout)
 
     def poll(self) -> Optional[AdvisorEvent]:
-        raise NotImplementedError("HTTP API not implemented in Phase 1")
+        with self._lock:
+            return self._buf.popleft() if self._buf else None
+
+    def poll_many(self, limit: int = 100) -> List[AdvisorEvent]:
+        with self._lock:
+            n = min(limit, len(self._buf))
+            return [self._buf.popleft() for _ in range(n)]
+
+    def _push(self, evt: AdvisorEvent) -> None:
+        with self._lock:
+            was_empty = not self._buf
+            if len(self._buf) >= self.max_buffer:
+                self._buf.popleft()  # keep the newest
+                self.dropped += 1
+            self._buf.append(evt)
+        if was_empty and self._listener is not None:
+            self._listener()
+
+    def _run(self) -> None:
+        delay = self.reconnect_min
+        while not self._stop.is_set():
+            try:
+                with self.session.client.stream("GET", "/events/stream", headers={"Accept": "text/event-stream"},
+                                                timeout=_STREAM_TIMEOUT) as r:
+                    self._response = r
+                    if self._stop.is_set():  # stop() ran before the response was published
+                        return
+                    r.raise_for_status()
+                    delay = self.reconnect_min
+                    data: List[str] = []
+                    for line in r.iter_lines():
+                        if self._stop.is_set():
+                            return
+                        if line.startswith("data:"):
+                            # the spec drops exactly one space after the colon
+                            data.append(line[6:] if line.startswith("data: ") else line[5:])
+                        elif not line and data:
+                            self._push(AdvisorEvent.model_validate_json("\n".join(data)))
+                            data = []
+            except (httpx.HTTPError, ValueError) as e:
+                if self._stop.is_set():
+                    return
+                logger.debug("Advisor stream error: {}", e)
+            finally:
+                self._response = None
+            # stream ended or failed: wait before reconnecting, longer each time
+            self._stop.wait(delay)
+            delay = min(delay * 2, self.reconnect_max)
+
+
+# --- async variants on httpx.AsyncClient ---
+
+class AsyncApiSession:
+    """`ApiSession` over `httpx.AsyncClient`; use it from a single event loop."""
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        timeout: float = 10.0,
+        http2: Optional[bool] = None,
+        max_connections: int = 10,
+        max_cached: int = 256,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.client = httpx.AsyncClient(transport=transport, **_client_kwargs(self.base_url, timeout, http2, max_connections))
+        self._etags: Dict[str, Tuple[str, Any]] = _Lru(max_cached)
+        self.not_modified = 0
+
+    async def fetch(self, path: str, parse: Callable[[httpx.Response], Any]) -> Tuple[Any, bool]:
+        cached = self._etags.get(path)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        r = await self.client.get(path, headers=headers)
+        if r.status_code == 304 and cached:
+            self.not_modified += 1
+            return cached[1], False
+        r.raise_for_status()
+        body = parse(r)
+        etag = r.headers.get("ETag")
+        if etag:
+            self._etags[path] = (etag, body)
+        return body, True
+
+    async def get_json(self, path: str) -> Any:
+        r = await self.client.get(path)
+        r.raise_for_status()
+        return r.json()
+
+    async def post_json(self, path: str, payload: Any) -> httpx.Response:
+        r = await self.client.post(path, json=payload)
+        r.raise_for_status()
+        return r
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+class AsyncApiCaseService(AsyncCaseService):
+    def __init__(self, session: AsyncApiSession):
+        self.session = session
+
+    async def load_default_case(self) -> Case:
+        return case_from_payload(await self.session.get_json("/case"))
+
+
+class AsyncApiDocumentService(AsyncDocumentService):
+    def __init__(self, session: AsyncApiSession, max_rendered: int = 32):
+        self.session = session
+        self._rendered: Dict[str, Tuple[str, list]] = _Lru(max_rendered)
+
+    async def load_document_html_and_chunks(self, document_id: str) -> Tuple[str, list]:
+        (html, html_changed), (raw, chunks_changed) = await asyncio.gather(
+            self.session.fetch(f"/documents/{document_id}/html", lambda r: r.text),
+            self.session.fetch(f"/documents/{document_id}/chunks", _content),
+        )
+        rendered = None if html_changed or chunks_changed else self._rendered.get(document_id)
+        if rendered is not None:
+            wrapped, dumped = rendered
+            return wrapped, list(dumped)
+        # rendering is CPU-bound; keep the loop free for other requests
+        wrapped, dumped = self._rendered[document_id] = await asyncio.to_thread(_render, html, raw)
+        return wrapped, list(dumped)
+
+
+class AsyncApiChunkService(AsyncChunkService):
+    def __init__(self, session: AsyncApiSession):
+        self.session = session
+
+    async def list_chunks_for_document(self, document_id: str) -> List[DataChunk]:
+        raw, _ = await self.session.fetch(f"/documents/{document_id}/chunks", _content)
+        return decode_chunks(raw)
+
+
+class AsyncApiObjectiveService(AsyncObjectiveService):
+    def __init__(self, session: AsyncApiSession):
+        self.session = session
+
+    async def statuses(self, case: Case, person: Person, changed: Optional[Collection[str]] = None) -> Dict[str, bool]:
+        r = await self.session.post_json("/objectives/evaluate", _evaluate_payload(case, person, changed))
+        return _objective_status(r.json())
+
+
+class AsyncApiEventService(AsyncEventService):
+    def __init__(self, session: AsyncApiSession):
+        self.session = session
+
+    async def poll(self) -> Optional[AdvisorEvent]:
+        return _event_from_response(await self.session.client.get("/events/next"))
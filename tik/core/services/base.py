@@ -1,32 +1,116 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional
+from typing import Any, Collection, Dict, Iterator, List, Tuple, Optional
 
+from ..chunks import ChunkTable
+from ..document_renderer import WindowedDocument
 from ..models import Case, Document, DataChunk, Objective, AdvisorEvent, Person
+from ..objectives import apply_objective_status
+
+
+# ("case", Case without people/sources/documents) first, then ("sources" | "documents" | "people", page)
+# in any order, and ("objectives", list) once
+CasePage = Tuple[str, Any]
 
 
 class CaseService(ABC):
     @abstractmethod
     def load_default_case(self) -> Case: ...
 
+    def default_case_stamp(self) -> Optional[str]:
+        """Changes whenever the default case's source does; None if unknown (a record DB copy then always wins)."""
+        return None
+
+    def iter_default_case(self, page_size: int = 500) -> Iterator[CasePage]:
+        """Deliver the case in pages; services that can parse incrementally override this."""
+        case = self.load_default_case()
+        yield "case", case.model_copy(update={"people": [], "sources": [], "documents": []})
+        for kind in ("sources", "documents", "people"):
+            items = getattr(case, kind)
+            for i in range(0, len(items), page_size):
+                yield kind, items[i:i + page_size]
+        yield "objectives", getattr(case, "_objectives", [])
+
 
 class DocumentService(ABC):
     @abstractmethod
     def load_document_html_and_chunks(self, document_id: str) -> Tuple[str, list]: ...
 
+    def load_document_windows(self, document_id: str) -> Optional[WindowedDocument]:
+        """Windowed rendering for documents too large to show at once; None means render it whole."""
+        return None
+
 
 class ChunkService(ABC):
     @abstractmethod
     def list_chunks_for_document(self, document_id: str) -> List[DataChunk]: ...
 
+    def chunk_table(self, document_id: str) -> ChunkTable:
+        """Records without the pydantic pass, for rendering and indexing."""
+        return ChunkTable.from_models(self.list_chunks_for_document(document_id))
+
 
 class ObjectiveService(ABC):
     @abstractmethod
-    def evaluate(self, case: Case, person: Person) -> bool:
-        """Recompute objective statuses. Return True if any change."""
+    def evaluate(self, case: Case, person: Person, changed: Optional[Collection[str]] = None) -> bool:
+        """
+        Recompute objective statuses. Return True if any change.
+        `changed` lists the fields touched since the last call; None means re-evaluate everything.
+        """
 
 
 class EventService(ABC):
     @abstractmethod
     def poll(self) -> Optional[AdvisorEvent]: ...
+
+    def poll_many(self, limit: int = 100) -> List[AdvisorEvent]:
+        """Drain up to `limit` pending events in one go."""
+        out: List[AdvisorEvent] = []
+        while len(out) < limit:
+            evt = self.poll()
+            if evt is None:
+                break
+            out.append(evt)
+        return out
+
+
+# --- async counterparts (driven from an asyncio loop, see core/aio.py) ---
+
+class AsyncCaseService(ABC):
+    @abstractmethod
+    async def load_default_case(self) -> Case: ...
+
+
+class AsyncDocumentService(ABC):
+    @abstractmethod
+    async def load_document_html_and_chunks(self, document_id: str) -> Tuple[str, list]: ...
+
+
+class AsyncChunkService(ABC):
+    @abstractmethod
+    async def list_chunks_for_document(self, document_id: str) -> List[DataChunk]: ...
+
+
+class AsyncObjectiveService(ABC):
+    @abstractmethod
+    async def statuses(self, case: Case, person: Person, changed: Optional[Collection[str]] = None) -> Dict[str, bool]:
+        """Objective id -> satisfied, without touching `case`; the caller applies it on its own thread."""
+
+    async def evaluate(self, case: Case, person: Person, changed: Optional[Collection[str]] = None) -> bool:
+        """Async `ObjectiveService.evaluate`."""
+        return apply_objective_status(getattr(case, "_objectives", []), await self.statuses(case, person, changed))
+
+
+class AsyncEventService(ABC):
+    @abstractmethod
+    async def poll(self) -> Optional[AdvisorEvent]: ...
+
+    async def poll_many(self, limit: int = 100) -> List[AdvisorEvent]:
+        out: List[AdvisorEvent] = []
+        while len(out) < limit:
+            evt = await self.poll()
+            if evt is None:
+                break
+            out.append(evt)
+        return out
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Union
+
+from ..chunks import ChunkTable
+from ..corpus import ChunkCorpus
+from ..models import DataChunk
+from .base import ChunkService
+
+
+class CorpusChunkService(ChunkService):
+    """ChunkService over a binary corpus file (see tik/core/corpus.py and scripts/convert_chunks.py)."""
+
+    def __init__(self, corpus: Union[ChunkCorpus, str, Path]):
+        self.corpus = corpus if isinstance(corpus, ChunkCorpus) else ChunkCorpus(corpus)
+
+    def _corpus(self) -> ChunkCorpus:
+        self.corpus = self.corpus.fresh()  # remapped if the file was rewritten
+        return self.corpus
+
+    def list_chunks_for_document(self, document_id: str) -> List[DataChunk]:
+        return self._corpus().chunks(document_id).to_models()
+
+    def chunk_table(self, document_id: str) -> ChunkTable:
+        """Records without the pydantic pass, for rendering and indexing."""
+        return self._corpus().chunks(document_id)
+
+    def chunks_in_range(self, document_id: str, start: int, end: int) -> ChunkTable:
+        return self._corpus().chunks_in_range(document_id, start, end)
+
+    def close(self) -> None:
+        self.corpus.close()
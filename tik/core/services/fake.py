@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-import json
 import itertools
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Tuple, Optional
-
-from pydantic import TypeAdapter
+from typing import Any, Callable, Collection, Dict, Iterator, List, Tuple, Optional
 
 from ..models import (
     Case, Person, Source, Document, DataChunk, Objective, ObjectiveExpr, ObjectivePredicate, AdvisorEvent
 )
-from ..document_renderer import wrap_chunks_into_html
-from .base import CaseService, DocumentService, ChunkService, ObjectiveService, EventService
+from ..chunks import ChunkTable
+from ..corpus import ChunkCorpus
+from ..decoding import DOCUMENTS, OBJECTIVES, PEOPLE, SOURCES, decode_case, read_chunk_table, read_chunks
+from ..seed_stream import iter_seed_events
+from ..document_renderer import WindowedDocument, render_windows, wrap_chunks_into_html
+from ..objectives import ObjectiveIndex
+from ..render_cache import RenderCache, file_stamp
+from .base import CasePage, CaseService, DocumentService, ChunkService, ObjectiveService, EventService
 
 
 class FakeCaseService(CaseService):
@@ -22,25 +26,124 @@ class FakeCaseService(CaseService):
 
     def load_default_case(self) -> Case:
         seed_path = self.data_dir / "seed_case.json"
-        data = json.loads(seed_path.read_text(encoding="utf-8"))
-        case = Case.model_validate(data["case"])
-        self._objectives = TypeAdapter(List[Objective]).validate_python(data.get("objectives", []))
-        case._objectives = self._objectives  # type: ignore[attr-defined]
+        case = decode_case(seed_path.read_bytes())
+        self._objectives = case._objectives  # type: ignore[attr-defined]
         self._case = case
         return case
 
+    def default_case_stamp(self) -> Optional[str]:
+        return file_stamp(self.data_dir / "seed_case.json")
+
+    def iter_default_case(self, page_size: int = 500) -> Iterator[CasePage]:
+        """
+        Parse seed_case.json incrementally. The case header goes out as soon as every
+        plain case key has been read (at the end of the case object at the latest);
+        list items and objectives read before that are held back until it has.
+        """
+        adapters = {"source": ("sources", SOURCES), "document": ("documents", DOCUMENTS), "person": ("people", PEOPLE)}
+        header_keys = set(Case.model_fields) - {"sources", "documents", "people"}
+        header: Dict[str, Any] = {}
+        held: List[Tuple[str, Any]] = []  # events read before the header was complete
+        sent_header = False
+        page: List[dict] = []
+        page_kind = ""
+
+        def flush() -> Iterator[CasePage]:
+            if page:
+                kind, adapter = adapters[page_kind]
+                yield kind, adapter.validate_python(page)
+                page.clear()
+
+        def handle(kind: str, payload: Any) -> Iterator[CasePage]:
+            nonlocal page_kind
+            if kind != page_kind or len(page) >= page_size:
+                yield from flush()
+                page_kind = kind
+            if kind == "objectives":
+                self._objectives = OBJECTIVES.validate_python(payload)
+                yield "objectives", self._objectives
+                page_kind = ""
+            else:
+                page.append(payload)
+
+        def send_header() -> Iterator[CasePage]:
+            nonlocal sent_header
+            sent_header = True
+            yield "case", Case.model_validate({**header, "people": [], "sources": [], "documents": []})
+            for kind, payload in held:
+                yield from handle(kind, payload)
+            held.clear()
+
+        for kind, payload in iter_seed_events(self.data_dir / "seed_case.json"):
+            if kind == "case":
+                header[payload[0]] = payload[1]
+                if not sent_header and header_keys <= header.keys():
+                    yield from send_header()
+            elif sent_header:
+                yield from handle(kind, payload)
+            else:
+                held.append((kind, payload))
+        if not sent_header:
+            yield from send_header()
+        yield from flush()
+
 
 class FakeDocumentService(DocumentService):
-    def __init__(self, data_dir: Path):
+    def __init__(
+        self,
+        data_dir: Path,
+        cache: Optional[RenderCache] = None,
+        trusted: bool = False,
+        corpus: Optional[ChunkCorpus] = None,
+        window_threshold: Optional[int] = None,
+    ):
         self.data_dir = data_dir
-
-    def load_document_html_and_chunks(self, document_id: str) -> Tuple[str, list]:
+        self.cache = cache if cache is not None else RenderCache()
+        self.trusted = trusted  # chunk files are pre-verified: skip row checks
+        self.corpus = corpus  # binary chunk corpus; documents it lacks fall back to JSON
+        # HTML files above this many bytes are rendered in windows (None: never)
+        self.window_threshold = window_threshold
+        self._windows: "OrderedDict[str, Tuple[Any, WindowedDocument]]" = OrderedDict()
+
+    def _source(self, document_id: str) -> Tuple[Path, str, Callable[[], Any]]:
+        """HTML path, content stamp and chunk reader of a document."""
         doc_html_path = self.data_dir / "docs" / f"{document_id}.html"
+        if self.corpus is not None:
+            corpus = self.corpus = self.corpus.fresh()  # remapped if the corpus file was rewritten
+            if document_id in corpus:
+                # stamp of the mapping that is read, not of whatever is on disk by now
+                return doc_html_path, f"{file_stamp(doc_html_path)}|{corpus.stamp}", lambda: corpus.chunks(document_id)
         chunks_path = self.data_dir / "chunks" / f"{document_id}.json"
+        # pydantic stays at the service boundary (list_chunks_for_document); rendering uses records
+        return doc_html_path, file_stamp(doc_html_path, chunks_path), lambda: read_chunk_table(chunks_path, self.trusted)
+
+    def load_document_windows(self, document_id: str) -> Optional[WindowedDocument]:
+        doc_html_path = self.data_dir / "docs" / f"{document_id}.html"
+        if self.window_threshold is None or doc_html_path.stat().st_size <= self.window_threshold:
+            return None
+        _, stamp, load_chunks = self._source(document_id)
+        hit = self._windows.get(document_id)
+        if hit is not None and hit[0] == stamp:
+            self._windows.move_to_end(document_id)
+            return hit[1]
         html = doc_html_path.read_text(encoding="utf-8")
-        chunks = TypeAdapter(List[DataChunk]).validate_python(json.loads(chunks_path.read_text(encoding="utf-8")))
+        doc = render_windows(document_id, html, load_chunks())
+        self._windows[document_id] = (stamp, doc)
+        while len(self._windows) > 2:  # the open document and one prefetched neighbour
+            self._windows.popitem(last=False)
+        return doc
+
+    def load_document_html_and_chunks(self, document_id: str) -> Tuple[str, list]:
+        doc_html_path, stamp, load_chunks = self._source(document_id)
+        cached = self.cache.get(document_id, stamp)
+        if cached is not None:
+            return cached[0], list(cached[1])
+        html = doc_html_path.read_text(encoding="utf-8")
+        chunks = load_chunks()
         wrapped_html = wrap_chunks_into_html(html, chunks)
-        return wrapped_html, [c.model_dump() for c in chunks]
+        records = list(chunks)
+        self.cache.put(document_id, stamp, (wrapped_html, records))
+        return wrapped_html, list(records)
 
 
 class FakeChunkService(ChunkService):
@@ -48,33 +151,27 @@ class FakeChunkService(ChunkService):
         self.data_dir = data_dir
 
     def list_chunks_for_document(self, document_id: str) -> List[DataChunk]:
-        p = self.data_dir / "chunks" / f"{document_id}.json"
-        return TypeAdapter(List[DataChunk]).validate_python(json.loads(p.read_text(encoding="utf-8")))
+        return read_chunks(self.data_dir / "chunks" / f"{document_id}.json")
+
+    def chunk_table(self, document_id: str) -> ChunkTable:
+        return read_chunk_table(self.data_dir / "chunks" / f"{document_id}.json")
 
 
 class FakeObjectiveService(ObjectiveService):
-    def evaluate(self, case: Case, person: Person) -> bool:
-        changed = False
+    def __init__(self) -> None:
+        self._objectives: Optional[List[Objective]] = None
+        self._index: Optional[ObjectiveIndex] = None
+
+    def index_for(self, case: Case) -> ObjectiveIndex:
+        """Compile the case objectives once; recompiled only when the list is replaced."""
         objectives: List[Objective] = getattr(case, "_objectives", [])
-        for obj in objectives:
-            was = obj.satisfied
-            obj.satisfied = self._eval_expr(obj.expr, person)
-            changed = changed or (was != obj.satisfied)
-        return changed
-
-    def _eval_expr(self, expr: ObjectiveExpr, person: Person) -> bool:
-        if expr.kind == "LEAF" and expr.predicate:
-            pred = expr.predicate
-            if pred.op == "exists":
-                # chấp nhận cả 'person.xxx' lẫn 'record.xxx'
-                _, field = pred.path.split(".", 1) if "." in pred.path else ("record", pred.path)
-                return field in person.accepted and bool(person.accepted[field].value)
-            return False
-        if expr.kind == "AND":
-            return all(self._eval_expr(c, person) for c in (expr.children or []))
-        if expr.kind == "OR":
-            return any(self._eval_expr(c, person) for c in (expr.children or []))
-        return False
+        if self._index is None or self._objectives is not objectives:
+            self._objectives = objectives
+            self._index = ObjectiveIndex(objectives)
+        return self._index
+
+    def evaluate(self, case: Case, person: Person, changed: Optional[Collection[str]] = None) -> bool:
+        return self.index_for(case).evaluate(person, changed)
 
 
 class FakeEventService(EventService):
@@ -84,3 +181,8 @@ class FakeEventService(EventService):
         i = next(self._counter)
         levels = ["info", "warn", "error"]
         return AdvisorEvent(id=str(i), text=f"Background check #{i} completed.", level=levels[i % 3])
+
+    def poll_many(self, limit: int = 100) -> List[AdvisorEvent]:
+        # the mock has an endless supply; keep it at one event per tick
+        evt = self.poll()
+        return [evt] if evt else []
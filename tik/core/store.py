@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import concurrent.futures
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Any, Callable, Collection, Dict, Coroutine, Iterable, Iterator, List, Optional, Sequence, Set
 
 from loguru import logger
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QUndoStack
 
-from .commands import AcceptChunkCommand, ResolveConflictCommand, RetractChunkCommand
+from .aio import AsyncRunner
+from .document_renderer import WindowedDocument
+from .evidence import Evidence, EvidenceIndex
+from .loader import DocumentLoader
+from .chunks import ChunkLike, ChunkRegistry
+from .commands import AcceptChunkCommand, AcceptManyCommand, ResolveConflictCommand, RetractChunkCommand, to_accepted
 from .models import (
     AcceptedChunk,
     AdvisorEvent,
@@ -19,8 +27,21 @@ from .models import (
     Person,
     Source,
 )
-from .services.base import CaseService, ChunkService, DocumentService, EventService, ObjectiveService
-from .persistence import load_record_json, save_record_json
+from .services.base import (
+    AsyncDocumentService,
+    AsyncEventService,
+    AsyncObjectiveService,
+    CaseService,
+    ChunkService,
+    DocumentService,
+    EventService,
+    ObjectiveService,
+)
+from .journal import RecordJournal, replay
+from .recorddb import RecordDB
+from .search import SearchHit, SearchIndex
+from .objectives import apply_objective_status
+from .policies import ConflictPolicy, resolve_bulk, same_chunk
 
 
 @dataclass
@@ -35,9 +56,20 @@ class Store(QObject):
     # Signals for UI
     selectionChanged = pyqtSignal()
     documentLoaded = pyqtSignal(str, list)  # (html, chunks_json_str)
+    documentWindowed = pyqtSignal(object)  # WindowedDocument; the reader pulls windows as it scrolls
+    documentFailed = pyqtSignal(str, str)  # (document id, error) for the selected document
     acceptedChanged = pyqtSignal()
+    fieldsChanged = pyqtSignal(object)  # frozenset of field ids emitted together with acceptedChanged
     objectivesChanged = pyqtSignal()
     advisorEvent = pyqtSignal(object)  # AdvisorEvent
+    advisorEvents = pyqtSignal(list)  # List[AdvisorEvent], one emission per drained batch
+    sourcesAdded = pyqtSignal(list)  # List[Source] appended to the current case
+    documentsAdded = pyqtSignal(list)  # List[Document] appended to the current case
+    caseLoaded = pyqtSignal()  # the whole case (incl. people and objectives) is in
+    evidenceChanged = pyqtSignal()  # more chunk files went into the evidence index
+    searchIndexed = pyqtSignal(int)  # documents (re)indexed for the case just loaded
+    _callOnGui = pyqtSignal(object)  # callable; emitted from the asyncio thread
+    _casePage = pyqtSignal(int, str, object)  # (generation, kind, payload) from the case loader thread
 
     def __init__(
         self,
@@ -57,15 +89,262 @@ class Store(QObject):
         self.sel = Selection()
         self.undo_stack = QUndoStack(self)
         self._conflict_resolver: Optional[Callable[[AcceptedChunk, DataChunk], Optional[AcceptedChunk]]] = None
+        self.loader = DocumentLoader(document_service, parent=self)
+        self.loader.loaded.connect(self._on_document_rendered)
+        self.loader.windowed.connect(self._on_document_windowed)
+        self.loader.failed.connect(self._on_document_failed)
+        # optional async services driven from a background asyncio loop
+        self._runner: Optional[AsyncRunner] = None
+        self._async_docs: Optional[AsyncDocumentService] = None
+        self._async_objectives: Optional[AsyncObjectiveService] = None
+        self._async_events: Optional[AsyncEventService] = None
+        self._objective_generation = 0  # async evaluations older than this are dropped
+        self._doc_future: Optional[concurrent.futures.Future] = None
+        self._callOnGui.connect(self._call_on_gui, Qt.ConnectionType.QueuedConnection)
+        self._casePage.connect(self._on_case_page, Qt.ConnectionType.QueuedConnection)
+        self._case_generation = 0
+        self._streamed_case: Optional[Case] = None
+        # coalesced change notifications (see batch/flush)
+        self._batch_depth = 0
+        self._flush_scheduled = False
+        self._pending_fields: Set[str] = set()
+        self._pending_accepted = False
+        self._pending_objectives = False
+        self._deferred_eval: Set[str] = set()
+        # record file being journaled since the last save/load
+        self.journal: Optional[RecordJournal] = None
+        # optional multi-case record database; people are hydrated on first selection
+        self.db: Optional[RecordDB] = None
+        self._hydrated: Set[str] = set()
+        self.search_index: Optional[SearchIndex] = None
+        # chunks of every document of the case by value / exclusive group, filled in the background
+        self.evidence = EvidenceIndex()
+        self.caseLoaded.connect(self.index_case_evidence)
+        # chunks of the documents shown lately, for drops that only carry a chunk id
+        self.chunk_registry = ChunkRegistry()
+
+    # === Change notifications ===
+    @contextmanager
+    def batch(self) -> Iterator["Store"]:
+        """
+        Group many edits: objectives are evaluated once and acceptedChanged /
+        fieldsChanged / objectivesChanged fire at most once, when the outermost batch exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def flush(self) -> None:
+        """Emit the pending change notifications now."""
+        self._flush_scheduled = False
+        if self._deferred_eval:
+            fields, self._deferred_eval = self._deferred_eval, set()
+            self.evaluate_objectives(fields)
+            self._flush_scheduled = False  # evaluation above may have re-scheduled us
+        if self._pending_accepted:
+            fields, self._pending_fields = frozenset(self._pending_fields), set()
+            self._pending_accepted = False
+            self.fieldsChanged.emit(fields)
+            self.acceptedChanged.emit()
+        if self._pending_objectives:
+            self._pending_objectives = False
+            self.objectivesChanged.emit()
+
+    def _schedule_flush(self) -> None:
+        # outside a batch, everything queued during this event-loop turn goes out together
+        if self._batch_depth == 0 and not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_if_scheduled)
+
+    def _flush_if_scheduled(self) -> None:
+        if self._flush_scheduled:
+            self.flush()
+
+    def _accepted_changed(self, fields: Collection[str]) -> None:
+        self._pending_fields.update(fields)
+        self._pending_accepted = True
+        if self._batch_depth:
+            self._deferred_eval.update(fields)
+        else:
+            self.evaluate_objectives(fields)
+        self._schedule_flush()
+
+    def _objectives_changed(self) -> None:
+        self._pending_objectives = True
+        self._schedule_flush()
+
+    def use_async_services(
+        self,
+        runner: AsyncRunner,
+        *,
+        documents: Optional[AsyncDocumentService] = None,
+        objectives: Optional[AsyncObjectiveService] = None,
+        events: Optional[AsyncEventService] = None,
+    ) -> None:
+        """Route document loads, objective evaluation and event polling through `runner`'s loop."""
+        self._runner = runner
+        self._async_docs = documents
+        self._async_objectives = objectives
+        self._async_events = events
+
+    def _submit(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        on_result: Callable[[Any], None],
+        on_error: Optional[Callable[[BaseException], None]] = None,
+    ) -> concurrent.futures.Future:
+        assert self._runner is not None
+        fut = self._runner.submit(coro)
+
+        def done(f: concurrent.futures.Future) -> None:
+            if f.cancelled():
+                return
+            exc = f.exception()
+            if exc is not None:
+                self._callOnGui.emit(lambda: logger.warning("Async service call failed: {}", exc))
+                if on_error is not None:
+                    self._callOnGui.emit(lambda: on_error(exc))
+                return
+            result = f.result()
+            self._callOnGui.emit(lambda: on_result(result))
+
+        fut.add_done_callback(done)
+        return fut
+
+    def _call_on_gui(self, fn: Callable[[], None]) -> None:
+        fn()
 
     # === Bootstrapping & selection ===
     def load_default_case(self) -> None:
         case = self.case_svc.load_default_case()
+        if self.db is not None:
+            if not self._db_copy_current(case.id):
+                self._import_case(case)
+            self.open_case(case.id)
+            return
         self.sel.case = case
         self.sel.person = case.people[0] if case.people else None
+        self._attach_journal(None)
         self.selectionChanged.emit()
+        self.evaluate_objectives()  # full pass: nothing about this case has been evaluated yet
+        self.caseLoaded.emit()
         logger.info("Loaded case {}", case.title)
 
+    def stream_default_case(self, page_size: int = 500) -> None:
+        """
+        Bootstrap the default case from a worker thread, page by page: sources and
+        documents show up (sourcesAdded / documentsAdded) while the rest is still
+        being parsed; people are selected and caseLoaded fires once everything is in.
+        """
+        self._case_generation += 1
+        generation = self._case_generation
+        self._streamed_case = None  # set by the "case" page; earlier pages have nowhere to go
+
+        def work() -> None:
+            try:
+                for kind, payload in self.case_svc.iter_default_case(page_size):
+                    if generation != self._case_generation:
+                        return
+                    self._casePage.emit(generation, kind, payload)
+            except Exception as e:  # reported on the GUI thread
+                self._casePage.emit(generation, "error", e)
+                return
+            self._casePage.emit(generation, "done", None)
+
+        threading.Thread(target=work, name="tik-case-loader", daemon=True).start()
+
+    def _on_case_page(self, generation: int, kind: str, payload: Any) -> None:
+        if generation != self._case_generation:
+            return
+        case = self._streamed_case
+        if kind == "case":
+            if self._db_copy_current(payload.id):
+                self._case_generation += 1  # the DB copy is up to date; stop parsing
+                self.open_case(payload.id)
+                return
+            self.sel = Selection(case=payload)
+            self._streamed_case = payload
+            self._hydrated = set()
+            self._attach_journal(None)
+            self.undo_stack.clear()
+            self.selectionChanged.emit()
+        elif case is None:
+            return
+        elif kind in ("sources", "documents", "people"):
+            getattr(case, kind).extend(payload)
+            if kind == "sources":
+                self.sourcesAdded.emit(payload)
+            elif kind == "documents":
+                self.documentsAdded.emit(payload)
+        elif kind == "objectives":
+            case._objectives = payload  # type: ignore[attr-defined]
+        elif kind == "error":
+            logger.error("Loading case failed: {}", payload)
+        elif kind == "done":
+            if self.db is not None:
+                self._import_case(case)
+                self._hydrated = set()  # records edited here come back from the DB on selection
+            if case.people:
+                self.select_person(case.people[0].id)
+            self.caseLoaded.emit()
+            logger.info("Loaded case {} ({} documents)", case.title, len(case.documents))
+
+    def _db_copy_current(self, case_id: str) -> bool:
+        """The record DB holds this case, imported from the seed as it is now."""
+        if self.db is None or not self.db.has_case(case_id):
+            return False
+        stamp = self.case_svc.default_case_stamp()
+        return stamp is None or self.db.case_stamp(case_id) == stamp
+
+    def _import_case(self, case: Case) -> None:
+        # a new or edited seed replaces the case, but fields accepted here are kept
+        assert self.db is not None
+        self.db.put_case(case, self.case_svc.default_case_stamp(), keep_accepted=True)
+
+    def use_record_db(self, db: RecordDB) -> None:
+        """Persist every edit to `db`; the current case (if any) is written there first."""
+        self.db = db
+        if self.sel.case is not None:
+            db.put_case(self.sel.case)
+            self._hydrated = {p.id for p in self.sel.case.people}
+
+    def open_case(self, case_id: str) -> bool:
+        """Open a case from the record DB; people are listed but their records load on selection."""
+        case = self.db.load_case(case_id) if self.db is not None else None
+        if case is None:
+            return False
+        self.sel = Selection(case=case)
+        self._hydrated = set()
+        self._attach_journal(None)
+        self.undo_stack.clear()  # commands hold people of the previous case
+        if case.people:
+            self.select_person(case.people[0].id)
+        else:
+            self.selectionChanged.emit()
+        self.caseLoaded.emit()
+        logger.info("Opened case {} ({} people)", case.title, len(case.people))
+        return True
+
+    def select_person(self, person_id: str) -> bool:
+        case = self.sel.case
+        person = next((p for p in case.people if p.id == person_id), None) if case else None
+        if case is None or person is None:
+            return False
+        if self.db is not None and person_id not in self._hydrated:
+            person.accepted = self.db.load_accepted(case.id, person_id)
+            self._hydrated.add(person_id)
+        self.sel.person = person
+        if self.journal is not None and self.journal.person is not person:
+            self._attach_journal(None)
+        self.selectionChanged.emit()  # no record was edited: no acceptedChanged / fieldsChanged
+        # full pass: statuses may come from a seed, another case or another person's record
+        self.evaluate_objectives()
+        return True
+
     def set_conflict_resolver(self, fn: Callable[[AcceptedChunk, DataChunk], Optional[AcceptedChunk]]) -> None:
         self._conflict_resolver = fn
 
@@ -78,9 +357,117 @@ class Store(QObject):
         if not doc:
             return
         html, chunks = self.doc_svc.load_document_html_and_chunks(doc.id)
+        self.evidence.add_document(doc.id, chunks)
+        self.chunk_registry.register(doc.id, chunks)
         self.documentLoaded.emit(html, chunks)
         self.selectionChanged.emit()
 
+    def select_document_async(self, doc: Optional[Document]) -> None:
+        """Like `select_document`, but renders on the loader pool; a newer selection cancels it."""
+        self.sel.document = doc
+        if self._doc_future is not None:
+            self._doc_future.cancel()
+            self._doc_future = None
+        if not doc:
+            self.loader.cancel()
+            return
+        if self._async_docs is not None:
+            doc_id = doc.id
+            self._doc_future = self._submit(
+                self._async_docs.load_document_html_and_chunks(doc_id),
+                lambda res: self._on_document_rendered(doc_id, *res),
+                lambda exc: self._on_document_failed(doc_id, str(exc)),
+            )
+            return
+        self.loader.load(doc.id)
+
+    def document_by_id(self, document_id: str) -> Optional[Document]:
+        case = self.sel.case
+        return next((d for d in case.documents if d.id == document_id), None) if case else None
+
+    def use_search_index(self, index: SearchIndex, data_dir: Optional[Path] = None) -> None:
+        """Search `index`; with `data_dir`, new or changed documents are indexed on a worker thread after each case load."""
+        self.search_index = index
+        if data_dir is not None:
+            self.caseLoaded.connect(lambda: self.index_case_search(data_dir))
+
+    def index_case_search(self, data_dir: Path) -> None:
+        case, index = self.sel.case, self.search_index
+        if case is None or index is None:
+            return
+        doc_ids = [d.id for d in case.documents]
+
+        def work() -> None:
+            try:
+                n = index.update_from_data_dir(data_dir, doc_ids)
+            except Exception as e:  # reported on the GUI thread
+                self._callOnGui.emit(lambda: logger.warning("Search indexing failed: {}", e))
+                return
+            self._callOnGui.emit(lambda: self.searchIndexed.emit(n))
+
+        threading.Thread(target=work, name="tik-search-index", daemon=True).start()
+
+    def search(self, query: str, limit: int = 20, document_id: Optional[str] = None) -> List[SearchHit]:
+        """Ranked hits over document text and chunk values; empty without a search index."""
+        if self.search_index is None:
+            return []
+        return self.search_index.search(query, limit, document_id)
+
+    def prefetch_documents(self, docs: List[Document]) -> None:
+        self.loader.prefetch(d.id for d in docs)
+
+    def _on_document_rendered(self, document_id: str, html: str, chunks: list) -> None:
+        self.evidence.add_document(document_id, chunks)  # freshest copy of its chunks
+        if not self.sel.document or self.sel.document.id != document_id:
+            return
+        self.chunk_registry.register(document_id, chunks)
+        self.documentLoaded.emit(html, chunks)
+        self.selectionChanged.emit()
+
+    def _on_document_windowed(self, document_id: str, doc: WindowedDocument) -> None:
+        if not self.sel.document or self.sel.document.id != document_id:
+            return
+        self.chunk_registry.register(document_id, (c for i in range(len(doc)) for c in doc.chunks(i)))
+        self.documentWindowed.emit(doc)
+        self.selectionChanged.emit()
+
+    def _on_document_failed(self, document_id: str, error: str) -> None:
+        if self.sel.document and self.sel.document.id == document_id:
+            self.documentFailed.emit(document_id, error)
+
+    # === Evidence ===
+    def index_case_evidence(self, batch: int = 200) -> None:
+        """(Re)build the evidence index for the current case from the chunk service, off the GUI thread."""
+        index = self.evidence = EvidenceIndex()
+        case = self.sel.case
+        if case is None:
+            return
+        doc_ids = [d.id for d in case.documents]
+
+        def work() -> None:
+            for n, doc_id in enumerate(doc_ids, 1):
+                if index is not self.evidence:
+                    return  # another case took over
+                if doc_id not in index:  # documents opened meanwhile are in already
+                    try:
+                        index.add_document(doc_id, self.chunk_svc.chunk_table(doc_id))
+                    except (OSError, ValueError) as e:
+                        logger.debug("No chunks indexed for {}: {}", doc_id, e)
+                if n % batch == 0 or n == len(doc_ids):
+                    self._callOnGui.emit(lambda: index is self.evidence and self.evidenceChanged.emit())
+
+        threading.Thread(target=work, name="tik-evidence", daemon=True).start()
+
+    def chunk_by_id(self, document_id: str, chunk_id: str) -> Optional[ChunkLike]:
+        """A chunk of a recently shown document, or None."""
+        return self.chunk_registry.get(document_id, chunk_id)
+
+    def evidence_for(self, item: Any) -> Evidence:
+        """Corroborating / conflicting chunks across the case for a chunk or an accepted value (itself left out)."""
+        own = getattr(item, "chunk_id", None) or getattr(item, "id", None)
+        skip = ((item.document_id, own),) if own else ()
+        return self.evidence.evidence(item.field, item.value, item.exclusive_group, exclude=skip)
+
     # === Accept / retract / conflicts ===
     def request_accept(self, chunk: DataChunk) -> None:
         person = self.sel.person
@@ -94,7 +481,7 @@ class Store(QObject):
             and current.exclusive_group == chunk.exclusive_group
         ):
             # No-op if identical chunk
-            if current.chunk_id == chunk.id:
+            if same_chunk(current, chunk):
                 logger.debug("Accept idempotent for chunk {}", chunk.id)
                 return
             logger.debug("Conflict detected on field {} between {} and {}", chunk.field, current.chunk_id, chunk.id)
@@ -104,57 +491,129 @@ class Store(QObject):
             if winner is None:
                 logger.debug("Conflict unresolved; abort")
                 return
-            cmd = ResolveConflictCommand(person, current, chunk, winner)
+            cmd = ResolveConflictCommand(person, current, chunk, winner, log=self._log_op)
             self.undo_stack.push(cmd)
         else:
-            cmd = AcceptChunkCommand(person, chunk)
+            cmd = AcceptChunkCommand(person, chunk, log=self._log_op)
             self.undo_stack.push(cmd)
-        # Objectives re-eval
-        self.evaluate_objectives()
-        self.acceptedChanged.emit()
+        self._accepted_changed((chunk.field,))
+
+    def accept_many(
+        self,
+        chunks: Iterable[DataChunk],
+        policy: ConflictPolicy = "confidence",
+        source_priority: Optional[Sequence[str]] = None,
+    ) -> int:
+        """
+        Accept a batch of chunks as one undo step. exclusive_group conflicts are
+        settled by `policy` ("confidence", "newest", "source_priority") instead of
+        the conflict resolver; objectives are re-evaluated once. Returns fields changed.
+        """
+        person = self.sel.person
+        if not person:
+            return 0
+        winners = resolve_bulk(person.accepted, chunks, policy, source_priority)
+        if not winners:
+            return 0
+        self.undo_stack.push(AcceptManyCommand(person, {f: to_accepted(c) for f, c in winners.items()}, log=self._log_op))
+        self._accepted_changed(winners.keys())
+        return len(winners)
 
     def retract_field(self, field: str) -> None:
         person = self.sel.person
         if not person or field not in person.accepted:
             return
-        cmd = RetractChunkCommand(person, field)
+        cmd = RetractChunkCommand(person, field, log=self._log_op)
         self.undo_stack.push(cmd)
-        self.evaluate_objectives()
-        self.acceptedChanged.emit()
+        self._accepted_changed((field,))
 
     # === Objectives & events ===
-    def evaluate_objectives(self) -> None:
+    def evaluate_objectives(self, fields: Optional[Collection[str]] = None) -> None:
+        """Re-evaluate objectives; `fields` restricts it to objectives that depend on them."""
         case = self.sel.case
         person = self.sel.person
         if not case or not person:
             return
-        changed = self.obj_svc.evaluate(case, person)
+        if self._async_objectives is not None:
+            # the coroutine runs on another thread: hand it a snapshot of the record and
+            # apply its statuses here, unless a newer evaluation was started meanwhile
+            snapshot = person.model_copy(update={"accepted": dict(person.accepted)})
+            self._objective_generation += 1
+            generation = self._objective_generation
+
+            def apply(status: Dict[str, bool]) -> None:
+                if generation != self._objective_generation or self.sel.case is not case:
+                    return
+                if apply_objective_status(getattr(case, "_objectives", []), status):
+                    self._objectives_changed()
+
+            self._submit(self._async_objectives.statuses(case, snapshot, fields), apply)
+            return
+        changed = self.obj_svc.evaluate(case, person, fields)
         if changed:
-            self.objectivesChanged.emit()
+            self._objectives_changed()
 
-    def poll_events(self) -> None:
-        evt = self.evt_svc.poll()
-        if evt:
+    def poll_events(self, limit: int = 100) -> None:
+        if self._async_events is not None:
+            self._submit(self._async_events.poll_many(limit), self._on_events)
+            return
+        self._on_events(self.evt_svc.poll_many(limit))
+
+    def _on_events(self, events: List[AdvisorEvent]) -> None:
+        if not events:
+            return
+        self.advisorEvents.emit(events)
+        for evt in events:
             self.advisorEvent.emit(evt)
-            logger.info("Advisor: {}", evt.text)
+        logger.info("Advisor: {} event(s), last: {}", len(events), events[-1].text)
+
+    # === Persistence (JSON snapshot + append-only journal) ===
+    def _log_op(self, person: Person, op: str, put: Dict[str, AcceptedChunk], drop: Collection[str]) -> None:
+        if self.journal is not None and self.journal.person is person:
+            self.journal.append(op, put, drop)
+        if self.db is not None and self.sel.case is not None:
+            self.db.update_accepted(self.sel.case.id, person.id, put, drop)
+
+    def _attach_journal(self, journal: Optional[RecordJournal]) -> None:
+        if self.journal is not None:
+            self.journal.close()
+        self.journal = journal
+
+    @property
+    def record_dirty(self) -> bool:
+        """The saved/loaded record has edits that only an explicit save writes out."""
+        return self.journal is not None and self.journal.dirty
 
-    # === Persistence (simple JSON) ===
     def save_to_path(self, path: Path) -> bool:
+        """
+        First save writes a full snapshot and starts journaling edits next to it;
+        saving again to the same path appends the edits made since to the journal.
+        Nothing reaches the file between saves.
+        """
         if not self.sel.case or not self.sel.person:
             return False
-        save_record_json(Path(path), self.sel.case, self.sel.person)
+        path = Path(path)
+        j = self.journal
+        if j is not None and j.path == path and j.person is self.sel.person:
+            j.sync()
+        else:
+            self._attach_journal(RecordJournal.create(path, self.sel.case, self.sel.person))
         logger.info("Saved record JSON to {}", path)
         return True
 
     def load_from_path(self, path: Path) -> bool:
         if not self.sel.case or not self.sel.person:
             return False
-        data = load_record_json(Path(path))
+        path = Path(path)
+        data = replay(path)
         accepted = {}
         for field, obj in (data.get("accepted") or {}).items():
             accepted[field] = AcceptedChunk.model_validate(obj)
+        touched = set(self.sel.person.accepted) | set(accepted)
         self.sel.person.accepted = accepted
-        self.evaluate_objectives()
-        self.acceptedChanged.emit()
+        if self.db is not None:
+            self.db.save_person(self.sel.case.id, self.sel.person)
+        self._attach_journal(RecordJournal.resume(path, self.sel.case, self.sel.person))
+        self._accepted_changed(touched)
         logger.info("Loaded record JSON from {}", path)
         return True
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QEvent, QMimeData, QModelIndex, QRectF, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter, QPen
+from PyQt6.QtWidgets import QAbstractItemView, QHeaderView, QStyledItemDelegate, QTableView
+
+from ...core.models import FieldDef
+from ...core.store import Store
+from ..widgets.drop_zone import CHUNK_MIME, chunk_for_drop, drag_ref, end_drag
+
+COL_LABEL, COL_VALUE, COL_DROP, COL_RETRACT = range(4)
+
+
+class FieldTableModel(QAbstractTableModel):
+    """Schema rows (label, accepted value, drop target, retract) of the selected person."""
+    acceptRequested = pyqtSignal(object)  # DataChunk-like, same as FieldDropZone
+
+    def __init__(self, store: Store):
+        super().__init__()
+        self.store = store
+        self._fields: List[FieldDef] = []
+        self._row: Dict[str, int] = {}
+
+    def set_fields(self, fields: List[FieldDef]) -> None:
+        self.beginResetModel()
+        self._fields = list(fields)
+        self._row = {f.id: i for i, f in enumerate(self._fields)}
+        self.endResetModel()
+
+    def field(self, row: int) -> FieldDef:
+        return self._fields[row]
+
+    def refresh(self, fields: Optional[Iterable[str]] = None) -> None:
+        """Repaint the value cells, only those of `fields` when given."""
+        if not self._fields:
+            return
+        if fields is None:
+            rows = [0, len(self._fields) - 1]
+        else:
+            rows = sorted(self._row[f] for f in fields if f in self._row)
+            if not rows:
+                return
+        self.dataChanged.emit(self.index(rows[0], COL_VALUE), self.index(rows[-1], COL_VALUE))
+
+    # --- QAbstractTableModel ---
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._fields)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else 4
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        f = self._fields[index.row()]
+        col = index.column()
+        if col == COL_VALUE and role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            person = self.store.sel.person
+            ac = person.accepted.get(f.id) if person else None
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return self.store.evidence_for(ac).summary() if ac else None
+            return ac.value if ac else "—"
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if col == COL_LABEL:
+            return f.label
+        return "Drop here" if col == COL_DROP else "Retract"
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        fl = Qt.ItemFlag.ItemIsEnabled
+        if index.isValid() and index.column() == COL_DROP:
+            fl |= Qt.ItemFlag.ItemIsDropEnabled
+        return fl
+
+    # --- drops: the target row decides the field ---
+    def mimeTypes(self) -> List[str]:
+        return [CHUNK_MIME, "application/json", "text/plain"]
+
+    def supportedDropActions(self) -> Qt.DropAction:
+        return Qt.DropAction.CopyAction | Qt.DropAction.MoveAction
+
+    def _drop_target(self, data: QMimeData, parent: QModelIndex) -> bool:
+        if not parent.isValid() or parent.column() != COL_DROP:
+            return False
+        ref = drag_ref(data)  # decoded once per drag, not on every move
+        return ref is not None and ref[1] == self._fields[parent.row()].id
+
+    def canDropMimeData(self, data, action, row, column, parent) -> bool:
+        return self._drop_target(data, parent)
+
+    def dropMimeData(self, data, action, row, column, parent) -> bool:
+        chunk = chunk_for_drop(data, self.store.chunk_by_id) if self._drop_target(data, parent) else None
+        end_drag()
+        if chunk is None:
+            return False
+        self.acceptRequested.emit(chunk)
+        return True
+
+
+class FieldCellDelegate(QStyledItemDelegate):
+    """Paints the drop/retract columns instead of hosting a widget per row; clicks on Retract are handled here."""
+    retractRequested = pyqtSignal(str)
+
+    def paint(self, painter: QPainter, option, index: QModelIndex) -> None:
+        if index.column() not in (COL_DROP, COL_RETRACT):
+            super().paint(painter, option, index)
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        r = QRectF(option.rect).adjusted(3, 3, -3, -3)
+        if index.column() == COL_DROP:
+            painter.setPen(QPen(QColor("#2a3a4a"), 1, Qt.PenStyle.DashLine))
+        else:
+            painter.setPen(QPen(QColor("#2a3a4a"), 1))
+        painter.drawRoundedRect(r, 6, 6)
+        painter.setPen(QColor("#93a4b8"))
+        painter.drawText(r, Qt.AlignmentFlag.AlignCenter, index.data())
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index: QModelIndex) -> bool:
+        if index.column() == COL_RETRACT and event.type() == QEvent.Type.MouseButtonRelease:
+            self.retractRequested.emit(model.field(index.row()).id)
+            return True
+        return False
+
+
+class FieldTableView(QTableView):
+    def __init__(self, model: FieldTableModel):
+        super().__init__()
+        self.setModel(model)
+        self.delegate = FieldCellDelegate(self)
+        self.setItemDelegate(self.delegate)
+        self.setAcceptDrops(True)
+        self.setDragDropMode(QAbstractItemView.DragDropMode.DropOnly)
+        self.setDropIndicatorShown(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setWordWrap(True)
+        self.verticalHeader().hide()
+        self.horizontalHeader().hide()
+        # fixed row height keeps scrolling independent of the field count
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(36)
+        self.horizontalHeader().setSectionResizeMode(COL_VALUE, QHeaderView.ResizeMode.Stretch)
+
+    def dragLeaveEvent(self, e):
+        end_drag()
+        super().dragLeaveEvent(e)
@@ -1,20 +1,51 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGridLayout, QPushButton, QHBoxLayout
+from PyQt6.QtCore import QEvent
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGridLayout, QPushButton, QHBoxLayout, QToolTip
 
 from ...core.store import Store
-from ...core.models import AcceptedChunk, FieldDef
+from ...core.models import AcceptedChunk, FieldDef, Person
 from ..widgets.drop_zone import FieldDropZone
+from .field_table import FieldTableModel, FieldTableView
+
+
+class _ValueLabel(QLabel):
+    """Accepted value of one field; the evidence tooltip is looked up when it is shown, like ToolTipRole in the table."""
+
+    def __init__(self, store: Store, field: str):
+        super().__init__("—")
+        self.store = store
+        self.field = field
+        self.setWordWrap(True)
+
+    def event(self, e: QEvent) -> bool:
+        if e.type() != QEvent.Type.ToolTip:
+            return super().event(e)
+        person = self.store.sel.person
+        ac = person.accepted.get(self.field) if person else None
+        if ac is None:
+            QToolTip.hideText()
+        else:
+            QToolTip.showText(e.globalPos(), self.store.evidence_for(ac).summary(), self)
+        return True
 
 
 class ProfilerPanel(QWidget):
+    # above this many fields the schema is shown in a FieldTableView instead of a widget grid
+    VIRTUAL_THRESHOLD = 40
+
     def __init__(self, store: Store):
         super().__init__()
         self.store = store
-        self._labels: dict[str, QLabel] = {}
-        self._zones: dict[str, FieldDropZone] = {}
+        # field id -> (label, value, drop zone, retract button), reused across selections
+        self._rows: Dict[str, Tuple[QLabel, _ValueLabel, FieldDropZone, QPushButton]] = {}
+        self._order: List[str] = []
+        self._schema_key: Optional[tuple] = None
+        self._person: Optional[Person] = None
+        self.table: Optional[FieldTableView] = None
+        self.table_model: Optional[FieldTableModel] = None
 
         lay = QVBoxLayout(self)
         title = QLabel("Record")
@@ -24,12 +55,14 @@ class ProfilerPanel(QWidget):
         self.grid = QGridLayout()
         lay.addLayout(self.grid)
 
-        self.btns = QHBoxLayout()
-        lay.addLayout(self.btns)
+        self.btns_host = QWidget()
+        self.btns = QHBoxLayout(self.btns_host)
+        self.btns.setContentsMargins(0, 0, 0, 0)
+        lay.addWidget(self.btns_host)
 
-        self.store.acceptedChanged.connect(self._refresh_values)
-        self.store.selectionChanged.connect(self._rebuild_fields)
-        self._rebuild_fields()
+        self.store.fieldsChanged.connect(self._refresh_values)
+        self.store.selectionChanged.connect(self._on_selection)
+        self._on_selection()
 
     def _current_fields(self) -> List[FieldDef]:
         case = self.store.sel.case
@@ -41,54 +74,76 @@ class ProfilerPanel(QWidget):
                     FieldDef(id="occupation", label="Occupation")]
         return case.schema
 
-    def _rebuild_fields(self) -> None:
-        # clear UI
-        while self.grid.count():
-            item = self.grid.takeAt(0)
-            w = item.widget()
-            if w:
-                w.setParent(None)
-        while self.btns.count():
-            item = self.btns.takeAt(0)
-            w = item.widget()
-            if w:
-                w.setParent(None)
-        self._labels.clear()
-        self._zones.clear()
-
-        row = 0
-        for f in self._current_fields():
-            lab = QLabel(f.label)
-            lab.setObjectName("Chip")
-            val = QLabel("—")
-            val.setWordWrap(True)
-
-            dz = FieldDropZone(f.id)
-            dz.acceptRequested.connect(self._on_accept)
-
-            self._labels[f.id] = val
-            self._zones[f.id] = dz
-
-            self.grid.addWidget(lab, row, 0)
-            self.grid.addWidget(val, row, 1)
-            self.grid.addWidget(dz, row, 2)
-            row += 1
-
-        # retract buttons
-        for f in self._current_fields():
-            b = QPushButton(f"Retract {f.label}")
-            b.clicked.connect(lambda _, field_id=f.id: self.store.retract_field(field_id))
-            self.btns.addWidget(b)
-
+    def _on_selection(self) -> None:
+        # selecting a source/document keeps the schema; only a different schema touches widgets
+        fields = self._current_fields()
+        key = tuple((f.id, f.label) for f in fields)
+        if key != self._schema_key:
+            self._schema_key = key
+            self._apply_schema(fields)
+        elif self.store.sel.person is not self._person:
+            self._refresh_values()
+        self._person = self.store.sel.person
+
+    def _apply_schema(self, fields: List[FieldDef]) -> None:
+        if len(fields) > self.VIRTUAL_THRESHOLD:
+            self._drop_rows(set(self._rows))
+            if self.table is None:
+                self.table_model = FieldTableModel(self.store)
+                self.table_model.acceptRequested.connect(self._on_accept)
+                self.table = FieldTableView(self.table_model)
+                self.table.delegate.retractRequested.connect(self.store.retract_field)
+                self.layout().insertWidget(self.layout().indexOf(self.btns_host), self.table, 1)
+            self.table_model.set_fields(fields)
+            self.table.show()
+            return
+        if self.table is not None:
+            self.table.hide()
+            self.table_model.set_fields([])
+
+        ids = [f.id for f in fields]
+        self._drop_rows(set(self._rows) - set(ids))
+        for f in fields:
+            row = self._rows.get(f.id)
+            if row is None:
+                val = _ValueLabel(self.store, f.id)
+                dz = FieldDropZone(f.id, resolve=self.store.chunk_by_id)
+                dz.acceptRequested.connect(self._on_accept)
+                b = QPushButton()
+                b.clicked.connect(lambda _, field_id=f.id: self.store.retract_field(field_id))
+                row = self._rows[f.id] = (QLabel(), val, dz, b)
+                row[0].setObjectName("Chip")
+            row[0].setText(f.label)
+            row[3].setText(f"Retract {f.label}")
+        if ids != self._order:
+            # re-place existing widgets; nothing is recreated
+            for i, fid in enumerate(ids):
+                lab, val, dz, b = self._rows[fid]
+                for col, w in enumerate((lab, val, dz)):
+                    self.grid.removeWidget(w)
+                    self.grid.addWidget(w, i, col)
+                self.btns.removeWidget(b)
+                self.btns.insertWidget(i, b)
+        self._order = ids
         self._refresh_values()
 
+    def _drop_rows(self, ids) -> None:
+        for fid in ids:
+            for w in self._rows.pop(fid):
+                w.setParent(None)
+                w.deleteLater()
+        self._order = [fid for fid in self._order if fid in self._rows]
+
     def _on_accept(self, chunk_payload) -> None:
         self.store.request_accept(chunk_payload)
 
-    def _refresh_values(self) -> None:
+    def _refresh_values(self, fields: Optional[Iterable[str]] = None) -> None:
+        """Update the value labels, only those of `fields` when given."""
+        if self.table_model is not None:
+            self.table_model.refresh(fields)  # no-op while the grid is in use
         person = self.store.sel.person
-        if not person:
-            return
-        for fid, lab in self._labels.items():
-            ac: AcceptedChunk | None = person.accepted.get(fid)
-            lab.setText(ac.value if ac else "—")
+        fids = self._rows.keys() if fields is None else [f for f in fields if f in self._rows]
+        for fid in fids:
+            # no person: reused labels must not keep the previous person's values
+            ac: AcceptedChunk | None = person.accepted.get(fid) if person else None
+            self._rows[fid][1].setText(ac.value if ac else "—")
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+from typing import Optional, Tuple
+
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLayout
 
+from ...core.commands import to_accepted
+from ...core.evidence import Evidence
 from ...core.models import AcceptedChunk, DataChunk
 
 
 class ConflictsDialog(QDialog):
-    def __init__(self, parent, current: AcceptedChunk, incoming: DataChunk):
+    def __init__(self, parent, current: AcceptedChunk, incoming: DataChunk,
+                 evidence: Optional[Tuple[Evidence, Evidence]] = None):
         super().__init__(parent)
         self.setWindowTitle("Resolve Conflict")
         self._winner: AcceptedChunk | None = None
@@ -14,7 +19,11 @@ class ConflictsDialog(QDialog):
         lay = QVBoxLayout(self)
         lay.addWidget(QLabel(f"Field: {current.field}"))
         lay.addWidget(QLabel(f"Keep current: {current.value}"))
+        if evidence is not None:
+            lay.addWidget(self._evidence_label(evidence[0]))
         lay.addWidget(QLabel(f"Use incoming: {incoming.value}"))
+        if evidence is not None:
+            lay.addWidget(self._evidence_label(evidence[1]))
 
         btns = QHBoxLayout()
         keep = QPushButton("Keep current")
@@ -22,15 +31,21 @@ class ConflictsDialog(QDialog):
         cancel = QPushButton("Cancel")
 
         keep.clicked.connect(lambda: self._choose(current))
-        use.clicked.connect(lambda: self._choose(AcceptedChunk(
-            chunk_id=incoming.id, field=incoming.field, value=incoming.value,
-            source_id=incoming.source_id, document_id=incoming.document_id,
-            exclusive_group=incoming.exclusive_group)))
+        use.clicked.connect(lambda: self._choose(to_accepted(incoming)))  # keeps quote/locator/confidence
         cancel.clicked.connect(self.reject)
 
         btns.addWidget(keep); btns.addWidget(use); btns.addWidget(cancel)
         lay.addLayout(btns)
 
+    @staticmethod
+    def _evidence_label(ev: Evidence) -> QLabel:
+        lab = QLabel("    " + ev.summary())
+        lab.setStyleSheet("color: #93a4b8;")
+        docs = sorted({c.document_id for c in ev.corroborating})
+        if docs:
+            lab.setToolTip("Same value in: " + ", ".join(docs[:20]) + (" …" if len(docs) > 20 else ""))
+        return lab
+
     def _choose(self, winner: AcceptedChunk) -> None:
         self._winner = winner
         self.accept()
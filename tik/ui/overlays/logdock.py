@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import List
+
 from PyQt6.QtWidgets import QDockWidget, QTextEdit
 from PyQt6.QtCore import Qt
 
@@ -17,5 +19,9 @@ class LogDock(QDockWidget):
     def append(self, evt: AdvisorEvent) -> None:
         self.view.append(f"[{evt.level.upper()}] {evt.text}")
 
+    def append_many(self, events: List[AdvisorEvent]) -> None:
+        # one append -> one layout pass for the whole batch
+        self.view.append("\n".join(f"[{evt.level.upper()}] {evt.text}" for evt in events))
+
     def append_text(self, text: str) -> None:
         self.view.append(text)
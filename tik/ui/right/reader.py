@@ -1,47 +1,94 @@
 from __future__ import annotations
 import json
-from pathlib import Path
+import os
+from html import escape
+from typing import Callable, Optional
 from importlib import resources
 from PyQt6.QtCore import Qt, QUrl
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QListView, QSplitter
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QListView, QListWidget, QListWidgetItem, QSplitter,
+)
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebEngineCore import QWebEnginePage
 
+from ...core.document_renderer import WindowedDocument
 from ...core.store import Store
+from .scheme import ReaderSchemeHandler, scheme_available
 from .widgets.source_list import SourceListModel, SourceListView
 from .widgets.document_list import DocumentListModel, DocumentListView
 
 
 class DebugPage(QWebEnginePage):
-    # Print JS console logs to help verify highlight.js is running
+    # Print JS console logs to help verify highlight.js is running; dropped unless debug
+    def __init__(self, parent=None, debug: bool = False):
+        super().__init__(parent)
+        self.debug = debug
+
     def javaScriptConsoleMessage(self, level, message, lineNumber, sourceID):  # type: ignore[override]
+        if not self.debug:
+            return
         print(f"[JS:{level.name}] {sourceID}:{lineNumber} — {message}")
 
 
 class DocumentView(QWebEngineView):
-    def __init__(self):
+    """
+    Loads the shell page (base.html + style.css + highlight.js) once; documents are then
+    swapped into #container. Fragments above STREAM_THRESHOLD bytes are fetched by the
+    page from the tik:// scheme instead of being inlined into a runJavaScript call.
+    """
+    STREAM_THRESHOLD = 256 * 1024
+
+    def __init__(self, debug: Optional[bool] = None):
         super().__init__()
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.NoContextMenu)
-        self.setPage(DebugPage(self))  # enable console log passthrough
+        # TIK_WEB_DEBUG=1 turns on highlight.js logging and forwards the JS console to stdout
+        self.debug = bool(os.environ.get("TIK_WEB_DEBUG")) if debug is None else debug
+        self.setPage(DebugPage(self, self.debug))
+        self._ready = False
+        self._pending: Optional[Callable[[], None]] = None  # latest document asked for before the shell loaded
+        self._handler: Optional[ReaderSchemeHandler] = None
+        self.loadFinished.connect(self._on_shell_loaded)
+        if scheme_available():
+            self._handler = ReaderSchemeHandler.install(self.page().profile())
+            url = ReaderSchemeHandler.shell_url()
+        else:
+            # tik:// wasn't registered before QApplication; fall back to the file shell
+            url = QUrl.fromLocalFile(str(resources.files("tik.ui.web").joinpath("base.html")))
+        if self.debug:
+            url.setQuery("debug")
+        self.setUrl(url)
+
+    def _on_shell_loaded(self, ok: bool) -> None:
+        self._ready = ok
+        if ok and self._pending is not None:
+            show, self._pending = self._pending, None
+            show()
 
     def set_document(self, html_fragment: str) -> None:
-        # Build a small HTML page that links our local CSS/JS assets.
-        base = resources.files("tik.ui.web")  # requires tik/ui/web/__init__.py
-        css_url = QUrl.fromLocalFile(str(base.joinpath("style.css")))
-        js_url = QUrl.fromLocalFile(str(base.joinpath("highlight.js")))
-        tpl = f"""<!doctype html>
-<html>
-<head>
-  <meta charset="utf-8">
-  <link rel="stylesheet" href="{css_url.toString()}">
-</head>
-<body>
-  <div id="container">{html_fragment}</div>
-  <script src="{js_url.toString()}"></script>
-</body>
-</html>"""
-        # Use a file base URL to relax same-origin for local assets.
-        self.setHtml(tpl, QUrl.fromLocalFile(str(base)))
+        if not self._ready:
+            self._pending = lambda: self.set_document(html_fragment)
+            return
+        if self._handler is not None and len(html_fragment) > self.STREAM_THRESHOLD:
+            url = self._handler.put(html_fragment)
+            self.page().runJavaScript(f"window.tikLoadDocument({json.dumps(url.toString())})")
+        else:
+            self.page().runJavaScript(f"window.tikSetDocument({json.dumps(html_fragment)})")
+
+    def show_error(self, document_id: str, error: str) -> None:
+        """Replace the document with a note that it could not be loaded."""
+        self.set_document(f'<p class="tik-error">Could not load {escape(document_id)}: {escape(error)}</p>')
+
+    def set_windowed(self, doc: WindowedDocument) -> None:
+        """Show a very large document; the page fetches windows near the viewport and drops far ones."""
+        if self._handler is None:
+            # no tik:// scheme to pull windows from: render it whole
+            self.set_document("".join(doc.render(i) for i in range(len(doc))))
+            return
+        if not self._ready:
+            self._pending = lambda: self.set_windowed(doc)
+            return
+        base = self._handler.put_windowed(doc)
+        self.page().runJavaScript(f"window.tikOpenWindows({json.dumps(base)}, {json.dumps(doc.lengths())})")
 
 
 class ReaderPanel(QWidget):
@@ -61,8 +108,16 @@ class ReaderPanel(QWidget):
         self.doc_view = DocumentListView()
         self.doc_view.setModel(self.doc_model)
 
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Search documents and chunks…")
+        self.search_box.setClearButtonEnabled(True)
+        self.search_results = QListWidget()
+        self.search_results.hide()
+
         left = QWidget()
         l = QVBoxLayout(left)
+        l.addWidget(self.search_box)
+        l.addWidget(self.search_results)
         l.addWidget(QLabel("Sources"))
         l.addWidget(self.source_view)
         l.addWidget(QLabel("Documents"))
@@ -79,8 +134,37 @@ class ReaderPanel(QWidget):
 
     def _wire(self) -> None:
         self.source_view.sourceSelected.connect(self.store.select_source)
-        self.doc_view.documentSelected.connect(self.store.select_document)
+        self.doc_view.documentSelected.connect(self._on_document_selected)
         self.store.documentLoaded.connect(self._on_document_loaded)
+        self.store.documentWindowed.connect(self.web.set_windowed)
+        self.store.documentFailed.connect(self.web.show_error)
+        self.search_box.returnPressed.connect(self._run_search)
+        self.search_box.textChanged.connect(lambda t: t or self.search_results.hide())
+        self.search_results.itemActivated.connect(self._open_hit)
+        self.search_results.itemClicked.connect(self._open_hit)
+
+    def _run_search(self) -> None:
+        hits = self.store.search(self.search_box.text(), limit=50)
+        self.search_results.clear()
+        for h in hits:
+            label = f"{h.field}: {h.snippet}" if h.kind == "chunk" else h.snippet
+            item = QListWidgetItem(f"[{h.document_id}] {label}")
+            item.setData(Qt.ItemDataRole.UserRole, h)
+            self.search_results.addItem(item)
+        if not hits:
+            self.search_results.addItem("No matches")
+        self.search_results.show()
+
+    def _open_hit(self, item: QListWidgetItem) -> None:
+        hit = item.data(Qt.ItemDataRole.UserRole)
+        doc = self.store.document_by_id(hit.document_id) if hit else None
+        if doc is not None:
+            self._on_document_selected(doc)
+
+    def _on_document_selected(self, doc) -> None:
+        self.store.select_document_async(doc)
+        if doc is not None:
+            self.store.prefetch_documents(self.doc_model.neighbours(doc))
 
     def _on_document_loaded(self, html, _chunks_json_list) -> None:
         self.web.set_document(html)
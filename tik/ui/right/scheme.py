@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from importlib import resources
+from itertools import count
+from typing import Optional
+
+from PyQt6.QtCore import QBuffer, QByteArray, QUrl
+from PyQt6.QtWebEngineCore import (
+    QWebEngineProfile, QWebEngineUrlRequestJob, QWebEngineUrlScheme, QWebEngineUrlSchemeHandler,
+)
+
+from ...core.document_renderer import WindowedDocument
+
+SCHEME = b"tik"
+HOST = "reader"
+_TYPES = {".html": b"text/html", ".css": b"text/css", ".js": b"text/javascript"}
+
+
+def register_reader_scheme() -> None:
+    """Declare tik:// to Chromium; has to run before the QApplication is created."""
+    if scheme_available():
+        return
+    scheme = QWebEngineUrlScheme(SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    scheme.setFlags(
+        QWebEngineUrlScheme.Flag.SecureScheme
+        | QWebEngineUrlScheme.Flag.LocalAccessAllowed
+        | QWebEngineUrlScheme.Flag.CorsEnabled
+    )
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+def scheme_available() -> bool:
+    return not QWebEngineUrlScheme.schemeByName(SCHEME).name().isEmpty()
+
+
+class ReaderSchemeHandler(QWebEngineUrlSchemeHandler):
+    """
+    Serves the reader shell (tik://reader/base.html + its assets from tik/ui/web),
+    document fragments put() here, and the windows of put_windowed() documents
+    (rendered on request), so large documents are streamed to the page instead of
+    going through setHtml / runJavaScript.
+    """
+
+    def __init__(self, keep: int = 4, parent=None):
+        super().__init__(parent)
+        self._docs: "OrderedDict[str, bytes]" = OrderedDict()
+        self._windowed: "OrderedDict[str, WindowedDocument]" = OrderedDict()
+        self._keep = keep
+        self._ids = count(1)
+
+    @staticmethod
+    def install(profile: QWebEngineProfile) -> "ReaderSchemeHandler":
+        handler = profile.urlSchemeHandler(QByteArray(SCHEME))
+        if not isinstance(handler, ReaderSchemeHandler):
+            handler = ReaderSchemeHandler(parent=profile)
+            profile.installUrlSchemeHandler(QByteArray(SCHEME), handler)
+        return handler
+
+    @staticmethod
+    def shell_url() -> QUrl:
+        return QUrl(f"{SCHEME.decode()}://{HOST}/base.html")
+
+    def put(self, html: str) -> QUrl:
+        """URL the page can fetch `html` from; only the last `keep` documents are held."""
+        key = str(next(self._ids))
+        self._docs[key] = html.encode("utf-8")
+        while len(self._docs) > self._keep:
+            self._docs.popitem(last=False)
+        return QUrl(f"{SCHEME.decode()}://{HOST}/doc/{key}")
+
+    def put_windowed(self, doc: WindowedDocument) -> str:
+        """Base URL under which window i of `doc` is served as `<base><i>`."""
+        key = str(next(self._ids))
+        self._windowed[key] = doc
+        while len(self._windowed) > self._keep:
+            self._windowed.popitem(last=False)
+        return f"{SCHEME.decode()}://{HOST}/win/{key}/"
+
+    def _window(self, path: str) -> Optional[bytes]:
+        key, _, i = path[4:].partition("/")
+        doc = self._windowed.get(key)
+        if doc is None or not i.isdigit() or int(i) >= len(doc):
+            return None
+        return doc.render(int(i)).encode("utf-8")
+
+    def requestStarted(self, job: QWebEngineUrlRequestJob) -> None:  # type: ignore[override]
+        path = job.requestUrl().path().lstrip("/")
+        if path.startswith("doc/"):
+            data, ctype = self._docs.get(path[4:]), b"text/html"
+        elif path.startswith("win/"):
+            data, ctype = self._window(path), b"text/html"
+        else:
+            f = resources.files("tik.ui.web").joinpath(path)
+            suffix = "." + path.rsplit(".", 1)[-1] if "." in path else ""
+            ok = suffix in _TYPES and "/" not in path and f.is_file()  # flat asset dir only
+            data = f.read_bytes() if ok else None
+            ctype = _TYPES.get(suffix, b"application/octet-stream")
+        if data is None:
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+        buf = QBuffer(job)  # freed together with the job
+        buf.setData(data)
+        job.reply(QByteArray(ctype), buf)
@@ -1,40 +1,83 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, pyqtSignal
+from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QListView
 from PyQt6.QtCore import QItemSelectionModel
 
-from ....core.models import Document
+from ....core.models import Case, Document
 from ....core.store import Store
+from .paged import PagedListModel
 
 
-class DocumentListModel(QAbstractListModel):
+class DocumentListModel(PagedListModel[Document]):
+    """
+    Documents of the selected source (all documents when no source is selected).
+    A source -> documents index is kept per case, so switching sources is a dict
+    lookup and neighbours() doesn't scan the case.
+    """
+
     def __init__(self, store: Store):
         super().__init__()
         self.store = store
-        self._items: List[Document] = store.sel.case.documents if store.sel.case else []
-        store.selectionChanged.connect(self._reload)
+        self._case: Optional[Case] = None
+        self._source_id: Optional[str] = None
+        self._by_source: Dict[str, List[Document]] = {}
+        self._pos: Dict[str, int] = {}  # document id -> position within its source
+        self._sync()
+        store.selectionChanged.connect(self._sync)
+        store.documentsAdded.connect(self._append)
+
+    def _index(self, docs: List[Document]) -> None:
+        for d in docs:
+            same = self._by_source.setdefault(d.source_id, [])
+            self._pos[d.id] = len(same)
+            same.append(d)
 
-    def _reload(self) -> None:
-        self.beginResetModel()
-        self._items = self.store.sel.case.documents if self.store.sel.case else []
-        self.endResetModel()
+    def _filtered(self) -> List[Document]:
+        if self._source_id is None:
+            return self._case.documents if self._case else []
+        return self._by_source.get(self._source_id, [])
 
-    def rowCount(self, parent=QModelIndex()) -> int:
-        return 0 if parent.isValid() else len(self._items)
+    def _sync(self) -> None:
+        # selecting a document (or a person) leaves the rows alone
+        case = self.store.sel.case
+        src = self.store.sel.source
+        source_id = src.id if src else None
+        if case is self._case and source_id == self._source_id:
+            return
+        if case is not self._case:
+            self._case = case
+            self._by_source, self._pos = {}, {}
+            self._index(case.documents if case else [])
+        self._source_id = source_id
+        self._set_items(self._filtered())
 
-    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
-        if not index.isValid():
-            return None
-        doc = self._items[index.row()]
-        if role == Qt.ItemDataRole.DisplayRole:
-            return doc.title
-        return None
+    def _append(self, items: List[Document]) -> None:
+        # pages arrive while the case is still loading
+        self._index(items)
+        if self._source_id is not None:
+            items = [d for d in items if d.source_id == self._source_id]
+        if items:
+            self._extend(items)
 
     def document(self, row: int) -> Document:
-        return self._items[row]
+        return self.item(row)
+
+    def neighbours(self, doc: Document, radius: int = 1) -> List[Document]:
+        """Documents listed around `doc` that belong to the same source (nearest first)."""
+        same = self._by_source.get(doc.source_id, [])
+        i = self._pos.get(doc.id)
+        if i is None or i >= len(same) or same[i].id != doc.id:
+            return []
+        out: List[Document] = []
+        for k in range(1, radius + 1):
+            if i + k < len(same):
+                out.append(same[i + k])
+            if i - k >= 0:
+                out.append(same[i - k])
+        return out
 
 
 class DocumentListView(QListView):
@@ -43,6 +86,7 @@ class DocumentListView(QListView):
     def __init__(self):
         super().__init__()
         self.setSelectionMode(QListView.SelectionMode.SingleSelection)
+        self.setUniformItemSizes(True)
         self._sel_model: Optional[QItemSelectionModel] = None
 
     def setModel(self, model) -> None:  # type: ignore[override]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import Any, Generic, List, Sequence, TypeVar
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+T = TypeVar("T")
+
+
+class PagedListModel(QAbstractListModel, Generic[T]):
+    """
+    List model over `_all` that exposes rows `page_size` at a time through
+    canFetchMore/fetchMore. Changes are reported as row inserts/removes only,
+    so views keep their scroll position and never see a model reset.
+    """
+    page_size = 200
+
+    def __init__(self):
+        super().__init__()
+        self._all: List[T] = []
+        self._loaded = 0
+
+    # --- QAbstractListModel ---
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._all)
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        n = min(self.page_size, len(self._all) - self._loaded)
+        if n <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + n - 1)
+        self._loaded += n
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display(self._all[index.row()])
+        return None
+
+    # --- helpers for subclasses ---
+    def _display(self, item: T) -> Any:
+        return getattr(item, "title", str(item))
+
+    def item(self, row: int) -> T:
+        return self._all[row]
+
+    def _set_items(self, items: Sequence[T]) -> None:
+        """Replace the backing list: remove the loaded rows, then show the first page."""
+        if self._loaded:
+            self.beginRemoveRows(QModelIndex(), 0, self._loaded - 1)
+            self._all, self._loaded = [], 0
+            self.endRemoveRows()
+        self._all = list(items)
+        self.fetchMore()
+
+    def _extend(self, items: Sequence[T]) -> None:
+        # shown right away while the first page isn't full or everything was already shown;
+        # otherwise they wait behind canFetchMore like any other unloaded row
+        shown_all = self._loaded == len(self._all)
+        self._all.extend(items)
+        if shown_all or self._loaded < self.page_size:
+            self.fetchMore()
@@ -2,39 +2,38 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, pyqtSignal
+from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QListView
 from PyQt6.QtCore import QItemSelectionModel
 
-from ....core.models import Source
+from ....core.models import Case, Source
 from ....core.store import Store
+from .paged import PagedListModel
 
 
-class SourceListModel(QAbstractListModel):
+class SourceListModel(PagedListModel[Source]):
     def __init__(self, store: Store):
         super().__init__()
         self.store = store
-        self._items: List[Source] = store.sel.case.sources if store.sel.case else []
-        store.selectionChanged.connect(self._reload)
+        self._case: Optional[Case] = None
+        self._sync_case()
+        store.selectionChanged.connect(self._sync_case)
+        store.sourcesAdded.connect(self._append)
 
-    def _reload(self) -> None:
-        self.beginResetModel()
-        self._items = self.store.sel.case.sources if self.store.sel.case else []
-        self.endResetModel()
-
-    def rowCount(self, parent=QModelIndex()) -> int:
-        return 0 if parent.isValid() else len(self._items)
+    def _sync_case(self) -> None:
+        # only a different case changes the rows; person/source/document selection doesn't
+        case = self.store.sel.case
+        if case is self._case:
+            return
+        self._case = case
+        self._set_items(case.sources if case else [])
 
-    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
-        if not index.isValid():
-            return None
-        src = self._items[index.row()]
-        if role == Qt.ItemDataRole.DisplayRole:
-            return src.title
-        return None
+    def _append(self, items: List[Source]) -> None:
+        # pages arrive while the case is still loading
+        self._extend(items)
 
     def source(self, row: int) -> Source:
-        return self._items[row]
+        return self.item(row)
 
 
 class SourceListView(QListView):
@@ -43,6 +42,7 @@ class SourceListView(QListView):
     def __init__(self):
         super().__init__()
         self.setSelectionMode(QListView.SelectionMode.SingleSelection)
+        self.setUniformItemSizes(True)
         self._sel_model: Optional[QItemSelectionModel] = None
 
     def setModel(self, model) -> None:  # type: ignore[override]
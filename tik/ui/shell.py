@@ -28,7 +28,7 @@ from .widgets.toast import Toast
 class MainWindow(QMainWindow):
     def __init__(self, store: Store):
         super().__init__()
-        self.setWindowTitle("The Investigation Kit")
+        self.setWindowTitle("The Investigation Kit[*]")  # [*]: unsaved record edits
         self.store = store
         self.toast = Toast(self)
 
@@ -54,7 +54,8 @@ class MainWindow(QMainWindow):
         self._wire_signals()
 
         def resolver(current, incoming):
-            dlg = ConflictsDialog(self, current=current, incoming=incoming)
+            evidence = (self.store.evidence_for(current), self.store.evidence_for(incoming))
+            dlg = ConflictsDialog(self, current=current, incoming=incoming, evidence=evidence)
             if dlg.exec():
                 return dlg.winner()
             return None
@@ -87,9 +88,15 @@ class MainWindow(QMainWindow):
         tb.addAction(act_redo)
 
     def _wire_signals(self) -> None:
-        self.store.advisorEvent.connect(lambda evt: (self.toast.show(evt.text), self.logdock.append(evt)))
+        self.store.advisorEvents.connect(self._on_advisor_events)
+        self.store.acceptedChanged.connect(lambda: self.setWindowModified(self.store.record_dirty))
         self.store.objectivesChanged.connect(lambda: self.logdock.append_text("Objectives updated"))
 
+    def _on_advisor_events(self, events) -> None:
+        self.logdock.append_many(events)
+        text = events[-1].text if len(events) == 1 else f"{len(events)} advisor events — {events[-1].text}"
+        self.toast.show(text)
+
     def _open_objectives(self) -> None:
         dlg = ObjectivesDialog(self, self.store)
         dlg.exec()
@@ -130,6 +137,7 @@ class MainWindow(QMainWindow):
         if not path:
             return
         ok = self.store.save_to_path(Path(path))
+        self.setWindowModified(self.store.record_dirty)
         if ok:
             QMessageBox.information(self, "Save", f"Saved: {path}")
         else:
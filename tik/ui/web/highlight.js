@@ -1,4 +1,8 @@
 (function () {
+  // Debug logging is off unless the shell is opened with ?debug (DocumentView(debug=True)).
+  const DEBUG = new URLSearchParams(window.location.search).has("debug");
+  function log() { if (DEBUG) console.log.apply(console, arguments); }
+
   function toPayload(span) {
     return JSON.stringify({
       chunkId: span.getAttribute("data-chunk-id"),
@@ -11,30 +15,110 @@
       quote: span.getAttribute("data-quote") || null,
       locator: span.getAttribute("data-locator") || null,
       confidence: (function (v) {
-        try { return v === "" ? null : parseFloat(v); } catch (e) { return null; }
+        try { return v === "" || v === null ? null : parseFloat(v); } catch (e) { return null; }
       })(span.getAttribute("data-confidence"))
     });
   }
 
+  function chunkAt(ev) {
+    const t = ev.target;
+    return t && t.closest ? t.closest("span.chunk") : null;
+  }
+
+  // One set of listeners on #container, whatever the chunk count; spans are only
+  // touched when the pointer reaches them, and payloads are built at dragstart.
   function setup() {
-    const spans = document.querySelectorAll("span.chunk");
-    console.log("[TIK] highlight.js attached — chunks:", spans.length);
-    spans.forEach(function (sp) {
-      if (!sp.hasAttribute("draggable")) sp.setAttribute("draggable", "true");
-      sp.addEventListener("dragstart", function (ev) {
-        const payload = toPayload(sp);
-        try { ev.dataTransfer.effectAllowed = "copy"; } catch (e) {}
-        try { ev.dataTransfer.dropEffect = "copy"; } catch (e) {}
-        // Set BOTH, some Qt/Chromium builds only expose one of them
-        ev.dataTransfer.setData("text/plain", payload);
-        ev.dataTransfer.setData("application/json", payload);
-        console.log("[TIK] dragstart payload:", payload);
-      });
-      sp.addEventListener("mouseenter", function () { sp.classList.add("hover"); });
-      sp.addEventListener("mouseleave", function () { sp.classList.remove("hover"); });
+    const container = document.getElementById("container");
+    if (!container || container.dataset.tikWired) return;
+    container.dataset.tikWired = "1";
+    container.addEventListener("mouseover", function (ev) {
+      const sp = chunkAt(ev);
+      // renderer output is draggable already; hydrate spans from other sources lazily
+      if (sp && !sp.hasAttribute("draggable")) sp.setAttribute("draggable", "true");
     });
+    container.addEventListener("dragstart", function (ev) {
+      const sp = chunkAt(ev);
+      if (!sp) return;
+      const payload = toPayload(sp);
+      try { ev.dataTransfer.effectAllowed = "copy"; } catch (e) {}
+      try { ev.dataTransfer.dropEffect = "copy"; } catch (e) {}
+      // document id + chunk id + field is all the profiler needs; it looks the chunk up in the Store registry
+      ev.dataTransfer.setData("application/x-tik-chunk", [
+        sp.getAttribute("data-document-id"), sp.getAttribute("data-chunk-id"), sp.getAttribute("data-field"),
+      ].join("\t"));
+      // JSON fallback: set BOTH, some Qt/Chromium builds only expose one of them
+      ev.dataTransfer.setData("text/plain", payload);
+      ev.dataTransfer.setData("application/json", payload);
+      log("[TIK] dragstart payload:", payload);
+    });
+    log("[TIK] highlight.js attached");
   }
 
+  // Document swaps from DocumentView: the shell page stays loaded, only #container changes.
+  let seq = 0;
+  let observer = null;  // IntersectionObserver of the open windowed document
+  function swap(html, mine) {
+    if (mine !== seq) return;  // a newer document was requested meanwhile
+    if (observer) { observer.disconnect(); observer = null; }
+    document.getElementById("container").innerHTML = html;
+    window.scrollTo(0, 0);
+    if (DEBUG) log("[TIK] document swapped — chunks:", document.querySelectorAll("span.chunk").length);
+  }
+  window.tikSetDocument = function (html) { swap(html, ++seq); };
+  window.tikLoadDocument = function (url) {
+    const mine = ++seq;
+    fetch(url)
+      .then(function (r) { return r.text(); })
+      .then(function (html) { swap(html, mine); })
+      .catch(function (e) { console.log("[TIK] document fetch failed:", url, e); });
+  };
+
+  // Windowed documents: one placeholder per window, sized from its length; windows are
+  // fetched as they come within a few screens of the viewport and emptied (keeping
+  // their measured height) once they leave it, so the DOM stays a few windows big.
+  const PX_PER_CHAR = 0.3;
+  window.tikOpenWindows = function (base, lengths) {
+    const mine = ++seq;
+    if (observer) observer.disconnect();
+    const container = document.getElementById("container");
+    container.innerHTML = "";
+    window.scrollTo(0, 0);
+    const frag = document.createDocumentFragment();
+    lengths.forEach(function (n, i) {
+      const div = document.createElement("div");
+      div.className = "tik-window";
+      div.dataset.index = String(i);
+      div.style.minHeight = Math.max(20, Math.round(n * PX_PER_CHAR)) + "px";
+      frag.appendChild(div);
+    });
+    container.appendChild(frag);
+
+    function load(div) {
+      if (div.dataset.state) return;
+      div.dataset.state = "loading";
+      fetch(base + div.dataset.index)
+        .then(function (r) { return r.text(); })
+        .then(function (html) {
+          if (mine !== seq || div.dataset.state !== "loading") return;
+          div.innerHTML = html;
+          div.style.minHeight = "";
+          div.dataset.state = "loaded";
+        })
+        .catch(function (e) { delete div.dataset.state; log("[TIK] window fetch failed:", e); });
+    }
+    function unload(div) {
+      if (div.dataset.state !== "loaded") { delete div.dataset.state; return; }
+      div.style.minHeight = div.offsetHeight + "px";
+      div.innerHTML = "";
+      delete div.dataset.state;
+    }
+    observer = new IntersectionObserver(function (entries) {
+      entries.forEach(function (e) { (e.isIntersecting ? load : unload)(e.target); });
+    }, { rootMargin: "200% 0px" });
+    container.querySelectorAll("div.tik-window").forEach(function (d) { observer.observe(d); });
+    log("[TIK] windowed document — windows:", lengths.length);
+  };
+
   if (document.readyState === "loading") document.addEventListener("DOMContentLoaded", setup);
   else setup();
 })();
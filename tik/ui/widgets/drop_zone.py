@@ -1,78 +1,149 @@
 from __future__ import annotations
 import json
-from typing import Optional, Any
+from typing import Any, Callable, Optional, Tuple
 from PyQt6.QtCore import pyqtSignal, Qt, QMimeData
 from PyQt6.QtWidgets import QLabel, QWidget
 
+from ...core.chunks import ChunkKey, ChunkLike, ChunkRecord
+
+# highlight.js đặt "<document id>\t<chunk id>\t<field>" vào MIME này; JSON chỉ còn là fallback
+CHUNK_MIME = "application/x-tik-chunk"
+
+# ((document id, chunk id), field, full JSON payload when that's what the drag carried)
+DragRef = Tuple[ChunkKey, str, Optional[dict]]
+Resolver = Callable[[str, str], Optional[ChunkLike]]
+
+
+def parse_drop(md: QMimeData) -> Optional[dict[str, Any]]:
+    """Chunk payload kéo từ reader; application/json trước, text/plain là fallback."""
+    if md.hasFormat("application/json"):
+        try:
+            raw = md.data("application/json")
+            if hasattr(raw, "data"):
+                raw = raw.data()
+            s = bytes(raw).decode("utf-8", errors="ignore")
+            return json.loads(s)
+        except Exception:
+            pass
+    if md.hasText():
+        try:
+            return json.loads(md.text())
+        except Exception:
+            pass
+    return None
+
+
+class _DragSession:
+    """The MIME data of the drag in progress and what it decoded to; enter/move/drop decode it once."""
+    md: Optional[QMimeData] = None
+    payload: bytes = b""
+    ref: Optional[DragRef] = None
+
+
+def _payload(md: QMimeData) -> bytes:
+    # cheap to read; a drag cancelled elsewhere never calls end_drag, and Qt may
+    # reuse its QMimeData's address, so identity alone does not name the drag
+    for fmt in (CHUNK_MIME, "application/json"):
+        if md.hasFormat(fmt):
+            return fmt.encode() + b"\n" + bytes(md.data(fmt))
+    return md.text().encode("utf-8") if md.hasText() else b""
+
+
+def drag_ref(md: QMimeData) -> Optional[DragRef]:
+    payload = _payload(md)
+    if md is _DragSession.md and payload == _DragSession.payload:
+        return _DragSession.ref
+    ref: Optional[DragRef] = None
+    if md.hasFormat(CHUNK_MIME):
+        parts = bytes(md.data(CHUNK_MIME)).decode("utf-8").split("\t")
+        if len(parts) == 3:
+            ref = ((parts[0], parts[1]), parts[2], None)
+    else:
+        data = parse_drop(md)
+        if data and data.get("chunkId"):
+            ref = ((data.get("documentId") or "", data["chunkId"]), data.get("field"), data)
+    _DragSession.md, _DragSession.payload, _DragSession.ref = md, payload, ref
+    return ref
+
+
+def end_drag() -> None:
+    _DragSession.md = _DragSession.ref = None
+    _DragSession.payload = b""
+
+
+def chunk_from_drop(data: dict[str, Any]) -> ChunkRecord:
+    """Chunk built from a JSON drop payload, provenance included (used when the registry misses)."""
+    return ChunkRecord(
+        data["chunkId"], data["documentId"], data["sourceId"], data["field"], data["value"],
+        data.get("offsetStart", 0), data.get("offsetEnd", 0),
+        exclusive_group=data.get("exclusiveGroup") or None,
+        quote=data.get("quote"),
+        locator=data.get("locator"),
+        confidence=data.get("confidence"),
+    )
+
+
+def chunk_for_drop(md: QMimeData, resolve: Optional[Resolver] = None) -> Optional[ChunkLike]:
+    """The dropped chunk: from `resolve` (chunk registry) by document and chunk id, else decoded from the JSON payload."""
+    ref = drag_ref(md)
+    if ref is None:
+        return None
+    chunk = resolve(*ref[0]) if resolve is not None else None
+    if chunk is not None:
+        return chunk
+    data = ref[2] if ref[2] is not None else parse_drop(md)
+    try:
+        return chunk_from_drop(data) if data else None
+    except KeyError:
+        return None
+
+
+_IDLE = "border: 1px dashed #2a3a4a; padding: 10px; border-radius: 8px; color: #93a4b8;"
+_HOVER = "border: 2px solid #58a6ff; padding: 9px; border-radius: 8px; color: #d7e3f4;"
+
 
 class FieldDropZone(QLabel):
-    """Drop target nhận payload JSON (text/plain hoặc application/json) từ QWebEngineView."""
-    acceptRequested = pyqtSignal(object)  # emits DataChunk-like object (dict-like object)
+    """Drop target cho chunk kéo từ QWebEngineView; `resolve` tra (document id, chunk id) trong registry của Store."""
+    acceptRequested = pyqtSignal(object)  # emits the dropped chunk (ChunkRecord / DataChunk)
 
-    def __init__(self, field: str, parent: Optional[QWidget] = None):
+    def __init__(self, field: str, parent: Optional[QWidget] = None, resolve: Optional[Resolver] = None):
         super().__init__(parent)
         self.field = field
+        self.resolve = resolve
         self.setText("Drop here")
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setAcceptDrops(True)
-        self.setStyleSheet(
-            "border: 1px dashed #2a3a4a; padding: 10px; border-radius: 8px; color: #93a4b8;"
-        )
-
-    # ---- helpers ----
-    def _parse_mime(self, md: QMimeData) -> Optional[dict[str, Any]]:
-        # Prefer application/json if present
-        if md.hasFormat("application/json"):
-            try:
-                raw = md.data("application/json")
-                if hasattr(raw, "data"):
-                    raw = raw.data()
-                s = bytes(raw).decode("utf-8", errors="ignore")
-                return json.loads(s)
-            except Exception:
-                pass
-        # Fallback text/plain
-        if md.hasText():
-            try:
-                return json.loads(md.text())
-            except Exception:
-                pass
-        return None
+        self.setStyleSheet(_IDLE)
+
+    def _matches(self, md: QMimeData) -> bool:
+        ref = drag_ref(md)
+        return ref is not None and ref[1] == self.field
 
     # ---- DnD events ----
     def dragEnterEvent(self, e):
-        data = self._parse_mime(e.mimeData())
-        if data and data.get("field") == self.field:
-            self.setStyleSheet("border: 2px solid #58a6ff; padding: 9px; border-radius: 8px; color: #d7e3f4;")
+        if self._matches(e.mimeData()):
+            self.setStyleSheet(_HOVER)
             e.acceptProposedAction()
         else:
             e.ignore()
 
     def dragLeaveEvent(self, e):
-        self.setStyleSheet("border: 1px dashed #2a3a4a; padding: 10px; border-radius: 8px; color: #93a4b8;")
+        self.setStyleSheet(_IDLE)
+        end_drag()
 
     def dragMoveEvent(self, e):
-        data = self._parse_mime(e.mimeData())
-        if data and data.get("field") == self.field:
+        if self._matches(e.mimeData()):
             e.acceptProposedAction()
         else:
             e.ignore()
 
     def dropEvent(self, e):
-        self.setStyleSheet("border: 1px dashed #2a3a4a; padding: 10px; border-radius: 8px; color: #93a4b8;")
-        data = self._parse_mime(e.mimeData())
-        if not data or data.get("field") != self.field:
+        self.setStyleSheet(_IDLE)
+        md = e.mimeData()
+        chunk = chunk_for_drop(md, self.resolve) if self._matches(md) else None
+        end_drag()
+        if chunk is None:
             e.ignore()
             return
-        payload = {
-            "id": data["chunkId"],
-            "document_id": data["documentId"],
-            "source_id": data["sourceId"],
-            "field": data["field"],
-            "value": data["value"],
-            "offset_start": data.get("offsetStart", 0),
-            "offset_end": data.get("offsetEnd", 0),
-            "exclusive_group": data.get("exclusiveGroup") or None,
-        }
-        self.acceptRequested.emit(type("Obj", (), payload))
+        self.acceptRequested.emit(chunk)
         e.acceptProposedAction()